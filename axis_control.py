@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+axis_control.py – Y-Achsen-Steuerung für die Chart-Graphen
+• AxisController pro Graph: neues Ziel nur, wenn es sich um mehr als die
+  Hysterese (Anteil der aktuellen Spannweite) ändert
+• Laufende Übergänge werden umgelenkt (vom aktuellen Stand zum neuen Ziel),
+  nie gestapelt – keine Animation-Objekte pro Aufruf
+• Ein gemeinsamer Frame-Ticker für alle Controller: pro Frame werden alle
+  Achsen in einem Durchlauf gesetzt → höchstens ein Redraw je Graph und Frame
+  (Graph._trigger_plots fasst ymin + ymax zusammen); läuft nur, solange
+  etwas animiert
+© 2025 Dominik Rosenthal (Hackintosh1980)
+"""
+
+import weakref
+from typing import Optional, Tuple
+
+from kivy.clock import Clock
+
+HYSTERESIS = 0.08   # Anteil der Spannweite, unter dem ein neues Ziel ignoriert wird
+DURATION = 0.4      # s für einen Übergang (out_quad)
+
+
+def _out_quad(p: float) -> float:
+    return 1.0 - (1.0 - p) * (1.0 - p)
+
+
+# -------------------------------------------------------
+# ⏱ Gemeinsamer Frame-Ticker
+# -------------------------------------------------------
+class _AxisTicker:
+    def __init__(self):
+        self._active = set()
+        self._event = None
+
+    def add(self, ctl: "AxisController") -> None:
+        self._active.add(ctl)
+        if self._event is None:
+            self._event = Clock.schedule_interval(self._tick, 0)
+
+    def discard(self, ctl: "AxisController") -> None:
+        self._active.discard(ctl)
+
+    def _tick(self, dt: float):
+        for ctl in list(self._active):
+            if not ctl._step(dt):
+                self._active.discard(ctl)
+        if not self._active:
+            self._event = None
+            return False
+
+
+_ticker = _AxisTicker()
+
+
+# -------------------------------------------------------
+# 📏 Controller
+# -------------------------------------------------------
+class AxisController:
+    def __init__(self, graph, hysteresis: float = HYSTERESIS, duration: float = DURATION):
+        self._graph = weakref.ref(graph)
+        self.hysteresis = hysteresis
+        self.duration = max(1e-3, duration)
+        self.target: Optional[Tuple[float, float]] = None
+        self._from = (0.0, 1.0)
+        self._elapsed = 0.0
+
+    @property
+    def graph(self):
+        return self._graph()
+
+    def set_range(self, ymin: float, ymax: float, animate: bool = True) -> bool:
+        """Neues Ziel setzen; False, wenn es innerhalb der Hysterese lag."""
+        g = self.graph
+        if g is None:
+            return False
+        if self.target is not None:
+            lo, hi = self.target
+            tol = abs(hi - lo) * self.hysteresis
+            if abs(ymin - lo) <= tol and abs(ymax - hi) <= tol:
+                return False
+        self.target = (ymin, ymax)
+        if not animate:
+            _ticker.discard(self)
+            g.ymin, g.ymax = ymin, ymax
+            return True
+        # vom aktuellen (evtl. halb animierten) Stand aus umlenken
+        self._from = (g.ymin, g.ymax)
+        self._elapsed = 0.0
+        _ticker.add(self)
+        return True
+
+    def cancel(self) -> None:
+        _ticker.discard(self)
+
+    def _step(self, dt: float) -> bool:
+        g = self.graph
+        if g is None or self.target is None:
+            return False
+        self._elapsed += dt
+        p = min(1.0, self._elapsed / self.duration)
+        k = _out_quad(p)
+        (a0, a1), (b0, b1) = self._from, self.target
+        g.ymin, g.ymax = a0 + (b0 - a0) * k, a1 + (b1 - a1) * k
+        return p < 1.0
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ble_binary.py – kompaktes Binär-Snapshotformat (ble_scan.bin)
+• Fixes Layout: Header (Magic, Version, Generation, Anzahl) + N Geräte-Records
+• Rohwerte Q4.4 (int16) wie im Advertisement, keine String-Zahlen
+• Writer: tmp + fsync + rename (atomar); Reader: mmap + struct.unpack_from
+• JSON bleibt als Debug-/Kompatibilitätsformat bestehen
+© 2025 Dominik Rosenthal (Hackintosh1980)
+"""
+
+import os, mmap, struct, time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+BIN_NAME = "ble_scan.bin"
+MAGIC = b"VSB1"
+VERSION = 1
+
+# Header: magic, version, record_size, generation, count, reserved
+HEADER = struct.Struct("<4sHHQII")
+# Record: addr, addr_len, rssi, flags, type, t_int, h_int, t_ext, h_ext,
+#         packet_counter, (pad), timestamp_ms, name
+RECORD = struct.Struct("<16sBbBBhhhhHxxQ20s")
+
+FLAG_EXT_PRESENT = 0x01
+FLAG_ALIVE       = 0x02
+FLAG_ADDR_UUID   = 0x04
+
+TYPES = ("unknown", "sensor", "controller")
+
+
+def bin_path_for(json_path: str) -> str:
+    """Binär-Snapshot liegt neben ble_scan.json."""
+    return os.path.join(os.path.dirname(json_path), BIN_NAME)
+
+
+# -------------------------------------------------------
+# 🔢 Kodierung
+# -------------------------------------------------------
+def _q44(v: Any) -> int:
+    try:
+        raw = int(round(float(v) * 16.0))
+    except (TypeError, ValueError):
+        raw = -99 * 16
+    return max(-32768, min(32767, raw))
+
+
+def _pack_addr(addr: str) -> Tuple[bytes, int, bool]:
+    """MAC → 6 Bytes, macOS-UUID → 16 Bytes."""
+    hexs = (addr or "").replace(":", "").replace("-", "")
+    try:
+        raw = bytes.fromhex(hexs)
+    except ValueError:
+        raw = b""
+    if len(raw) == 6:
+        return raw, 6, False
+    if len(raw) == 16:
+        return raw, 16, True
+    return b"", 0, False
+
+
+def _unpack_addr(raw: bytes, n: int, is_uuid: bool) -> str:
+    b = raw[:n]
+    if is_uuid:
+        h = b.hex().upper()
+        return f"{h[0:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:32]}"
+    return ":".join(f"{x:02X}" for x in b)
+
+
+def pack_snapshot(entries: Iterable[Dict[str, Any]], generation: int) -> bytes:
+    records: List[bytes] = []
+    for e in entries:
+        addr, addr_len, is_uuid = _pack_addr(e.get("address") or e.get("mac") or "")
+        if not addr_len:
+            continue
+        flags = 0
+        if e.get("ext_present"):
+            flags |= FLAG_EXT_PRESENT
+        if e.get("alive", True):
+            flags |= FLAG_ALIVE
+        if is_uuid:
+            flags |= FLAG_ADDR_UUID
+        rssi = e.get("rssi", -99)
+        rssi = max(-128, min(127, int(rssi))) if isinstance(rssi, (int, float)) else -99
+        dtype = e.get("type", "unknown")
+        ts_ms = int(e.get("ts", time.time()) * 1000)
+        records.append(RECORD.pack(
+            addr, addr_len, rssi, flags,
+            TYPES.index(dtype) if dtype in TYPES else 0,
+            _q44(e.get("temperature_int")), _q44(e.get("humidity_int")),
+            _q44(e.get("temperature_ext")), _q44(e.get("humidity_ext")),
+            int(e.get("packet_counter") or 0) & 0xFFFF,
+            ts_ms,
+            str(e.get("name") or "").encode("utf-8")[:20],
+        ))
+    header = HEADER.pack(MAGIC, VERSION, RECORD.size, generation, len(records), 0)
+    return header + b"".join(records)
+
+
+def write_snapshot(path: str, entries: Iterable[Dict[str, Any]], generation: int) -> None:
+    """Atomar über ble_snapshot.write_atomic_bytes (tmp + fsync + rename)."""
+    import ble_snapshot   # hier importiert: ble_snapshot importiert ble_binary
+    ble_snapshot.write_atomic_bytes(path, pack_snapshot(entries, generation))
+
+
+# -------------------------------------------------------
+# 📖 mmap-Reader
+# -------------------------------------------------------
+def decode_records(buf, count: int, rec_size: int) -> List[Dict[str, Any]]:
+    out: List[Dict[str, Any]] = []
+    off = HEADER.size
+    for _ in range(count):
+        (addr, addr_len, rssi, flags, dtype, ti, hi, te, he,
+         pkt, ts_ms, name) = RECORD.unpack_from(buf, off)
+        off += rec_size
+        alive = bool(flags & FLAG_ALIVE)
+        out.append({
+            "address": _unpack_addr(addr, addr_len, bool(flags & FLAG_ADDR_UUID)),
+            "name": name.rstrip(b"\0").decode("utf-8", "replace") or "(unknown)",
+            "rssi": rssi,
+            "type": TYPES[dtype] if dtype < len(TYPES) else "unknown",
+            "temperature_int": ti / 16.0,
+            "humidity_int": hi / 16.0,
+            "temperature_ext": te / 16.0,
+            "humidity_ext": he / 16.0,
+            "packet_counter": pkt,
+            "ext_present": bool(flags & FLAG_EXT_PRESENT),
+            "alive": alive,
+            "status": "active" if alive else "stale",
+            "timestamp_ms": ts_ms,
+        })
+    return out
+
+
+class BinarySnapshotReader:
+    """
+    Hält ein mmap auf die aktuelle ble_scan.bin. Wird die Datei per Rename
+    ersetzt (neuer Inode), wird neu gemappt; sonst genügt ein Blick auf die
+    Generation im Header, um „nichts Neues“ zu erkennen.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._ino: Optional[int] = None
+        self._mm: Optional[mmap.mmap] = None
+        self._generation: Optional[int] = None
+        self._devices: List[Dict[str, Any]] = []
+
+    def _remap(self, st: os.stat_result) -> bool:
+        self.close()
+        if st.st_size < HEADER.size:
+            return False
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._ino = st.st_ino
+        return True
+
+    def read(self) -> Optional[Tuple[int, List[Dict[str, Any]]]]:
+        """→ (generation, devices) oder None, wenn nicht lesbar."""
+        try:
+            st = os.stat(self.path)
+            if st.st_ino != self._ino or self._mm is None:
+                if not self._remap(st):
+                    return None
+        except (OSError, ValueError):
+            self.close()
+            return None
+
+        mv = memoryview(self._mm)
+        try:
+            magic, version, rec_size, generation, count, _ = HEADER.unpack_from(mv, 0)
+            if magic != MAGIC or version != VERSION or rec_size < RECORD.size:
+                return None
+            if HEADER.size + count * rec_size > len(mv):
+                return None
+            if generation != self._generation:
+                self._devices = decode_records(mv, count, rec_size)
+                self._generation = generation
+            return generation, self._devices
+        finally:
+            mv.release()
+
+    def close(self) -> None:
+        if self._mm is not None:
+            try:
+                self._mm.close()
+            except Exception:
+                pass
+        self._mm = None
+        self._ino = None
+        self._generation = None
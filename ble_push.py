@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ble_push.py – Loopback-Push vom Desktop-Scanner ins Dashboard (Unix-Socket)
+• Publisher (scan.py): NDJSON-Zeilen an alle verbundenen Clients
+• Backpressure: pro Client und Gerät begrenzte Queue, älteste Samples fliegen raus
+• Subscriber (Dashboard): nicht-blockierend, poll() aus dem Kivy-Clock,
+  automatischer Reconnect mit Backoff; ohne Socket bleibt der Datei-Pfad aktiv
+© 2025 Dominik Rosenthal (Hackintosh1980)
+"""
+
+import os, json, time, socket, threading
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, List, Optional
+
+SOCK_NAME = "ble_push.sock"
+MAX_PENDING_PER_DEVICE = 8
+RECONNECT_MIN = 0.5
+RECONNECT_MAX = 5.0
+
+
+def sock_path_for(json_path: str) -> str:
+    """Socket liegt im selben Verzeichnis wie ble_scan.json."""
+    return os.path.join(os.path.dirname(json_path), SOCK_NAME)
+
+
+def available() -> bool:
+    return hasattr(socket, "AF_UNIX")
+
+
+# -------------------------------------------------------
+# 📤 Publisher (Scanner-Seite)
+# -------------------------------------------------------
+class _Client(threading.Thread):
+    """Sender-Thread pro Verbindung mit drop-oldest-Queue pro Gerät."""
+
+    def __init__(self, conn: socket.socket, max_pending: int, on_close):
+        super().__init__(daemon=True, name="BlePushClient")
+        self.conn = conn
+        self.max_pending = max_pending
+        self.on_close = on_close
+        self.cond = threading.Condition()
+        self.pending: "OrderedDict[str, Deque[bytes]]" = OrderedDict()
+        self.dropped = 0
+        self.alive = True
+
+    def enqueue(self, device: str, line: bytes) -> None:
+        with self.cond:
+            q = self.pending.get(device)
+            if q is None:
+                q = self.pending[device] = deque(maxlen=self.max_pending)
+            if len(q) == q.maxlen:
+                self.dropped += 1
+            q.append(line)
+            self.cond.notify()
+
+    def _take_all(self) -> List[bytes]:
+        with self.cond:
+            while self.alive and not any(self.pending.values()):
+                self.cond.wait(1.0)
+            out: List[bytes] = []
+            for q in self.pending.values():
+                out.extend(q)
+                q.clear()
+            return out
+
+    def run(self) -> None:
+        try:
+            while self.alive:
+                batch = self._take_all()
+                if batch:
+                    self.conn.sendall(b"".join(batch))
+        except OSError:
+            pass
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        with self.cond:
+            if not self.alive and self.conn is None:
+                return
+            self.alive = False
+            self.cond.notify_all()
+        try:
+            if self.conn is not None:
+                self.conn.close()
+        except OSError:
+            pass
+        self.conn = None
+        self.on_close(self)
+
+
+class SamplePublisher:
+    """Unix-Socket-Server; publish() ist aus jedem Thread aufrufbar."""
+
+    def __init__(self, path: str, max_pending_per_device: int = MAX_PENDING_PER_DEVICE):
+        self.path = path
+        self.max_pending = int(max_pending_per_device)
+        self._lock = threading.Lock()
+        self._clients: List[_Client] = []
+        self._server: Optional[socket.socket] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> bool:
+        if self._server is not None:
+            return True
+        if not available():
+            return False
+        try:
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+            srv = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            srv.bind(self.path)
+            srv.listen(4)
+            srv.settimeout(1.0)
+        except OSError as e:
+            print("⚠️ Push-Socket nicht verfügbar:", e)
+            return False
+        self._server = srv
+        self._thread = threading.Thread(target=self._accept_loop, daemon=True, name="BlePushAccept")
+        self._thread.start()
+        return True
+
+    def _accept_loop(self) -> None:
+        srv = self._server
+        while self._server is srv:
+            try:
+                conn, _ = srv.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            conn.settimeout(5.0)
+            client = _Client(conn, self.max_pending, self._remove)
+            with self._lock:
+                self._clients.append(client)
+            client.start()
+
+    def _remove(self, client: _Client) -> None:
+        with self._lock:
+            if client in self._clients:
+                self._clients.remove(client)
+
+    def publish(self, sample: Dict[str, Any]) -> None:
+        with self._lock:
+            clients = list(self._clients)
+        if not clients:
+            return
+        device = str(sample.get("address") or sample.get("mac") or "")
+        line = json.dumps(sample, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+        for c in clients:
+            c.enqueue(device, line)
+
+    def stop(self) -> None:
+        srv, self._server = self._server, None
+        if srv is not None:
+            try:
+                srv.close()
+            except OSError:
+                pass
+        with self._lock:
+            clients = list(self._clients)
+        for c in clients:
+            c.close()
+        try:
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+        except OSError:
+            pass
+
+
+# -------------------------------------------------------
+# 📥 Subscriber (Dashboard-Seite)
+# -------------------------------------------------------
+class PushSubscriber:
+    """
+    Nicht-blockierender Client. poll() liefert alle seit dem letzten Aufruf
+    eingetroffenen Samples und kümmert sich selbst um (Re-)Connects.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._sock: Optional[socket.socket] = None
+        self._buf = b""
+        self._retry_at = 0.0
+        self._backoff = RECONNECT_MIN
+
+    @property
+    def connected(self) -> bool:
+        return self._sock is not None
+
+    def _connect(self) -> None:
+        now = time.monotonic()
+        if now < self._retry_at:
+            return
+        if not os.path.exists(self.path):
+            # kein Publisher: Datei-Fallback, nächster Versuch erst nach Backoff
+            self._defer(now)
+            return
+        s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            s.connect(self.path)
+            s.setblocking(False)
+        except OSError:
+            s.close()
+            self._defer(now)
+            return
+        self._sock, self._buf = s, b""
+        self._backoff = RECONNECT_MIN
+        print(f"🔌 Push-Kanal verbunden: {self.path}")
+
+    def _defer(self, now: float) -> None:
+        self._retry_at = now + self._backoff
+        self._backoff = min(self._backoff * 2.0, RECONNECT_MAX)
+
+    def _disconnect(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            print("🔌 Push-Kanal getrennt – Datei-Fallback aktiv")
+        self._sock = None
+        self._buf = b""
+        self._retry_at = time.monotonic() + self._backoff
+
+    def poll(self) -> List[Dict[str, Any]]:
+        if self._sock is None:
+            self._connect()
+            if self._sock is None:
+                return []
+        chunks = []
+        while True:
+            try:
+                data = self._sock.recv(65536)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                self._disconnect()
+                break
+            if not data:
+                self._disconnect()
+                break
+            chunks.append(data)
+        if not chunks:
+            return []
+
+        buf = self._buf + b"".join(chunks)
+        end = buf.rfind(b"\n")
+        if end < 0:
+            self._buf = buf
+            return []
+        self._buf = buf[end + 1:]
+        out: List[Dict[str, Any]] = []
+        for line in buf[:end].split(b"\n"):
+            if not line:
+                continue
+            try:
+                obj = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(obj, dict):
+                out.append(obj)
+        return out
+
+    def close(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+        self._sock = None
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ble_shm.py – Shared-Memory-Ringpuffer für Samples (Desktop, gleicher Host)
+• multiprocessing.shared_memory, ein Producer (scan.py Store), ein Consumer
+• Feste Slot-Records, Sequenzzähler im Header + pro Slot (Seqlock-Prinzip)
+• drain() ohne Syscalls: nur memoryview + struct; Überläufe werden gezählt
+• Epoch im Header → Reader erkennt einen neu gestarteten Scanner
+© 2025 Dominik Rosenthal (Hackintosh1980)
+"""
+
+import os, time, struct
+from typing import Any, Dict, List, Optional
+
+try:
+    from multiprocessing import shared_memory, resource_tracker
+except ImportError:          # z. B. Android-Build ohne _posixshmem
+    shared_memory = None
+    resource_tracker = None
+
+RING_NAME = "vivosun_ble_ring"
+CAPACITY = 4096
+MAGIC = b"VSR1"
+VERSION = 1
+
+# Header: magic, version, slot_size, capacity, epoch, write_seq
+HEADER = struct.Struct("<4sHHIQQ")
+HEADER_SIZE = 64
+WRITE_SEQ_OFF = 4 + 2 + 2 + 4 + 8
+SEQ = struct.Struct("<Q")
+# Slot: seq, addr, addr_len, rssi, flags, t_int, h_int, t_ext, h_ext, pkt, ts
+SLOT = struct.Struct("<Q16sBbBxffffHxxd")
+PAYLOAD = struct.Struct("<16sBbBxffffHxxd")
+
+FLAG_EXT_PRESENT = 0x01
+FLAG_ALIVE       = 0x02
+FLAG_ADDR_UUID   = 0x04
+
+
+def available() -> bool:
+    return shared_memory is not None
+
+
+def _pack_addr(addr: str):
+    hexs = (addr or "").replace(":", "").replace("-", "")
+    try:
+        raw = bytes.fromhex(hexs)
+    except ValueError:
+        raw = b""
+    if len(raw) in (6, 16):
+        return raw, len(raw), len(raw) == 16
+    # Fallback: Kennung als Text (max. 16 Bytes)
+    raw = (addr or "").encode("utf-8")[:16]
+    return raw, len(raw) | 0x80, False
+
+
+def _unpack_addr(raw: bytes, n: int, is_uuid: bool) -> str:
+    if n & 0x80:
+        return raw[:n & 0x7F].decode("utf-8", "replace")
+    b = raw[:n]
+    if is_uuid:
+        h = b.hex().upper()
+        return f"{h[0:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:32]}"
+    return ":".join(f"{x:02X}" for x in b)
+
+
+# -------------------------------------------------------
+# 🔁 Ring
+# -------------------------------------------------------
+class SampleRing:
+    """Single-Producer/Single-Consumer-Ring fester Records im Shared Memory."""
+
+    def __init__(self, shm, owner: bool):
+        self.shm = shm
+        self.owner = owner
+        self.buf = shm.buf
+        magic, version, slot_size, capacity, epoch, _ = HEADER.unpack_from(self.buf, 0)
+        if magic != MAGIC or version != VERSION or slot_size != SLOT.size:
+            raise ValueError("unbekanntes Ringformat")
+        self.capacity = capacity
+        self.epoch = epoch
+        self.read_seq = self._write_seq()
+        self.lost = 0
+
+    # ---------- Lebenszyklus ----------
+    @classmethod
+    def create(cls, name: str = RING_NAME, capacity: int = CAPACITY) -> "SampleRing":
+        size = HEADER_SIZE + capacity * SLOT.size
+        try:
+            shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            # Überbleibsel eines abgestürzten Scanners entsorgen
+            old = shared_memory.SharedMemory(name=name)
+            old.close()
+            old.unlink()
+            shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        shm.buf[:size] = bytes(size)
+        epoch = time.time_ns() ^ os.getpid()
+        HEADER.pack_into(shm.buf, 0, MAGIC, VERSION, SLOT.size, capacity, epoch, 0)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str = RING_NAME) -> "SampleRing":
+        try:
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # Python < 3.13: Resource-Tracker würde das Segment beim Beenden löschen
+            shm = shared_memory.SharedMemory(name=name)
+            try:
+                resource_tracker.unregister(shm._name, "shared_memory")
+            except Exception:
+                pass
+        return cls(shm, owner=False)
+
+    def close(self) -> None:
+        self.buf = None
+        try:
+            self.shm.close()
+            if self.owner:
+                self.shm.unlink()
+        except Exception:
+            pass
+
+    # ---------- Producer ----------
+    def _write_seq(self) -> int:
+        return SEQ.unpack_from(self.buf, WRITE_SEQ_OFF)[0]
+
+    def write(self, sample: Dict[str, Any]) -> None:
+        seq = self._write_seq() + 1
+        off = HEADER_SIZE + ((seq - 1) % self.capacity) * SLOT.size
+        addr, addr_len, is_uuid = _pack_addr(sample.get("address") or sample.get("mac") or "")
+        flags = (FLAG_EXT_PRESENT if sample.get("ext_present") else 0) \
+            | (FLAG_ALIVE if sample.get("alive", True) else 0) \
+            | (FLAG_ADDR_UUID if is_uuid else 0)
+        rssi = sample.get("rssi", -99)
+        rssi = max(-128, min(127, int(rssi))) if isinstance(rssi, (int, float)) else -99
+
+        SEQ.pack_into(self.buf, off, 0)                      # Slot „in Arbeit“
+        PAYLOAD.pack_into(
+            self.buf, off + SEQ.size, addr, addr_len, rssi, flags,
+            float(sample.get("temperature_int", -99.0)), float(sample.get("humidity_int", -99.0)),
+            float(sample.get("temperature_ext", -99.0)), float(sample.get("humidity_ext", -99.0)),
+            int(sample.get("packet_counter") or 0) & 0xFFFF,
+            float(sample.get("ts") or time.time()),
+        )
+        SEQ.pack_into(self.buf, off, seq)                    # Slot fertig
+        SEQ.pack_into(self.buf, WRITE_SEQ_OFF, seq)          # veröffentlichen
+
+    # ---------- Consumer ----------
+    def drain(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Alle neuen Samples seit dem letzten Aufruf; Überläufe → self.lost."""
+        ws = self._write_seq()
+        if ws < self.read_seq:                 # Producer neu gestartet
+            self.read_seq = 0
+        behind = ws - self.read_seq
+        if behind > self.capacity:
+            self.lost += behind - self.capacity
+            self.read_seq = ws - self.capacity
+        if limit is not None and ws - self.read_seq > limit:
+            self.read_seq = ws - limit
+
+        out: List[Dict[str, Any]] = []
+        buf = self.buf
+        for seq in range(self.read_seq + 1, ws + 1):
+            off = HEADER_SIZE + ((seq - 1) % self.capacity) * SLOT.size
+            (s1, addr, addr_len, rssi, flags, ti, hi, te, he, pkt, ts) = SLOT.unpack_from(buf, off)
+            if s1 != seq or SEQ.unpack_from(buf, off)[0] != seq:
+                self.lost += 1                 # währenddessen überschrieben
+                continue
+            alive = bool(flags & FLAG_ALIVE)
+            out.append({
+                "address": _unpack_addr(addr, addr_len, bool(flags & FLAG_ADDR_UUID)),
+                "rssi": rssi,
+                "temperature_int": ti,
+                "humidity_int": hi,
+                "temperature_ext": te,
+                "humidity_ext": he,
+                "packet_counter": pkt,
+                "ext_present": bool(flags & FLAG_EXT_PRESENT),
+                "alive": alive,
+                "status": "active" if alive else "stale",
+                "ts": ts,
+            })
+        self.read_seq = ws
+        return out
+
+
+# -------------------------------------------------------
+# 📥 Subscriber (gleiche Schnittstelle wie ble_push.PushSubscriber)
+# -------------------------------------------------------
+class RingSubscriber:
+    """
+    Hängt sich an den Ring des Scanners; ohne neue Daten wird alle
+    `recheck` Sekunden geprüft, ob ein neuer Scanner (andere Epoch) läuft.
+    Als „verbunden“ gilt der Ring, solange innerhalb von `idle` Sekunden
+    Samples kamen – danach übernimmt wieder der Datei-Pfad.
+    """
+
+    def __init__(self, name: str = RING_NAME, recheck: float = 2.0, idle: float = 15.0):
+        self.name = name
+        self.recheck = float(recheck)
+        self.idle = float(idle)
+        self.ring: Optional[SampleRing] = None
+        self._last_data = 0.0
+        self._last_check = 0.0
+
+    @property
+    def connected(self) -> bool:
+        return self.ring is not None and (time.monotonic() - self._last_data) < self.idle
+
+    def _try_attach(self) -> None:
+        try:
+            ring = SampleRing.attach(self.name)
+        except (FileNotFoundError, ValueError, OSError):
+            return
+        if self.ring is not None and ring.epoch == self.ring.epoch:
+            ring.close()
+            return
+        if self.ring is not None:
+            self.ring.close()
+        self.ring = ring
+        print(f"🔗 Shared-Memory-Ring verbunden: {self.name}")
+
+    def poll(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        now = time.monotonic()
+        samples = self.ring.drain(limit) if self.ring is not None else []
+        if samples:
+            self._last_data = now
+        elif now - self._last_check >= self.recheck:
+            self._last_check = now
+            self._try_attach()
+        return samples
+
+    def close(self) -> None:
+        if self.ring is not None:
+            self.ring.close()
+        self.ring = None
+
+
+class FallbackSubscriber:
+    """
+    auto-Modus: bevorzugt den Ring; solange er fehlt oder keine Daten mehr
+    liefert (nicht `connected`), übernimmt `fallback` (z. B. PushSubscriber).
+    Sobald der Ring wieder Samples bringt, wird der Fallback getrennt.
+    """
+
+    def __init__(self, primary: RingSubscriber, fallback):
+        self.primary = primary
+        self.fallback = fallback
+
+    @property
+    def connected(self) -> bool:
+        return self.primary.connected or self.fallback.connected
+
+    def poll(self) -> List[Dict[str, Any]]:
+        samples = self.primary.poll()
+        if self.primary.connected:
+            if self.fallback.connected:
+                self.fallback.close()
+                print("🔗 Ring aktiv – Push-Fallback getrennt")
+            return samples
+        return samples + self.fallback.poll()
+
+    def close(self) -> None:
+        self.primary.close()
+        self.fallback.close()
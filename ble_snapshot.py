@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ble_snapshot.py – gemeinsamer Snapshot-Reader für ble_scan.json
+• Ein Reader pro Datei und Prozess (get_reader)
+• stat() (Inode/Größe/mtime) pro Zugriff, json.loads nur bei Änderung
+• Alle Konsumenten bekommen dasselbe, unveränderliche Snapshot-Objekt
+• Geräte werden einmal pro Stand normalisiert (MAC groß, address/mac,
+  packet_counter/pkt/counter) und über by_mac in O(1) nachgeschlagen
+• Generation-Sidecar ble_scan.gen (von den Writern, nur bei neuen Daten
+  hochgezählt): gleiche Generation → kein Parsen, derselbe Snapshot
+• Liegt eine aktuelle ble_scan.bin daneben, wird diese per mmap gelesen
+  (kein String-Parsing); JSON bleibt Fallback/Debug-Format
+• write_atomic()/write_atomic_bytes(): einziger Schreibweg für Python-Writer
+  (tmp + fsync + rename; auch ble_scan.bin, Stream-Offset, config.json);
+  Reader versucht einen zerrissenen/leeren Lesevorgang genau einmal erneut
+• Kein Kivy-Import → auch vom Desktop-Scanner nutzbar
+© 2025 Dominik Rosenthal (Hackintosh1980)
+"""
+
+import os, json, time, threading
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple
+
+import ble_binary
+
+GEN_NAME = "ble_scan.gen"
+TORN_RETRY_DELAY = 0.005     # Pause vor dem einen Wiederholungsversuch
+
+
+def gen_path_for(json_path: str) -> str:
+    """Generation-Sidecar liegt neben ble_scan.json."""
+    return os.path.join(os.path.dirname(json_path), GEN_NAME)
+
+
+# -------------------------------------------------------
+# ✍️ Atomares Schreiben
+# -------------------------------------------------------
+def write_atomic_bytes(path: str, data: bytes, fsync: bool = True) -> None:
+    """
+    tmp im selben Verzeichnis schreiben (Name pro PID → parallele Writer
+    kommen sich nicht in die Quere), fsync, rename → Leser sehen immer
+    entweder die alte oder die neue, vollständige Datei. Ein Reader im
+    selben Prozess wird danach invalidiert. fsync=False für Dateien, deren
+    Verlust nach einem Absturz unkritisch ist (z. B. Stream-Offset).
+    """
+    folder = os.path.dirname(path) or "."
+    os.makedirs(folder, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    reader = _readers.get(os.path.abspath(path))
+    if reader is not None:
+        reader.invalidate()
+
+
+def write_atomic(path: str, text: str) -> None:
+    write_atomic_bytes(path, text.encode("utf-8"))
+
+
+def write_json_atomic(path: str, data: Any, **kw) -> None:
+    write_atomic(path, json.dumps(data, ensure_ascii=False, **kw))
+
+
+def write_generation(path: str, generation: int) -> None:
+    """Writer-Seite: Generation als ASCII-Zahl, atomar."""
+    write_atomic(path, f"{int(generation)}\n")
+
+
+# -------------------------------------------------------
+# 📦 Snapshot (immutable)
+# -------------------------------------------------------
+class Snapshot(NamedTuple):
+    """Ein geparster Stand von ble_scan.json – read-only für alle Konsumenten."""
+    devices: Tuple[Mapping[str, Any], ...]
+    by_mac: Mapping[str, Mapping[str, Any]]    # normalisierte MAC → Gerät
+    stat_key: Optional[Tuple[int, int, int]]   # (inode, size, mtime_ns)
+    loaded_at: float
+    exists: bool
+    has_content: bool
+
+    @property
+    def first(self) -> Optional[Mapping[str, Any]]:
+        return self.devices[0] if self.devices else None
+
+    def device(self, mac: Optional[str]) -> Optional[Mapping[str, Any]]:
+        """Gerät zur MAC (Groß-/Kleinschreibung egal) oder None."""
+        if not mac:
+            return None
+        return self.by_mac.get(normalize_mac(mac))
+
+
+_NO_DEVICES: Mapping[str, Mapping[str, Any]] = MappingProxyType({})
+EMPTY = Snapshot(devices=(), by_mac=_NO_DEVICES, stat_key=None, loaded_at=0.0,
+                 exists=False, has_content=False)
+
+
+def _stat_key(st: os.stat_result) -> Tuple[int, int, int]:
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def normalize_mac(mac: Any) -> str:
+    return str(mac or "").strip().upper()
+
+
+def _normalize(d: Dict[str, Any]) -> Dict[str, Any]:
+    """address/mac und packet_counter/pkt/counter auf je einen Schlüssel auflösen."""
+    mac = normalize_mac(d.get("address") or d.get("mac"))
+    pkt = d.get("packet_counter")
+    if pkt is None:
+        pkt = d.get("pkt")
+    if pkt is None:
+        pkt = d.get("counter")
+    n = dict(d)
+    n["address"] = n["mac"] = mac
+    n["packet_counter"] = pkt
+    return n
+
+
+def _freeze(data: Any) -> Tuple[Tuple[Mapping[str, Any], ...], Mapping[str, Mapping[str, Any]]]:
+    """→ (Geräte in Originalreihenfolge, MAC-Tabelle); erster Eintrag je MAC gewinnt."""
+    if not isinstance(data, list):
+        return (), _NO_DEVICES
+    devices = tuple(MappingProxyType(_normalize(d)) for d in data if isinstance(d, dict))
+    table: Dict[str, Mapping[str, Any]] = {}
+    for d in devices:
+        if d["address"]:
+            table.setdefault(d["address"], d)
+    return devices, MappingProxyType(table)
+
+
+# -------------------------------------------------------
+# 🔍 Reader
+# -------------------------------------------------------
+class SnapshotReader:
+    """
+    Liest ble_scan.json nur dann neu, wenn sich Inode, Größe oder mtime
+    geändert haben und – falls ein Generation-Sidecar existiert – dessen
+    Generation nicht mehr zum aktuellen Snapshot passt. Ein JSONDecodeError
+    (halb geschriebene Datei) liefert den letzten gültigen Snapshot und
+    merkt sich den stat-Key nicht, damit der nächste Zugriff erneut parst.
+    Wer die Datei selbst leert/überschreibt, ruft danach invalidate().
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._snap: Snapshot = EMPTY
+        self._binary = ble_binary.BinarySnapshotReader(ble_binary.bin_path_for(path))
+        self._gen_path = gen_path_for(path)
+        self._gen_key: Optional[Tuple[int, int, int]] = None
+        self._gen: Optional[int] = None         # zuletzt gelesene Sidecar-Generation
+        self._snap_gen: Optional[int] = None    # Generation des aktuellen Snapshots
+        self._seen: Optional[Tuple[Any, Any]] = None
+        self.parse_count = 0
+        self.skip_count = 0
+        self.torn_count = 0
+
+    def _read_generation(self) -> Optional[int]:
+        """stat() auf das Sidecar; gelesen (wenige Bytes) nur bei Änderung."""
+        try:
+            st = os.stat(self._gen_path)
+        except OSError:
+            self._gen_key = self._gen = None
+            return None
+        key = _stat_key(st)
+        if key != self._gen_key:
+            try:
+                with open(self._gen_path, "rb") as f:
+                    self._gen = int(f.read(32).strip() or b"-1")
+                self._gen_key = key
+            except (OSError, ValueError):
+                self._gen_key = self._gen = None
+        return self._gen
+
+    def _get_binary(self, st: os.stat_result) -> Optional[Snapshot]:
+        """Binär-Snapshot, falls vorhanden und nicht älter als die JSON."""
+        try:
+            if os.stat(self._binary.path).st_mtime_ns < st.st_mtime_ns:
+                return None
+        except OSError:
+            return None
+        res = self._binary.read()
+        if res is None:
+            return None
+        generation, devices = res
+        key = (st.st_ino, -1, generation)
+        if key != self._snap.stat_key:
+            self._snap = Snapshot(*_freeze(devices), key, time.time(), True, True)
+        return self._snap
+
+    def get(self) -> Snapshot:
+        with self._lock:
+            try:
+                st = os.stat(self.path)
+            except OSError:
+                if self._snap.exists:
+                    self._snap = EMPTY
+                    self._snap_gen = self._seen = None
+                return self._snap
+
+            key = _stat_key(st)
+            if key == self._snap.stat_key:
+                return self._snap
+
+            # Generation unverändert → gleicher Inhalt, kein Parsen
+            gen = self._read_generation()
+            if (key, gen) == self._seen:
+                return self._snap
+            if gen is not None and gen == self._snap_gen and self._snap.has_content:
+                self._seen = (key, gen)
+                self.skip_count += 1
+                return self._snap
+            self._seen = None
+
+            snap = self._get_binary(st)
+            if snap is not None:
+                self._snap_gen = gen
+                return snap
+
+            key, raw, data = self._read_json(key)
+            if raw is None:
+                return self._snap
+
+            if not raw:
+                self._snap = Snapshot((), _NO_DEVICES, key, time.time(), True, False)
+                return self._snap
+
+            if data is None:
+                return self._snap
+            self.parse_count += 1
+
+            self._snap = Snapshot(*_freeze(data), key, time.time(), True, True)
+            self._snap_gen = gen
+            return self._snap
+
+    def _read_json(self, key):
+        """
+        → (stat_key, raw, data). Leerer oder nicht parsebarer Inhalt gilt als
+        zerrissener Lesevorgang (Writer mitten im Schreiben) und wird nach
+        kurzer Pause genau einmal wiederholt.
+        """
+        raw, data = None, None
+        for attempt in (0, 1):
+            if attempt:
+                time.sleep(TORN_RETRY_DELAY)
+                try:
+                    key = _stat_key(os.stat(self.path))
+                except OSError:
+                    break
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    raw = f.read().strip()
+            except OSError:
+                break
+            if raw:
+                try:
+                    data = json.loads(raw)
+                    break
+                except json.JSONDecodeError:
+                    data = None
+            if attempt:
+                self.torn_count += 1
+        return key, raw, data
+
+    def invalidate(self) -> None:
+        """Erzwingt beim nächsten get() ein erneutes Lesen."""
+        with self._lock:
+            self._snap = self._snap._replace(stat_key=None)
+            self._snap_gen = self._seen = None
+
+
+# -------------------------------------------------------
+# 🌍 Prozessweite Registry
+# -------------------------------------------------------
+_readers: Dict[str, SnapshotReader] = {}
+_readers_lock = threading.Lock()
+
+
+def get_reader(path: str) -> SnapshotReader:
+    """Liefert den (einzigen) SnapshotReader für diesen Pfad."""
+    key = os.path.abspath(path)
+    with _readers_lock:
+        reader = _readers.get(key)
+        if reader is None:
+            reader = _readers[key] = SnapshotReader(key)
+        return reader
+
+
+def get_snapshot(path: str) -> Snapshot:
+    return get_reader(path).get()
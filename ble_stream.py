@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ble_stream.py – Append-only NDJSON-Samplestream neben ble_scan.json
+• Writer: eine Zeile pro dekodiertem Advertisement, Rotation nach Größe (→ .1)
+• Tailer: liest ab Byte-Offset nur neue, vollständige Zeilen (O(neue Bytes))
+• Offset + Inode werden in <stream>.offset persistiert
+© 2025 Dominik Rosenthal (Hackintosh1980)
+"""
+
+import os, json, time, threading
+from typing import Any, Dict, List, Optional
+
+import ble_snapshot
+
+STREAM_NAME = "ble_stream.ndjson"
+MAX_BYTES = 1024 * 1024          # Rotation nach 1 MiB
+MAX_READ = 256 * 1024            # max. Bytes pro Tick (Backlog-Schutz)
+
+
+def stream_path_for(json_path: str) -> str:
+    """Stream liegt im selben Verzeichnis wie ble_scan.json."""
+    return os.path.join(os.path.dirname(json_path), STREAM_NAME)
+
+
+# -------------------------------------------------------
+# ✍️ Writer (Scanner-Seite)
+# -------------------------------------------------------
+class SampleStreamWriter:
+    """Thread-sicherer NDJSON-Appender mit Größen-Rotation."""
+
+    def __init__(self, path: str, max_bytes: int = MAX_BYTES):
+        self.path = path
+        self.max_bytes = int(max_bytes)
+        self._lock = threading.Lock()
+        self._f = None
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._f = open(self.path, "ab")
+
+    def append(self, sample: Dict[str, Any]) -> None:
+        line = json.dumps(sample, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+        with self._lock:
+            try:
+                if self._f is None:
+                    self._open()
+                self._f.write(line)
+                self._f.flush()
+                if self._f.tell() >= self.max_bytes:
+                    self._rotate()
+            except OSError as e:
+                print("⚠️ Stream-Write-Fehler:", e)
+                self._close()
+
+    def _rotate(self) -> None:
+        self._close()
+        os.replace(self.path, self.path + ".1")
+        self._open()
+
+    def _close(self) -> None:
+        try:
+            if self._f:
+                self._f.close()
+        except OSError:
+            pass
+        self._f = None
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+
+# -------------------------------------------------------
+# 📖 Tailer (Dashboard-Seite)
+# -------------------------------------------------------
+class StreamTailer:
+    """
+    Liefert jedes Sample genau einmal und in Reihenfolge. Unvollständige
+    letzte Zeilen bleiben liegen, bis der Writer sie abgeschlossen hat.
+    Nach einer Rotation wird der Rest der alten Datei (.1) zuerst gelesen.
+    """
+
+    def __init__(self, path: str, offset_path: Optional[str] = None):
+        self.path = path
+        self.offset_path = offset_path or (path + ".offset")
+        self.ino: Optional[int] = None
+        self.offset = 0
+        self._saved = (None, 0)
+        self._load_offset()
+
+    def is_fresh(self, max_age: float) -> bool:
+        """Stream existiert und wurde in den letzten max_age Sekunden beschrieben."""
+        try:
+            return (time.time() - os.stat(self.path).st_mtime) <= max_age
+        except OSError:
+            return False
+
+    # ---------- Offset-Persistenz ----------
+    def _load_offset(self) -> None:
+        try:
+            with open(self.offset_path, "r", encoding="utf-8") as f:
+                st = json.load(f)
+            self.ino, self.offset = st.get("ino"), int(st.get("offset", 0))
+        except (OSError, ValueError):
+            # Erststart: am Dateiende beginnen, keine Historie nachspielen
+            try:
+                st = os.stat(self.path)
+                self.ino, self.offset = st.st_ino, st.st_size
+            except OSError:
+                self.ino, self.offset = None, 0
+        self._saved = (self.ino, self.offset)
+
+    def _save_offset(self) -> None:
+        state = (self.ino, self.offset)
+        if state == self._saved:
+            return
+        try:
+            # ohne fsync: ein verlorener Offset liest nur Zeilen erneut
+            ble_snapshot.write_atomic_bytes(
+                self.offset_path,
+                json.dumps({"ino": self.ino, "offset": self.offset}).encode("utf-8"),
+                fsync=False)
+            self._saved = state
+        except OSError as e:
+            print("⚠️ Stream-Offset nicht gespeichert:", e)
+
+    # ---------- Lesen ----------
+    @staticmethod
+    def _read_lines(path: str, offset: int, limit: int):
+        """Liest vollständige Zeilen ab offset → (samples, neuer offset)."""
+        with open(path, "rb") as f:
+            f.seek(offset)
+            chunk = f.read(limit)
+        end = chunk.rfind(b"\n")
+        if end < 0:
+            return [], offset
+        out: List[Dict[str, Any]] = []
+        for line in chunk[:end].split(b"\n"):
+            if not line:
+                continue
+            try:
+                obj = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(obj, dict):
+                out.append(obj)
+        return out, offset + end + 1
+
+    def read_new(self) -> List[Dict[str, Any]]:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return []
+
+        samples: List[Dict[str, Any]] = []
+        if st.st_ino != self.ino:
+            # Rotation: Rest der alten Datei nachlesen, falls es noch dieselbe ist
+            rotated = self.path + ".1"
+            try:
+                if self.ino is not None and os.stat(rotated).st_ino == self.ino:
+                    samples, _ = self._read_lines(rotated, self.offset, MAX_READ)
+            except OSError:
+                pass
+            self.ino, self.offset = st.st_ino, 0
+        elif st.st_size < self.offset:
+            self.offset = 0   # abgeschnitten/neu angelegt
+
+        if st.st_size > self.offset:
+            try:
+                new, self.offset = self._read_lines(self.path, self.offset, MAX_READ)
+                samples.extend(new)
+            except OSError:
+                pass
+
+        self._save_offset()
+        return samples
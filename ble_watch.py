@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ble_watch.py – inotify-Watcher für ble_scan.json (Linux)
+• Beobachtet das Bridge-Verzeichnis auf IN_MOVED_TO / IN_CLOSE_WRITE
+• Ruft den Callback nur bei echten Writes der Zieldatei auf
+• ctypes + libc, keine Zusatzpakete; ohne inotify → available() == False
+© 2025 Dominik Rosenthal (Hackintosh1980)
+"""
+
+import os, sys, struct, select, threading, ctypes, ctypes.util
+from typing import Callable, Optional
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO    = 0x00000080
+IN_NONBLOCK    = 0o4000
+IN_CLOEXEC     = 0o2000000
+
+_EVENT_HDR = struct.Struct("iIII")   # wd, mask, cookie, len
+
+_libc = None
+
+
+def _load_libc():
+    global _libc
+    if _libc is None:
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            lib = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            lib.inotify_init1.argtypes = [ctypes.c_int]
+            lib.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+            _libc = lib
+        except (OSError, AttributeError):
+            return None
+    return _libc
+
+
+def available() -> bool:
+    return _load_libc() is not None
+
+
+# -------------------------------------------------------
+# 👀 Watcher-Thread
+# -------------------------------------------------------
+class FileWatcher(threading.Thread):
+    """
+    Weckt `callback()` (im Watcher-Thread!), sobald `path` per Rename
+    ersetzt oder nach dem Schreiben geschlossen wurde. Der Aufrufer ist
+    für die Übergabe an den UI-Thread zuständig (z. B. Clock-Trigger).
+    """
+
+    def __init__(self, path: str, callback: Callable[[], None]):
+        super().__init__(daemon=True, name="BleFileWatcher")
+        self.path = os.path.abspath(path)
+        self.callback = callback
+        self._fd: Optional[int] = None
+        self._stop_evt = threading.Event()
+        self._name = os.path.basename(self.path).encode()
+        self.event_count = 0
+
+    def start(self) -> bool:
+        libc = _load_libc()
+        if libc is None:
+            return False
+        directory = os.path.dirname(self.path)
+        if not os.path.isdir(directory):
+            return False
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            return False
+        mask = IN_MOVED_TO | IN_CLOSE_WRITE
+        if libc.inotify_add_watch(fd, directory.encode(), mask) < 0:
+            os.close(fd)
+            return False
+        self._fd = fd
+        super().start()
+        return True
+
+    def stop(self) -> None:
+        self._stop_evt.set()
+
+    def run(self) -> None:
+        fd = self._fd
+        try:
+            while not self._stop_evt.is_set():
+                ready, _, _ = select.select([fd], [], [], 1.0)
+                if not ready:
+                    continue
+                try:
+                    buf = os.read(fd, 4096)
+                except BlockingIOError:
+                    continue
+                if self._matches(buf):
+                    self.event_count += 1
+                    try:
+                        self.callback()
+                    except Exception as e:
+                        print("⚠️ FileWatcher Callback-Fehler:", e)
+        except Exception as e:
+            print("⚠️ FileWatcher beendet:", e)
+        finally:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def _matches(self, buf: bytes) -> bool:
+        """True, wenn mindestens ein Event die Zieldatei betrifft."""
+        pos, hit = 0, False
+        while pos + _EVENT_HDR.size <= len(buf):
+            _, mask, _, nlen = _EVENT_HDR.unpack_from(buf, pos)
+            pos += _EVENT_HDR.size
+            name = buf[pos:pos + nlen].rstrip(b"\0")
+            pos += nlen
+            if name == self._name and mask & (IN_MOVED_TO | IN_CLOSE_WRITE):
+                hit = True
+        return hit
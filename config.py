@@ -2,10 +2,23 @@
 # -*- coding: utf-8 -*-
 """
 config.py – zentrale JSON-Konfiguration für VIVOSUN Ultimate
+• In-Memory-Cache: config.json wird nur neu gelesen, wenn sich mtime/Größe
+  ändern (stat höchstens alle STAT_INTERVAL Sekunden)
+• get_config()/get(): gemeinsames, read-only Objekt für Hot-Paths
+• subscribe(): Beobachter pro Schlüssel, Aufruf im Kivy-Main-Thread
+• Event-Bus: jedes save_config() (bzw. externe Änderung) → genau ein Diff-Event
+  {key: (alt, neu)} pro Beobachter, gefiltert auf dessen Schlüssel
+• transaction(): mehrere Änderungen → ein Event, ein atomarer Schreibvorgang;
+  Schreiben verzögert um WRITE_DELAY (Debounce), flush() beim Beenden
 © 2025 Dominik Rosenthal (Hackintosh1980)
 """
-import json, os
+import atexit, json, os, time, threading, weakref
+from contextlib import contextmanager
+from types import MappingProxyType
 from kivy.utils import platform
+from kivy.clock import Clock
+
+import ble_snapshot
 
 if platform == "android":
     APP_DIR = "/data/user/0/org.hackintosh1980.dashboard/files"
@@ -26,85 +39,262 @@ DEFAULTS = {
     "clear_on_mode_switch": True,  # Charts leeren bei Moduswechsel
     "refresh_interval": 2.0,
     "chart_window": 120,
+    "chart_span": 600,             # sichtbares Zeitfenster (s): 600 | 3600 | 86400
+    "history_points": 50000,       # gehaltene Samples (Ringpuffer-Kapazität)
     "allow_auto_stop": True,
-    "stale_timeout": 12.0
+    "stale_timeout": 12.0,
+    "ingest_mode": "auto",         # auto | inotify | poll
+    "live_transport": "auto",      # auto | shm | socket | off
+    "ingest_worker": True,         # I/O + Parsing im Hintergrund-Thread
+    "redraw_budget_ms": 8.0,       # Graph-Redraws pro Frame (Rest → nächster Frame)
+    "profile_main_thread": False   # ⏱ Main-Thread-Zeit pro Tick loggen
 }
 
-def load_config():
+STAT_INTERVAL = 1.0   # s zwischen zwei stat()-Checks auf config.json
+WRITE_DELAY = 0.5     # s Debounce für Schreibvorgänge (mehrere Saves → ein Write)
+
+# -------------------------------------------------------------
+# 🗄️ Cache + Beobachter
+# -------------------------------------------------------------
+_lock = threading.RLock()
+_cache = {"key": None, "data": MappingProxyType(dict(DEFAULTS)), "checked": 0.0,
+          "first_run": False}   # first_run: bei Laden/Schreiben/Invalidierung gesetzt
+_observers = []   # (keys | None, ref) – ref() liefert den Callback oder None
+_pending = {"timer": None, "dirty": False}
+_write_lock = threading.Lock()   # serialisiert Timer- und flush()-Schreibvorgänge
+
+
+def _file_key():
     try:
-        if os.path.exists(CONFIG_FILE):
-            with open(CONFIG_FILE, "r") as f:
-                data = json.load(f)
-                return {**DEFAULTS, **data}
-    except Exception as e:
-        print("⚠️ Fehler beim Laden der config:", e)
-    return DEFAULTS.copy()
+        st = os.stat(CONFIG_FILE)
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+    except OSError:
+        return "missing"
 
-def save_config(cfg):
+
+def _read_file():
     try:
-        os.makedirs(os.path.dirname(CONFIG_FILE), exist_ok=True)
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(cfg, f, indent=2)
-        print("💾 Config gespeichert:", cfg)
+        with open(CONFIG_FILE, "r") as f:
+            return {**DEFAULTS, **json.load(f)}
+    except FileNotFoundError:
+        return dict(DEFAULTS)
+
+
+def _diff(old, new):
+    return {k: (old.get(k), new.get(k))
+            for k in set(old) | set(new) if old.get(k) != new.get(k)}
+
+
+def _notify(changes):
+    if not changes:
+        return
+    with _lock:
+        observers = list(_observers)
+    for keys, ref in observers:
+        cb = ref()
+        if cb is None:
+            unsubscribe(ref)
+            continue
+        part = changes if keys is None else {k: v for k, v in changes.items() if k in keys}
+        if not part:
+            continue
+        if threading.current_thread() is threading.main_thread():
+            _safe_call(cb, part)
+        else:
+            Clock.schedule_once(lambda dt, c=cb, p=part: _safe_call(c, p))
+
+
+def _safe_call(cb, changes):
+    try:
+        cb(changes)
     except Exception as e:
-        print("❌ Fehler beim Speichern:", e)
+        print("⚠️ Config-Beobachter-Fehler:", e)
 
-def save_device_id(device_id):
-    cfg = load_config()
-    cfg["device_id"] = device_id
-    cfg["mode"] = "live"
-    save_config(cfg)
 
-def get_device_id():
-    return load_config().get("device_id")
+def _set_cache(data, key):
+    """Neuen Stand übernehmen; liefert das Diff zum alten Stand."""
+    with _lock:
+        old = _cache["data"]
+        _cache["data"] = MappingProxyType(data)
+        _cache["key"] = key
+        _cache["checked"] = time.monotonic()
+        _cache["first_run"] = key == "missing" and not _pending["dirty"]
+        return _diff(old, data)
+
+
+def get_config(force=False):
+    """
+    Read-only Konfiguration, dasselbe Objekt bis sich die Datei ändert.
+    Für Änderungen transaction() verwenden.
+    """
+    with _lock:
+        now = time.monotonic()
+        if not force and _cache["key"] is not None and now - _cache["checked"] < STAT_INTERVAL:
+            return _cache["data"]
+        _cache["checked"] = now
+        if _pending["dirty"]:
+            return _cache["data"]   # eigener Stand ist neuer als die Datei
+        key = _file_key()
+        if key == _cache["key"]:
+            return _cache["data"]
+        try:
+            data = _read_file()
+        except Exception as e:
+            print("⚠️ Fehler beim Laden der config:", e)
+            return _cache["data"]
+        changes = _set_cache(data, key)
+    _notify(changes)
+    return _cache["data"]
+
+
+def get(key, default=None):
+    return get_config().get(key, default)
+
+
+def subscribe(callback, keys=None):
+    """
+    callback(changes) mit changes = {key: (alt, neu)}; nur für `keys`
+    (None = alle). Gebundene Methoden werden schwach referenziert.
+    """
+    ref = weakref.WeakMethod(callback) if hasattr(callback, "__self__") else (lambda: callback)
+    with _lock:
+        _observers.append((frozenset(keys) if keys else None, ref))
+    return ref
+
+
+def unsubscribe(callback_or_ref):
+    with _lock:
+        for entry in list(_observers):
+            keys, ref = entry
+            if ref is callback_or_ref or ref() == callback_or_ref or ref() is None:
+                _observers.remove(entry)
+
+
+def load_config():
+    """Veränderbare Kopie der (gecachten) Konfiguration."""
+    return dict(get_config())
+
+
+# -------------------------------------------------------------
+# 💾 Schreiben: Transaktion → Cache + Event sofort, Datei verzögert
+# -------------------------------------------------------------
+def _write_file():
+    """Aktuellen Cache-Stand atomar schreiben (ble_snapshot.write_atomic_bytes)."""
+    with _write_lock:
+        with _lock:
+            _pending["timer"] = None
+            if not _pending["dirty"]:
+                return
+            _pending["dirty"] = False
+            data = dict(_cache["data"])
+        try:
+            ble_snapshot.write_atomic_bytes(CONFIG_FILE, json.dumps(data, indent=2).encode("utf-8"))
+            print("💾 Config gespeichert:", data)
+        except Exception as e:
+            print("❌ Fehler beim Speichern:", e)
+        with _lock:
+            if not _pending["dirty"]:
+                _cache["key"] = _file_key()   # eigener Schreibvorgang → kein Reload
+                _cache["first_run"] = _cache["key"] == "missing"
+
+
+def _schedule_write():
+    with _lock:
+        _pending["dirty"] = True
+        _cache["first_run"] = False
+        if _pending["timer"] is not None:
+            _pending["timer"].cancel()
+        t = threading.Timer(WRITE_DELAY, _write_file)
+        t.daemon = True
+        _pending["timer"] = t
+        t.start()
+
+
+def flush():
+    """Ausstehenden Schreibvorgang sofort erledigen (z. B. beim Beenden)."""
+    with _lock:
+        if _pending["timer"] is not None:
+            _pending["timer"].cancel()
+    _write_file()
+
+
+atexit.register(flush)
+
+
+@contextmanager
+def transaction():
+    """
+    with config.transaction() as cfg: cfg[...] = ...
+    Alle Änderungen im Block → ein Diff-Event + ein (verzögerter) Schreibvorgang.
+    Bei einer Exception im Block wird nichts übernommen.
+    """
+    with _lock:
+        cfg = dict(get_config())
+        yield cfg
+        data = {**DEFAULTS, **cfg}
+        changes = _diff(_cache["data"], data)
+        if changes:
+            _set_cache(data, _cache["key"])
+            _schedule_write()
+    _notify(changes)
+
+
+def is_first_run():
+    """
+    True, solange keine config.json existiert. Liest nur das gecachte Flag
+    (gesetzt beim Laden, Schreiben und bei Invalidierung durch get_config())
+    – kein stat() pro Aufruf, auch nicht im Sekundentakt.
+    """
+    if _cache["key"] is None:
+        get_config()   # erster Aufruf: einmal laden
+    return _cache["first_run"]
+
+
+def save_config(cfg):
+    """Ersetzt die komplette Konfiguration (siehe transaction())."""
+    with transaction() as c:
+        c.clear()
+        c.update(cfg)
+
 
 # -------------------------------------------------------------
 # 📡 Gerät speichern / laden (MAC-Adresse)
 # -------------------------------------------------------------
-import os, json
+CONFIG_PATH = CONFIG_FILE   # alter Name, nur noch Alias
 
-CONFIG_PATH = os.path.join(os.path.dirname(__file__), "config.json")
 
 def save_device_id(addr: str):
     """Speichert die aktive BLE-MAC-Adresse ins config.json."""
-    try:
-        cfg = load_config()
+    with transaction() as cfg:
         cfg["device_id"] = addr
-        with open(CONFIG_PATH, "w", encoding="utf8") as f:
-            json.dump(cfg, f, indent=2)
-        print(f"💾 device_id gespeichert → {addr}")
-    except Exception as e:
-        print("⚠️ Fehler beim Speichern der device_id:", e)
+    print(f"💾 device_id gespeichert → {addr}")
+
 
 def load_device_id() -> str | None:
-    """Lädt gespeicherte BLE-MAC-Adresse aus config.json."""
-    try:
-        if not os.path.exists(CONFIG_PATH):
-            return None
-        with open(CONFIG_PATH, "r", encoding="utf8") as f:
-            cfg = json.load(f)
-        return cfg.get("device_id")
-    except Exception as e:
-        print("⚠️ Fehler beim Laden der device_id:", e)
-        return None
+    """Gespeicherte BLE-MAC-Adresse (aus dem Cache)."""
+    return get("device_id")
+
+
+def get_device_id():
+    return get("device_id")
+
+
 # -------------------------------------------------------------
 # 🌡️ Temperature Unit (°C / °F)
 # -------------------------------------------------------------
 def get_unit():
     """Liest die Temperatureinheit aus der Config (°C oder °F)."""
     try:
-        cfg = load_config()
+        cfg = get_config()
         return cfg.get("unit", "°C")
     except Exception:
         return "°C"
 
 def toggle_unit():
     """Wechselt zwischen °C und °F, speichert und gibt neue Einheit zurück."""
-    cfg = load_config()
-    current = cfg.get("unit", "°C")
-    new_unit = "°F" if current == "°C" else "°C"
-    cfg["unit"] = new_unit
-    save_config(cfg)
+    with transaction() as cfg:
+        new_unit = "°F" if cfg.get("unit", "°C") == "°C" else "°C"
+        cfg["unit"] = new_unit
     print(f"🌡️ Einheit umgeschaltet → {new_unit}")
     return new_unit
 # ------------------------------------------------------------
@@ -117,7 +307,7 @@ def get_refresh_interval():
     Fallback: 2.0 Sekunden
     """
     try:
-        cfg = load_config()
+        cfg = get_config()
         return float(cfg.get("refresh_interval", 5.0))
     except Exception:
         return 2.0
@@ -130,7 +320,7 @@ def get_stale_timeout():
     Fallback: 10.0 Sekunden
     """
     try:
-        cfg = load_config()
+        cfg = get_config()
         return float(cfg.get("stale_timeout", 8.0))
     except Exception:
         return 10.0
@@ -142,7 +332,19 @@ def get_chart_window():
     Fallback: 120
     """
     try:
-        cfg = load_config()
+        cfg = get_config()
         return int(cfg.get("chart_window", 200))
     except Exception:
         return 120
+
+
+def get_chart_span():
+    """
+    Gibt das sichtbare Zeitfenster der Charts (Sekunden) zurück.
+    Fallback: 600 (10 min)
+    """
+    try:
+        cfg = get_config()
+        return float(cfg.get("chart_span", 600))
+    except Exception:
+        return 600.0
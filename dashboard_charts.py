@@ -7,19 +7,29 @@ VIVOSUN Dashboard – Cross-Platform BLE Monitor
 """
 
 from __future__ import annotations
-import os, json, time
+import os, time
+from bisect import bisect_left
 from typing import Any, Dict, List, Optional, Tuple
 
 from kivy.clock import Clock
 from kivy.animation import Animation
 from kivy_garden.graph import LinePlot
+try:
+    # nur im vendorten garden/kivy_garden/graph – das pip-Paket hat beides nicht
+    from kivy_garden.graph import GlowLinePlot, redraw_scheduler
+except ImportError:
+    GlowLinePlot = None
+    redraw_scheduler = None
 from kivy.utils import platform
 from kivy.metrics import dp
 from kivy.app import App
 from kivy.uix.floatlayout import FloatLayout
 from kivy.uix.image import Image
 
-import config, utils
+import config, utils, vpd, ble_snapshot, ble_watch, ble_stream, ble_push, ble_shm
+from ingest_worker import IngestBundle, IngestWorker, TickTimer
+from axis_control import AxisController
+from sample_store import SampleStore, ColumnView, TILE_COLUMNS, mono_from_wall
 
 
 # ======================================================================
@@ -28,9 +38,7 @@ import config, utils
 
 def get_unit_for_key(key: str) -> str:
     try:
-        cfg = config.load_config() or {}
-        unit_str = str(cfg.get("unit", "°C"))
-        is_f = "F" in unit_str.upper()
+        is_f = "F" in str(config.get("unit", "°C")).upper()
     except Exception:
         is_f = False
 
@@ -81,9 +89,9 @@ class ChartManager:
     def __init__(self, dashboard):
         self.dashboard = dashboard
 
-        self.buffers: Dict[str, List[Tuple[int, float]]] = {}
-        self.plots: Dict[str, LinePlot] = {}
-        self.counter: int = 0
+        self.plots: Dict[str, Any] = {}
+        self._axes: Dict[str, AxisController] = {}
+        self._plot_seq: Dict[str, int] = {}   # store.seq beim letzten Plot-Abgleich
 
         self.running: bool = True
         self._poll_event = None
@@ -102,18 +110,47 @@ class ChartManager:
 
         self.cfg: Dict[str, Any] = config.load_config() or {}
         self.refresh_interval: float = float(self.cfg.get("refresh_interval", 4.0))
-        self.chart_window: int = int(self.cfg.get("chart_window", 120))
+        self.chart_window: int = int(self.cfg.get("chart_window", 120))   # max. Samples pro Batch
+        self.chart_span: float = float(self.cfg.get("chart_span", 600))    # sichtbares Zeitfenster (s)
+
+        # Eine Zeile pro Paket (x = monotone Zeit); Kacheln lesen Spalten-Views
+        self.store = SampleStore(int(self.cfg.get("history_points", 50000)))
+        self.buffers: Dict[str, ColumnView] = {
+            key: self.store.view(col) for key, col in TILE_COLUMNS.items()}
         self.stale_timeout: Optional[float] = self._coerce_float(self.cfg.get("stale_timeout"))
         self.allow_auto_stop: bool = bool(self.cfg.get("allow_auto_stop", True))
+        self._apply_redraw_budget()
 
-        print(f"🌿 ChartManager init – Poll={self.refresh_interval}s, Window={self.chart_window}, "
+        print(f"🌿 ChartManager init – Poll={self.refresh_interval}s, Span={self.chart_span:.0f}s, "
               f"Timeout={self._effective_timeout():.1f}s, AutoStop={self.allow_auto_stop}")
 
+        self._snapshots = ble_snapshot.get_reader(APP_JSON)
+        self._rendered_key = None
+        self._watcher: Optional[ble_watch.FileWatcher] = None
+        self.ingest_mode: str = str(self.cfg.get("ingest_mode", "auto"))
+        self._stream = ble_stream.StreamTailer(ble_stream.stream_path_for(APP_JSON))
+        self.live_transport: str = str(self.cfg.get("live_transport", "auto"))
+        self._push = None   # Push-/Ring-/FallbackSubscriber (ble_push, ble_shm)
+        self._push_event = None
+
+        # Ingest im Hintergrund; profile_main_thread loggt Main-Thread-Zeit pro Tick
+        self._tick_timer = TickTimer("ChartManager Main-Thread",
+                                     enabled=bool(self.cfg.get("profile_main_thread", False)))
+        self._worker: Optional[IngestWorker] = None
+        if self.cfg.get("ingest_worker", True):
+            self._worker = IngestWorker(self._build_bundle, self._deliver_bundle)
+            self._worker.start()
+
         self._tile_keys_int = ["tile_t_in", "tile_h_in", "tile_vpd_in"]
         self._tile_keys_ext = ["tile_t_out", "tile_h_out", "tile_vpd_out"]
 
+        # Config-Events: nur geänderte Schlüssel anwenden (kein Datei-Reload)
+        config.subscribe(self._on_config_changed, self._CONFIG_KEYS)
+
         self._init_tiles()
         self._ensure_bridge_started()
+        self._ensure_watcher()
+        self._ensure_push()
         self.start_polling()
         self._ensure_recovery_timer()
 
@@ -220,30 +257,25 @@ class ChartManager:
             except Exception:
                 pass
 
-            # Plot initialisieren (einmalig)
+            # Gleitendes Zeitfenster + Y-Animation nur über die Matrix
+            if hasattr(graph, "transform_mode"):
+                graph.transform_mode = True
+
+            # Plot initialisieren (einmalig) – Linie + Schattenkante in einem Mesh
             if key not in self.plots:
                 accent = getattr(tile, "accent", (0.7, 1.0, 0.7))
-                plot = LinePlot(color=(*accent, 1.0), line_width=4.5)
+                if GlowLinePlot is not None:
+                    # Breiten in px über die ganze Linie (Line.width 4.5 ≙ 9 px)
+                    plot = GlowLinePlot(color=(*accent, 1.0), line_width=9.0, glow_width=1.2,
+                                        capacity=self._window_points())
+                else:
+                    plot = LinePlot(color=(*accent, 1.0), line_width=4.5)
                 graph.add_plot(plot)
                 self.plots[key] = plot
-                self.buffers[key] = []
 
             # Grundachsen
             graph.ymin, graph.ymax = 0, 1
-            graph.xmin, graph.xmax = 0, max(1, self.chart_window)
-
-            # sanfte Schattenkante hinter der Linie
-            with graph.canvas.before:
-                from kivy.graphics import Color, Line
-                Color(0, 0, 0, 0.25)
-                shadow_line = Line(points=plot.points, width=plot.line_width + 1.2, cap='round')
-
-            def _sync_shadow(*_):
-                try:
-                    shadow_line.points = plot.points
-                except Exception:
-                    pass
-            plot.bind(points=_sync_shadow)
+            self._set_x_window(graph)
 
             # Größe synchronisieren
             def _sync_graph(*_):
@@ -282,6 +314,97 @@ class ChartManager:
         except Exception as e:
             print("⚠️ Bridge-Autostart-Fehler:", e)
 
+    # ------------------------------
+    # inotify-Ingest (Linux-Desktop)
+    # ------------------------------
+    def _ensure_watcher(self) -> None:
+        """Weckt die Pipeline bei echten Bridge-Writes; Timer-Poll bleibt Fallback."""
+        if self._watcher is not None:
+            return
+        mode = self.ingest_mode
+        if mode == "poll" or (mode == "auto" and platform != "linux"):
+            return
+        if not ble_watch.available():
+            print("ℹ️ inotify nicht verfügbar – nur Timer-Polling")
+            return
+        self._wake = Clock.create_trigger(self._on_bridge_write, 0)
+        watcher = ble_watch.FileWatcher(APP_JSON, self._wake)
+        if watcher.start():
+            self._watcher = watcher
+            print(f"👀 inotify aktiv auf {os.path.dirname(APP_JSON)}")
+        else:
+            print("ℹ️ inotify-Start fehlgeschlagen – nur Timer-Polling")
+
+    def _stop_watcher(self) -> None:
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+
+    def _on_bridge_write(self, *_):
+        if self.running:
+            self._poll_json()
+        elif not self._user_paused:
+            self._check_recovery()
+
+    # ------------------------------
+    # Live-Kanal vom Desktop-Scanner (Shared Memory oder Unix-Socket)
+    # ------------------------------
+    def _ensure_push(self) -> None:
+        if self._push is not None or platform == "android":
+            return
+        mode = self.live_transport
+        shm = mode in ("auto", "shm") and ble_shm.available()
+        sock = mode in ("auto", "socket") and ble_push.available()
+        if shm and sock:
+            # Ring bevorzugt, Socket übernimmt, solange der Ring fehlt/steht
+            self._push = ble_shm.FallbackSubscriber(
+                ble_shm.RingSubscriber(),
+                ble_push.PushSubscriber(ble_push.sock_path_for(APP_JSON)))
+        elif shm:
+            self._push = ble_shm.RingSubscriber()
+        elif sock:
+            self._push = ble_push.PushSubscriber(ble_push.sock_path_for(APP_JSON))
+        else:
+            return
+        self._push_event = Clock.schedule_interval(self._poll_push, 0.05)
+
+    def _stop_push(self) -> None:
+        if self._push_event:
+            Clock.unschedule(self._push_event)
+            self._push_event = None
+        if self._push is not None:
+            self._push.close()
+            self._push = None
+
+    def _poll_push(self, *_):
+        try:
+            samples = self._push.poll()
+            if not samples or not self.running:
+                return
+            device_id = self.cfg.get("device_id") or self._header_cache.get("mac")
+            if not device_id or device_id == "--":
+                device_id = samples[-1].get("address") or samples[-1].get("mac")
+            device_id = ble_snapshot.normalize_mac(device_id)
+            samples = [s for s in samples
+                       if ble_snapshot.normalize_mac(s.get("address") or s.get("mac")) == device_id]
+            if not samples:
+                return
+
+            d = samples[-1]
+            self._update_header(d)
+            try:
+                pkt_val = int(d.get("packet_counter"))
+            except (TypeError, ValueError):
+                pkt_val = None
+            if pkt_val is not None and pkt_val != self._last_pkt_seen:
+                self._last_pkt_seen = pkt_val
+                self._last_pkt_time = time.time()
+                self._stale_logged = False
+
+            self._ingest_samples(samples[-self.chart_window:])
+        except Exception as e:
+            print("⚠️ Push-Fehler:", e)
+
     # ------------------------------
     # Polling lifecycle + UI-Buttons
     # ------------------------------
@@ -385,36 +508,59 @@ class ChartManager:
     # Haupt-Poll (mit Auto-Cleanup)
     # ------------------------------
     def _poll_json(self, *_):
+        """Tick/inotify: I/O + Parsing im Worker, ohne Worker direkt (Vergleichsmodus)."""
         if not self.running:
             return
-        try:
-            device_id = (getattr(config, "load_device_id", lambda: None)() or
-                         self.cfg.get("device_id"))
-
-            if not os.path.exists(APP_JSON):
-                self._set_no_data_labels()
-                return
-            with open(APP_JSON, "r", encoding="utf-8") as f:
-                raw = f.read().strip()
-            if not raw:
-                self._set_no_data_labels()
-                return
-
+        if self._worker is not None:
+            self._worker.request()
+            return
+        with self._tick_timer:
             try:
-                data = json.loads(raw)
-            except json.JSONDecodeError:
+                bundle = self._build_bundle()
+            except Exception as e:
+                print("⚠️ Polling-Fehler:", e)
+                self._set_no_data_labels()
                 return
-            if not isinstance(data, list) or not data:
+            self._apply_bundle(bundle)
+
+    def _build_bundle(self) -> IngestBundle:
+        """Läuft im Ingest-Worker: Snapshot, Gerät, neue Samples, fertige Werte."""
+        device_id = (getattr(config, "load_device_id", lambda: None)() or
+                     self.cfg.get("device_id"))
+
+        snap = self._snapshots.get()
+        d = None
+        if snap.has_content and snap.devices:
+            d = snap.device(device_id) if device_id else snap.devices[0]
+        if d is None or d.get("alive") is False:
+            return IngestBundle(snap, d, False, [], None)
+
+        # Gleicher Snapshot (kein neuer Write bzw. gleiche Generation) → nur Watchdog;
+        # als gerendert markiert erst _apply_bundle (Main-Thread)
+        if snap.stat_key == self._rendered_key:
+            return IngestBundle(snap, d, False, [], None)
+
+        # Samples: Push-Kanal, NDJSON-Stream (jedes Paket genau einmal) oder Snapshot
+        samples = self._new_samples(d)
+        is_f = self._is_fahrenheit()
+        values = [self._values_for(x, is_f) for x in samples]
+        return IngestBundle(snap, d, True, values, samples[-1] if samples else None)
+
+    def _deliver_bundle(self, bundle: IngestBundle) -> None:
+        """Clock-Callback des Workers (Main-Thread, gemessen)."""
+        with self._tick_timer:
+            self._apply_bundle(bundle)
+
+    def _apply_bundle(self, bundle: IngestBundle) -> None:
+        """Main-Thread: Watchdog, Header, Labels und Plot-Punkte."""
+        if not self.running:
+            return
+        try:
+            if not bundle.snap.has_content or bundle.device is None:
                 self._set_no_data_labels()
                 return
 
-            if device_id:
-                data = [d for d in data if (d.get("address") or d.get("mac")) == device_id]
-                if not data:
-                    self._set_no_data_labels()
-                    return
-
-            d = data[0]
+            d = bundle.device
             self._update_header(d)
 
             # alive=false → Freeze + optional Auto-Stop
@@ -422,7 +568,7 @@ class ChartManager:
             if alive_flag is False:
                 self._set_no_data_labels()
                 if self.allow_auto_stop and not self._user_paused:
-                    pkt_stop = d.get("packet_counter") or d.get("pkt") or d.get("counter")
+                    pkt_stop = d.get("packet_counter")
                     try:
                         self._last_pkt_at_stop = int(pkt_stop)
                     except Exception:
@@ -438,7 +584,7 @@ class ChartManager:
                 return
 
             # Watchdog
-            pkt = d.get("packet_counter") or d.get("pkt") or d.get("counter")
+            pkt = d.get("packet_counter")
             try:
                 pkt_val = int(pkt) if pkt is not None else None
             except Exception:
@@ -489,73 +635,132 @@ class ChartManager:
                         print(f"⚠️ JSON-Löschung fehlgeschlagen: {e}")
                     return
 
-            # Werte
-            t_int_c = d.get("temperature_int", 0.0)
-            t_ext_c = d.get("temperature_ext", 0.0)
-            h_int   = d.get("humidity_int", 0.0)
-            h_ext   = d.get("humidity_ext", 0.0)
+            if not bundle.fresh:
+                return
+            if bundle.snap.stat_key == self._rendered_key and bundle.last is d:
+                return   # derselbe Snapshot-Eintrag aus einem zweiten Build im Flug
+            self._render_values(bundle.values, bundle.last)
+            self._rendered_key = bundle.snap.stat_key
 
-            ext_now = self._detect_external_present(t_ext_c, h_ext)
-            if self.ext_present is None or ext_now != self.ext_present:
-                self.ext_present = ext_now
-                self._apply_layout(ext_now)
+        except Exception as e:
+            print("⚠️ Polling-Fehler:", e)
+            self._set_no_data_labels()
 
-            vpd_in  = utils.calc_vpd(t_int_c, h_int)
-            vpd_out = utils.calc_vpd(t_ext_c, h_ext)
+    # ------------------------------
+    # Samples + Werte
+    # ------------------------------
+    def _new_samples(self, d) -> List[Any]:
+        """
+        Mit NDJSON-Stream: alle neuen Pakete des aktiven Geräts seit dem
+        letzten Tick (in Reihenfolge, höchstens ein Chart-Fenster).
+        Ohne (frischen) Stream: nur der aktuelle Snapshot-Eintrag.
+        Bei verbundenem Push-Kanal kommen die Samples bereits über _poll_push;
+        der Stream wird dann nur mitgelesen, damit nach einem Disconnect
+        nichts doppelt eingespielt wird.
+        """
+        push = self._push   # einmal lesen: der Main-Thread kann _push umsetzen
+        if push is not None and push.connected:
+            self._stream.read_new()
+            return []
+        if not self._stream.is_fresh(self._effective_timeout()):
+            return [d]
+        addr = d.get("address")
+        samples = [s for s in self._stream.read_new()
+                   if ble_snapshot.normalize_mac(s.get("address") or s.get("mac")) == addr]
+        return samples[-self.chart_window:]
+
+    def _ingest_samples(self, samples: List[Any]) -> None:
+        """Live-Kanal: Werte im Main-Thread rechnen und anhängen."""
+        if not samples:
+            return
+        is_f = self._is_fahrenheit()
+        self._render_values([self._values_for(x, is_f) for x in samples], samples[-1])
 
-            try:
-                unit_str = str((config.load_config() or {}).get("unit", "°C"))
-                is_f = "F" in unit_str.upper()
-            except Exception:
-                is_f = False
-            from utils import convert_temperature
-            t_int_disp = convert_temperature(t_int_c, "F") if is_f else t_int_c
-            t_ext_disp = convert_temperature(t_ext_c, "F") if is_f else t_ext_c
-
-            values = {
-                "tile_t_in":   t_int_disp,
-                "tile_h_in":   h_int,
-                "tile_vpd_in": vpd_in,
-                "tile_t_out":  t_ext_disp,
-                "tile_h_out":  h_ext,
-                "tile_vpd_out": vpd_out,
-            }
-
-            # UI-Update – weakproxy-safe
-            for key, val in values.items():
-                self._append_value(key, val)
+    def _render_values(self, rows: List[Dict[str, float]], d) -> None:
+        """Hängt fertige Zeilen an; Plots, Labels und Scatter einmal für das letzte."""
+        if not rows:
+            return
+        for row in rows:
+            self.store.append(row["t"], row)
 
-                tile = self.dashboard.ids.get(key)
-                if not tile:
-                    continue
-                big  = self._safe_ids(tile, "big")
-                graph = self._safe_ids(tile, "g")
-                if graph is None:
-                    continue
+        t_int_c = d.get("temperature_int", 0.0)
+        t_ext_c = d.get("temperature_ext", 0.0)
+        h_int   = d.get("humidity_int", 0.0)
+        h_ext   = d.get("humidity_ext", 0.0)
 
-                try:
-                    unit = get_unit_for_key(key)
-                    if big:
-                        big.text = f"{val:.2f} {unit}" if unit else f"{val:.2f}"
-                    self._auto_scale_y(graph, key)
-                except ReferenceError:
-                    # Layout wurde rekonstruiert; nächster Poll repariert es automatisch
-                    continue
-                except Exception:
-                    continue
+        ext_now = self._detect_external_present(t_ext_c, h_ext)
+        if self.ext_present is None or ext_now != self.ext_present:
+            self.ext_present = ext_now
+            self._apply_layout(ext_now)
+
+        values = rows[-1]
+
+        # UI-Update – weakproxy-safe
+        for key, col in TILE_COLUMNS.items():
+            val = values[col]
+            self._update_plot(key)
+
+            tile = self.dashboard.ids.get(key)
+            if not tile:
+                continue
+            big  = self._safe_ids(tile, "big")
+            graph = self._safe_ids(tile, "g")
+            if graph is None:
+                continue
 
-            # Scatter update (optional)
             try:
-                app = App.get_running_app()
-                if getattr(app, "scatter_window", None):
-                    Clock.schedule_once(lambda dt: app.scatter_window.update_values(
-                        t_int_c, h_int, t_ext_c, h_ext))
+                unit = get_unit_for_key(key)
+                if big:
+                    big.text = f"{val:.2f} {unit}" if unit else f"{val:.2f}"
+            except ReferenceError:
+                # Layout wurde rekonstruiert; nächster Poll repariert es automatisch
+                continue
             except Exception:
-                pass
+                continue
 
-        except Exception as e:
-            print("⚠️ Polling-Fehler:", e)
-            self._set_no_data_labels()
+        # Scatter update (optional)
+        try:
+            app = App.get_running_app()
+            if getattr(app, "scatter_window", None):
+                Clock.schedule_once(lambda dt: app.scatter_window.update_values(
+                    t_int_c, h_int, t_ext_c, h_ext))
+        except Exception:
+            pass
+
+    @staticmethod
+    def _is_fahrenheit() -> bool:
+        try:
+            return "F" in str(config.get("unit", "°C")).upper()
+        except Exception:
+            return False
+
+    def _values_for(self, d, is_f: bool) -> Dict[str, float]:
+        t_int_c = d.get("temperature_int", 0.0)
+        t_ext_c = d.get("temperature_ext", 0.0)
+        h_int   = d.get("humidity_int", 0.0)
+        h_ext   = d.get("humidity_ext", 0.0)
+
+        vpd_in  = utils.calc_vpd(t_int_c, h_int)
+        vpd_out = utils.calc_vpd(t_ext_c, h_ext)
+
+        from utils import convert_temperature
+        t_int_disp = convert_temperature(t_int_c, "F") if is_f else t_int_c
+        t_ext_disp = convert_temperature(t_ext_c, "F") if is_f else t_ext_c
+
+        try:
+            t = mono_from_wall(float(d["ts"])) if d.get("ts") else time.monotonic()
+        except (TypeError, ValueError):
+            t = time.monotonic()
+
+        return {
+            "t":       t,
+            "t_in":    t_int_disp,
+            "h_in":    h_int,
+            "vpd_in":  vpd_in,
+            "t_out":   t_ext_disp,
+            "h_out":   h_ext,
+            "vpd_out": vpd_out,
+        }
 
     # ------------------------------
     # Recovery
@@ -564,20 +769,14 @@ class ChartManager:
         if self.running or self._user_paused:
             return
         try:
-            if not os.path.exists(APP_JSON):
-                return
-            with open(APP_JSON, "r", encoding="utf-8") as f:
-                raw = f.read().strip()
-            if not raw:
-                return
-            data = json.loads(raw)
-            if not isinstance(data, list) or not data:
+            snap = self._snapshots.get()
+            d = snap.device(self.cfg.get("device_id")) or snap.first
+            if d is None:
                 return
 
-            d = data[0]
             alive_flag = d.get("alive")
 
-            pkt = d.get("packet_counter") or d.get("pkt") or d.get("counter")
+            pkt = d.get("packet_counter")
             try:
                 pkt_val = int(pkt) if pkt is not None else None
             except Exception:
@@ -689,44 +888,69 @@ class ChartManager:
     # ------------------------------
     # Helpers
     # ------------------------------
-    def _append_value(self, key: str, val: float) -> None:
-        buf = self.buffers.setdefault(key, [])
-        self.counter += 1
-        buf.append((self.counter, float(val)))
-
-        # begrenzen (inplace)
-        if len(buf) > self.chart_window:
-            del buf[:-self.chart_window]
-
-        # Haupt- und Glow-Plot synchron updaten
-        main_plot = self.plots.get(key)
-        glow_plot = getattr(self, "plots_glow", {}).get(key)
-
-        if main_plot:
-            main_plot.points = buf[:]
-        if glow_plot:
-            glow_plot.points = buf[:]
+    def _update_plot(self, key: str, full: bool = False) -> None:
+        """
+        Plots einer Kachel aus ihrer Spalte nachführen (einmal pro Render, nicht
+        pro Zeile). Normalfall: nur die neuen Zeilen anhängen und vorne kürzen,
+        was aus dem Zeitfenster gefallen ist (append_points/trim_front).
+        full=True oder nach clear()/Überlauf: Fenster komplett neu setzen.
+        """
+        buf = self.buffers[key]
+        t0 = self._window_start()
+
+        # Haupt- und Glow-Plot synchron updaten (Punktliste nur einmal bauen)
+        plots = [p for p in (self.plots.get(key), getattr(self, "plots_glow", {}).get(key)) if p]
+        if plots:
+            new = self.store.seq - self._plot_seq.get(key, -1)
+            incremental = (not full and 0 <= new <= len(self.store)
+                           and all(hasattr(p, "append_points") for p in plots))
+            tail = buf[len(buf) - new:] if incremental and new else []
+            pts = None if incremental else buf.points(t0)
+            expected = len(self.store) - self.store.index_at(t0)   # Zeilen im Fenster
+            for plot in plots:
+                try:
+                    if pts is None:
+                        plot.append_points(tail)
+                        plot.trim_front(bisect_left(plot.data, (t0,)))
+                        if len(plot.data) == expected:
+                            continue
+                        # Plot hat nicht das ganze Fenster (z. B. zwischendurch geleert)
+                        pts = buf.points(t0)
+                    plot.points = pts
+                except ReferenceError:
+                    pass
+            self._plot_seq[key] = self.store.seq
 
-        # Fenster gleiten lassen, unabhängig vom Counter-Start
         graph = getattr(self, "graphs", {}).get(key)
-        if graph:
-            n = len(buf)
-            if n >= 2:
-                x_max = buf[-1][0]
-                x_min = x_max - (self.chart_window - 1)
-                if x_min < 0:
-                    x_min = 0
-                graph.xmin = x_min
-                graph.xmax = max(graph.xmin + 1, x_max)
-
-            # Y-Achse automatisch skalieren
+        if graph is not None:
+            self._set_x_window(graph)
             self._auto_scale_y(graph, key)
+
+    def _apply_redraw_budget(self) -> None:
+        """Frame-Budget des gemeinsamen Graph-Redraw-Koordinators (ms → s)."""
+        if redraw_scheduler is None:
+            return   # pip-Graph: eigene Clock-Trigger je Graph
+        ms = self._coerce_float(self.cfg.get("redraw_budget_ms"))
+        redraw_scheduler.budget = (ms if ms and ms > 0 else 8.0) / 1000.0
+
+    def _window_points(self) -> int:
+        """Erwartete Punkte im Zeitfenster (Vorbelegung der Plot-Puffer)."""
+        return int(self.chart_span / max(0.5, self.refresh_interval)) + self.chart_window
+
+    def _window_start(self) -> float:
+        return time.monotonic() - self.chart_span
+
+    def _set_x_window(self, graph) -> None:
+        """x-Achse = [jetzt − chart_span, jetzt] in monotoner Zeit."""
+        t1 = time.monotonic()
+        graph.xmin = t1 - self.chart_span
+        graph.xmax = t1
     # ------------------------------
     # Reset & Config-Reload
     # ------------------------------
     def reset_data(self) -> None:
-        for buf in self.buffers.values():
-            buf.clear()
+        self.store.clear()
+        self._plot_seq.clear()
         for p in self.plots.values():
             try:
                 p.points = []
@@ -738,31 +962,119 @@ class ChartManager:
                 continue
             big = self._safe_ids(tile, "big")
             self._safe_set_text(big, "--")
-        self.counter = 0
         print("🧹 Charts & Werte zurückgesetzt")
 
     def reload_config(self) -> None:
-        new_cfg = config.load_config() or {}
-        self.refresh_interval = float(new_cfg.get("refresh_interval", self.refresh_interval))
-        self.chart_window     = int(new_cfg.get("chart_window", self.chart_window))
-        self.allow_auto_stop  = bool(new_cfg.get("allow_auto_stop", self.allow_auto_stop))
-        self.stale_timeout    = self._coerce_float(new_cfg.get("stale_timeout"))
-        self.cfg.update(new_cfg)
-        print(f"♻️ Config neu geladen: Poll={self.refresh_interval}, Window={self.chart_window}, "
-              f"Timeout={self._effective_timeout():.1f}s, AutoStop={self.allow_auto_stop}")
-        if self.running:
-            self.start_polling()
+        """Datei neu einlesen; Änderungen kommen als Event über _on_config_changed."""
+        config.get_config(force=True)
+
+    _CONFIG_KEYS = ("refresh_interval", "chart_window", "chart_span", "history_points",
+                    "allow_auto_stop", "stale_timeout", "redraw_budget_ms",
+                    "ingest_mode", "live_transport", "unit", "leaf_offset", "device_id")
+
+    def _on_config_changed(self, changes: Dict[str, Tuple[Any, Any]]) -> None:
+        for key, (_, new) in changes.items():
+            self.cfg[key] = new
+
+        if "chart_window" in changes:
+            self.chart_window = int(changes["chart_window"][1] or self.chart_window)
+        if "history_points" in changes:
+            self.store.resize(int(changes["history_points"][1] or self.store.capacity))
+        if "chart_span" in changes or "history_points" in changes:
+            self.chart_span = float(self.cfg.get("chart_span") or self.chart_span)
+            for key in self.buffers:
+                self._redraw_key(key)
+        if "allow_auto_stop" in changes:
+            self.allow_auto_stop = bool(changes["allow_auto_stop"][1])
+        if "stale_timeout" in changes:
+            self.stale_timeout = self._coerce_float(changes["stale_timeout"][1])
+        if "redraw_budget_ms" in changes:
+            self._apply_redraw_budget()
+        if "ingest_mode" in changes:
+            self.ingest_mode = str(changes["ingest_mode"][1] or "auto")
+            if self.ingest_mode == "poll":
+                self._stop_watcher()
+            else:
+                self._ensure_watcher()
+        if "live_transport" in changes:
+            self.live_transport = str(changes["live_transport"][1] or "auto")
+            self._stop_push()
+            self._ensure_push()
+        if "unit" in changes:
+            self._rescale_temperature(*changes["unit"])
+        if "leaf_offset" in changes:
+            self._recompute_vpd()
+        if "refresh_interval" in changes:
+            self.refresh_interval = float(changes["refresh_interval"][1] or self.refresh_interval)
+            if self.running:
+                self.start_polling()
+
+        print(f"♻️ Config übernommen ({', '.join(sorted(changes))}): Poll={self.refresh_interval}, "
+              f"Span={self.chart_span:.0f}s, Timeout={self._effective_timeout():.1f}s, "
+              f"AutoStop={self.allow_auto_stop}")
+
+    def _rescale_temperature(self, old_unit: Any, new_unit: Any) -> None:
+        """°C ↔ °F über die vorhandene Historie umrechnen (in place)."""
+        was_f = "F" in str(old_unit or "").upper()
+        is_f = "F" in str(new_unit or "").upper()
+        if was_f == is_f:
+            return
+        for key in ("tile_t_in", "tile_t_out"):
+            buf = self.buffers.get(key)
+            if not buf:
+                continue
+            if is_f:
+                buf.map_y(lambda y: y * 9 / 5 + 32)
+            else:
+                buf.map_y(lambda y: (y - 32) * 5 / 9)
+            self._redraw_key(key)
+
+    def _recompute_vpd(self) -> None:
+        """VPD-Historie mit neuem Leaf-Offset aus T/H-Puffern neu berechnen."""
+        if not self.store:
+            return
+        is_f = self._is_fahrenheit()
+        leaf = self._coerce_float(self.cfg.get("leaf_offset")) or 0.0
+        for t_col, h_col, v_col, v_key in (("t_in", "h_in", "vpd_in", "tile_vpd_in"),
+                                           ("t_out", "h_out", "vpd_out", "tile_vpd_out")):
+            # Spalten sind zeilenweise ausgerichtet → ganze Spalte auf einmal
+            ts, hs = self.store.column(t_col), self.store.column(h_col)
+            if vpd.available():
+                t = vpd.np.frombuffer(ts, dtype=vpd.np.float64)
+                if is_f:
+                    t = (t - 32) * 5 / 9
+                vals = vpd.np.round(vpd.calc_vpd_array(t, hs, leaf), 2)
+            else:
+                vals = [round(vpd.vpd((t - 32) * 5 / 9 if is_f else t, h, leaf), 2)
+                        for t, h in zip(ts, hs)]
+            self.store.set_column(v_col, vals)
+            self._redraw_key(v_key)
+
+    def _redraw_key(self, key: str) -> None:
+        """Plot, Großanzeige und Y-Achse eines Tiles aus dem Puffer neu setzen."""
+        self._update_plot(key, full=True)
+        buf = self.buffers[key]
+        tile = self.dashboard.ids.get(key)
+        if not tile or not buf:
+            return
+        unit = get_unit_for_key(key)
+        val = buf[-1][1]
+        self._safe_set_text(self._safe_ids(tile, "big"),
+                            f"{val:.2f} {unit}" if unit else f"{val:.2f}")
 
     # ------------------------------
     # Auto-Scaling Y-Achse
     # ------------------------------
     def _auto_scale_y(self, graph, key: str) -> None:
         try:
-            vals = [v for _, v in self.buffers.get(key, []) if isinstance(v, (int, float))]
-            if not vals:
+            buf = self.buffers.get(key)
+            if not buf:
+                return
+            rng = buf.range(self._window_start())   # Deques, O(1) amortisiert
+            if rng is None:
                 return
 
-            y_min, y_max = min(vals), max(vals)
+            y_min, y_max = rng
 
             # Falls alle Werte gleich → minimaler Bereich
             if abs(y_max - y_min) < 1e-6:
@@ -773,18 +1085,11 @@ class ChartManager:
             new_ymin = round(y_min - margin, 1)
             new_ymax = round(y_max + margin, 1)
 
-            # --- sanftes Nachziehen über Animation ---
-            from kivy.animation import Animation
-            anim = Animation(ymin=new_ymin, ymax=new_ymax, d=0.4, t="out_quad")
-            anim.start(graph)
-
-            # X-Achse gleitend halten
-            if self.counter >= self.chart_window:
-                graph.xmin = self.counter - self.chart_window
-                graph.xmax = self.counter
-            else:
-                graph.xmin = 0
-                graph.xmax = self.chart_window
+            # --- sanftes Nachziehen: ein Controller pro Graph, mit Hysterese ---
+            axis = self._axes.get(key)
+            if axis is None or axis.graph is not graph:
+                axis = self._axes[key] = AxisController(graph)
+            axis.set_range(new_ymin, new_ymax)
 
         except Exception as e:
             print(f"⚠️ Auto-Scale-Fehler ({key}): {e}")
@@ -807,6 +1112,7 @@ class ChartManager:
                 except Exception:
                     pass
 
+        self._plot_seq.clear()   # nächster Abgleich setzt das ganze Fenster
         for plot in self.plots.values():
             try:
                 plot.points = []
@@ -380,12 +380,9 @@ class BtLedWidget(BoxLayout):
         # Prüfen, ob JSON existiert und gültig ist
         json_ok = False
         try:
+            import ble_snapshot
             from dashboard_charts import APP_JSON
-            if os.path.exists(APP_JSON):
-                with open(APP_JSON, "r") as f:
-                    content = f.read().strip()
-                if content:
-                    json_ok = True
+            json_ok = ble_snapshot.get_snapshot(APP_JSON).has_content
         except Exception:
             json_ok = False
 
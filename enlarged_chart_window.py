@@ -9,7 +9,7 @@ enlarged_chart_window.py – Fullscreen-Chart 🌿 v4.3 Stable
 © 2025 Dominik Rosenthal (Hackintosh1980)
 """
 
-import os, traceback
+import os, time, traceback
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.button import Button
 from kivy.uix.label import Label
@@ -23,7 +23,7 @@ from kivy.core.text import LabelBase
 from kivy.uix.modalview import ModalView
 from kivy.graphics import Color, Rectangle, Ellipse
 from kivy_garden.graph import MeshLinePlot
-from kivy.animation import Animation
+from axis_control import AxisController
 # ----------------------------------------------------
 # Font scaling + FontAwesome
 # ----------------------------------------------------
@@ -93,6 +93,10 @@ class EnlargedChartWindow(BoxLayout):
         self._graph_ok = True
         self._stale_warned = False
         self._force_until_data = True
+        self._axis = None   # AxisController, sobald der Graph steht
+        import config
+        self._unit = config.get("unit", "°C")
+        config.subscribe(self._on_unit_changed, ["unit"])
 
         self._build_ui()
         self._refresh_titles_and_colors()
@@ -111,17 +115,22 @@ class EnlargedChartWindow(BoxLayout):
             return 0
 
     def _unit_for_key(self, key):
-        try:
-            import config
-            cfg = config.load_config()
-            unit = cfg.get("unit", "°C")
-        except Exception:
-            unit = "°C"
+        unit = self._unit
         if key.startswith("tile_t_"): return unit
         if key.startswith("tile_h_"): return "%"
         if key.startswith("tile_vpd_"): return "kPa"
         return ""
 
+    def _on_unit_changed(self, changes):
+        """Config-Event: Puffer hat der ChartManager schon umgerechnet."""
+        self._unit = changes["unit"][1] or "°C"
+        if getattr(self, "_graph_ok", False):
+            try:
+                self.graph.ylabel = f"{self._title(self.tile_key)} ({self._unit_for_key(self.tile_key)})"
+            except Exception:
+                pass
+        self._update_chart(force=True)
+
     def _title(self, key):
         return TITLE_MAP.get(key, (key, ""))[0]
 
@@ -248,6 +257,10 @@ class EnlargedChartWindow(BoxLayout):
             except Exception:
                 pass
 
+            # Achsen-Scrollen/-Animation nur über die Matrix (eigener Garden-Graph)
+            if hasattr(self.graph, "transform_mode"):
+                self.graph.transform_mode = True
+
             # VIVOSUN-Linie
             self.plot = MeshLinePlot(color=(0.8, 1.0, 0.8, 1))
             self.plot.line_width = 8.0
@@ -341,25 +354,36 @@ class EnlargedChartWindow(BoxLayout):
             else:
                 self._led_color.rgba = (0.4, 0.1, 0.1, 1)  # rot = aus
 
-            # Daten
-            buf = mgr.buffers.get(self.tile_key, [])
-            clean = [(x, y) for x, y in buf if isinstance(y, (int, float)) and y > INVALID_SENTINEL]
+            # Daten: nur das sichtbare Zeitfenster (Binärsuche im Store)
+            span = float(getattr(mgr, "chart_span", 600) or 600)
+            t1 = time.monotonic()
+            buf = mgr.buffers.get(self.tile_key)
+            rng = buf.range(t1 - span) if buf else None   # Deques im Store, O(1) amortisiert
+            xy = None
+            if hasattr(getattr(self, "plot", None), "set_xy"):   # pip-Plot: nur Punktlisten
+                xy = self._window_columns(mgr, buf, t1 - span, rng)
+            if xy is not None:
+                clean = None
+                last_y = xy[1][-1] if len(xy[1]) else None
+            else:
+                clean = [(x, y) for x, y in buf.points(t1 - span) if y > INVALID_SENTINEL] if buf else []
+                last_y = clean[-1][1] if clean else None
 
             # Force-Modus nur bis erste Daten da sind
-            if force and clean:
+            if force and last_y is not None:
                 self._force_until_data = False
 
             # Bei Stop/Pause: Anzeige einfrieren, nichts löschen
             if (not active or paused) and not force:
-                if clean:
+                if last_y is not None:
                     unit = self._unit_for_key(self.tile_key)
-                    self._value_lbl.text = f"{clean[-1][1]:.2f} {unit}"
+                    self._value_lbl.text = f"{last_y:.2f} {unit}"
                     if self._graph_ok:
-                        self.plot.points = clean
+                        self._show_points(xy, clean)
                 return
 
             # Keine Daten: Anzeige neutral
-            if not clean:
+            if last_y is None:
                 self._value_lbl.text = "--"
                 if self._graph_ok:
                     self.plot.points = []
@@ -367,9 +391,11 @@ class EnlargedChartWindow(BoxLayout):
 
             # Live-Betrieb oder erzwungene Initialanzeige
             if self._graph_ok:
-                self.plot.points = clean
-                ys = [y for _, y in clean]
-                y_min, y_max = min(ys), max(ys)
+                self._show_points(xy, clean)
+                if clean is not None:
+                    ys = [y for _, y in clean]
+                    rng = (min(ys), max(ys))
+                y_min, y_max = rng
                 if abs(y_max - y_min) < 1e-6:
                     y_min, y_max = y_min - 0.5, y_max + 0.5
 
@@ -377,14 +403,13 @@ class EnlargedChartWindow(BoxLayout):
                 margin = max((y_max - y_min) * 0.45, 0.25)
                 new_ymin = round(y_min - margin, 2)
                 new_ymax = round(y_max + margin, 2)
-                from kivy.animation import Animation
-                Animation(ymin=new_ymin, ymax=new_ymax, d=0.4, t="out_quad").start(self.graph)
+                if self._axis is None or self._axis.graph is not self.graph:
+                    self._axis = AxisController(self.graph)
+                self._axis.set_range(new_ymin, new_ymax)
 
-                cw = int(getattr(mgr, "chart_window", 120) or 120)
-                last_x = clean[-1][0]
-                self.graph.xmax = max(last_x, cw)
-                self.graph.xmin = max(0, self.graph.xmax - cw)
-                self._value_lbl.text = f"{clean[-1][1]:.2f} {self._unit_for_key(self.tile_key)}"
+                self.graph.xmin = t1 - span
+                self.graph.xmax = t1
+                self._value_lbl.text = f"{last_y:.2f} {self._unit_for_key(self.tile_key)}"
 
             # Header Info (MAC + RSSI)
             app = self._get_app_safe()
@@ -398,6 +423,30 @@ class EnlargedChartWindow(BoxLayout):
                 print("⚠️ Enlarged update error:", e)
                 self._stale_warned = True
                 
+    # ----------------------------------------------------
+    @staticmethod
+    def _window_columns(mgr, buf, t0, rng):
+        """
+        (xs, ys) als Store-Spalten ab t0 für MeshLinePlot.set_xy – ohne
+        Tupel-Liste und ohne Filtern. Nur wenn das Fenster keinen Sentinel
+        enthält (Minimum aus den Deques) und bis zum Redraw nichts davon
+        überschrieben werden kann (Ring nicht voll oder genug Vorlauf vor t0);
+        sonst None → gefilterte Punktliste.
+        """
+        if buf is None or rng is None or rng[0] <= INVALID_SENTINEL:
+            return None
+        store = buf.store
+        i0 = store.index_at(t0)
+        if len(store) >= store.capacity and i0 < int(getattr(mgr, "chart_window", 120) or 120):
+            return None
+        return buf.xs()[i0:], buf.ys()[i0:]
+
+    def _show_points(self, xy, clean):
+        if xy is not None:
+            self.plot.set_xy(*xy)
+        else:
+            self.plot.points = clean
+
     # ----------------------------------------------------
     def _get_app_safe(self):
         try:
@@ -492,6 +541,8 @@ class EnlargedChartWindow(BoxLayout):
                 Clock.unschedule(self._update_chart)
             except Exception:
                 pass
+            if self._axis is not None:
+                self._axis.cancel()
             parent.dismiss()
 
     # (optional) lokaler Toggle – wird aktuell nicht benutzt, da Dashboard-Handler verwendet wird
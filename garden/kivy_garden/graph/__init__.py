@@ -1,4 +1,7 @@
 # Kivy Garden Graph Init
-from .graph import Graph, MeshLinePlot
+from .graph import Graph, MeshLinePlot, LinePlot, instruction_counter
+from .mesh_plot import GlowLinePlot
+from .scheduler import RedrawScheduler, redraw_scheduler
 
-__all__ = ["Graph", "MeshLinePlot"]
+__all__ = ["Graph", "MeshLinePlot", "LinePlot", "GlowLinePlot", "instruction_counter",
+           "RedrawScheduler", "redraw_scheduler"]
@@ -3,28 +3,173 @@
 Kivy Garden Graph – Auto-Redraw Version 🌱
 © 2025 Dominik Rosenthal (Hackintosh1980)
 Reworked for live animation (no resize needed).
+Punkt-Transformation mit vorab berechneter Skala/Offset (transform.py):
+Tupel-Listen per List-Comprehension, Spalten (set_xy) mit NumPy falls
+vorhanden, Puffer je Plot.
+transform_mode: Vertices in Pixeln relativ zu x0, zur Skala des letzten
+Aufbaus; PushMatrix/Translate/Scale übernehmen den Rest. Scrollen setzt nur
+Translate, eine laufende Y-Animation nur Scale (Linienbreite dabei kurz
+mitgestreckt); neu geschrieben wird bei neuen Daten, geänderter x-Skala oder
+sobald die y-Skala einen Frame lang steht – die Linienbreite bleibt so in px.
+append_points()/trim_front(): inkrementeller Pfad – nur neue Punkte werden
+transformiert und an die Line gehängt, keine ListProperty-Events, kein
+Komplett-Redraw.
+Grid/Rahmen/Hintergrund werden gecacht und nur bei Änderung von pos, size
+oder Tick-/Grid-Einstellungen neu gesetzt (vorhandene Line-Objekte werden
+wiederverwendet); Daten-Redraws berühren nur die Plot-Anweisungen.
+instruction_counter zählt erzeugte Canvas-Anweisungen (Test-Hook).
+Plots mit create_drawings()/draw(m) (z. B. GlowLinePlot, mesh_plot.py)
+verwalten ihre Anweisungen selbst; der Graph reicht nur die Abbildung durch.
+Redraws laufen über den gemeinsamen redraw_scheduler (scheduler.py): höchstens
+einer pro Graph und Frame, innerhalb eines Frame-Budgets.
 """
 
+import time
+from collections import deque
+
 from kivy.uix.widget import Widget
 from kivy.properties import (
     ListProperty, NumericProperty, BooleanProperty,
     ObjectProperty, StringProperty
 )
-from kivy.graphics import Color, Line, Rectangle, InstructionGroup
-from kivy.clock import Clock
-
+from kivy.graphics import (
+    Color, Line, Rectangle, InstructionGroup,
+    PushMatrix, PopMatrix, Translate, Scale
+)
 from kivy.event import EventDispatcher
 
+from .transform import PointTransformer, mapping, scale_changed
+from .scheduler import redraw_scheduler
+
+
+class InstructionCounter:
+    """Test-Hook: erzeugte Canvas-Anweisungen, gesamt und pro Sekunde."""
+
+    def __init__(self, window=1.0):
+        self.window = float(window)
+        self.total = 0
+        self._events = deque()
+
+    def add(self, n=1):
+        now = time.monotonic()
+        self.total += n
+        self._events.append((now, n))
+        self._expire(now)
+
+    def per_second(self):
+        self._expire(time.monotonic())
+        return sum(n for _, n in self._events) / self.window
+
+    def reset(self):
+        self.total = 0
+        self._events.clear()
+
+    def _expire(self, now):
+        ev = self._events
+        while ev and ev[0][0] < now - self.window:
+            ev.popleft()
+
+
+instruction_counter = InstructionCounter()
+
+
 class MeshLinePlot(EventDispatcher):
+    """
+    Daten per Zuweisung an `points` (alles ersetzen), set_xy() (Spalten) oder
+    inkrementell per append_points()/trim_front(). Der aktuelle Stand steht
+    in `data`; `points` spiegelt nur die letzte Zuweisung.
+    """
     color = ListProperty([1, 1, 1, 1])
     points = ListProperty([])
 
     def __init__(self, color=(1, 1, 1, 1), points=None, **kwargs):
         super().__init__(**kwargs)
         self.color = color
-        self.points = points or []
+        self._xy = None
+        self._data = []
         self._graph_ref = None
-        self.bind(points=lambda *_: self._graph_ref and self._graph_ref._trigger_redraw())
+        self.bind(points=self._on_points)
+        self.points = points or []
+
+    def _on_points(self, *_):
+        self._xy = None
+        self._data = list(self.points)
+        if self._graph_ref:
+            self._graph_ref._plot_changed(self)
+
+    @property
+    def data(self):
+        """(x, y)-Liste des aktuellen Stands (nur lesen)."""
+        if self._xy is not None:
+            self._data = list(zip(*self._xy))
+            self._xy = None
+        return self._data
+
+    def append_points(self, pts):
+        """Punkte hinten anhängen (x aufsteigend); Kosten ~ len(pts)."""
+        if not pts:
+            return
+        self.data.extend(pts)
+        if self._graph_ref:
+            self._graph_ref._plot_appended(self, pts)
+
+    def trim_front(self, n):
+        """Die ältesten n Punkte entfernen."""
+        n = min(int(n), len(self.data))
+        if n <= 0:
+            return
+        del self._data[:n]
+        if self._graph_ref:
+            self._graph_ref._plot_trimmed(self, n)
+
+    def set_xy(self, xs, ys):
+        """
+        Daten als Spalten (array('d') / memoryview) statt Tupel-Liste –
+        schneller Pfad im Redraw. Gelesen wird erst beim Redraw: nach jeder
+        Änderung der Daten erneut aufrufen.
+        """
+        self._xy = (xs, ys)
+        if self._graph_ref:
+            self._graph_ref._plot_changed(self)
+
+    def first_x(self):
+        if self._xy is not None:
+            return self._xy[0][0] if len(self._xy[0]) else 0.0
+        return self._data[0][0] if self._data else 0.0
+
+
+class LinePlot(MeshLinePlot):
+    """Wie MeshLinePlot, mit einstellbarer Linienbreite."""
+    line_width = NumericProperty(1.2)
+
+
+class _PlotInstr:
+    """Canvas-Anweisungen + Zustand eines Plots im Graph."""
+    __slots__ = ("group", "line", "translate", "scale", "tf", "x0", "k0", "last_ky",
+                 "dirty", "mapping", "pending", "trim")
+
+    def __init__(self, color, width):
+        self.group = InstructionGroup()
+        self.group.add(Color(rgba=color))
+        self.group.add(PushMatrix())
+        self.translate = Translate(0, 0)
+        self.scale = Scale(1, 1, 1)
+        self.line = Line(points=[], width=width)
+        for instr in (self.translate, self.scale, self.line, PopMatrix()):
+            self.group.add(instr)
+        instruction_counter.add(6)
+        self.tf = PointTransformer()
+        self.x0 = 0.0
+        self.k0 = None          # transform_mode: (kx, ky) der geschriebenen Vertices
+        self.last_ky = None     # ky des letzten Redraws (Y-Animation erkennen)
+        self.dirty = True       # alles neu schreiben
+        self.mapping = None     # Abbildung der aktuellen Vertices
+        self.pending = []       # angehängte Punkte seit dem letzten Redraw
+        self.trim = 0           # vorne entfernte Punkte seit dem letzten Redraw
+
+    def reset_pending(self):
+        self.pending = []
+        self.trim = 0
 
 # -------------------------------------------------------------
 # Graph Widget
@@ -43,23 +188,46 @@ class Graph(Widget):
     x_grid = BooleanProperty(False)
     y_grid = BooleanProperty(False)
     padding = NumericProperty(10)
+    transform_mode = BooleanProperty(False)
+    redraw_priority = NumericProperty(0)    # höher = früher im Frame-Budget
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._plots = []
         self._mesh_instr = {}
-        self._trigger_redraw = Clock.create_trigger(self._redraw)
+        self._own_instr = {}        # selbstzeichnende Plots → InstructionGroup
+        self._frame_key = None      # Stand von Hintergrund/Rahmen/Grid
+        self._grid_lines = ([], [])  # wiederverwendete Grid-Lines (x, y)
 
         with self.canvas.before:
             self._bg = Color(rgba=self.background_color)
             self._rect = Rectangle(pos=self.pos, size=self.size)
+            self._grid_c = Color(rgba=self.tick_color)
+        self._grid = InstructionGroup()
+        self.canvas.before.add(self._grid)
         with self.canvas.after:
             self._border_c = Color(rgba=self.border_color)
             self._border = Line(rectangle=(0, 0, 0, 0), width=1)
+        instruction_counter.add(5)
 
         self.bind(pos=self._trigger_redraw, size=self._trigger_redraw)
-        self.bind(xmin=self._trigger_redraw, xmax=self._trigger_redraw,
-                  ymin=self._trigger_redraw, ymax=self._trigger_redraw)
+        # Rahmen/Grid-Einstellungen → Geometrie neu, sonst bleibt sie gecacht
+        self.bind(padding=self._trigger_redraw, draw_border=self._trigger_redraw,
+                  x_grid=self._trigger_redraw, y_grid=self._trigger_redraw,
+                  x_ticks_major=self._trigger_redraw, y_ticks_major=self._trigger_redraw,
+                  tick_color=self._trigger_redraw, border_color=self._trigger_redraw,
+                  background_color=self._trigger_redraw)
+        # Achsen betreffen nur die Plots, nicht Hintergrund/Rahmen/Grid
+        self.bind(xmin=self._trigger_plots, xmax=self._trigger_plots,
+                  ymin=self._trigger_plots, ymax=self._trigger_plots)
+        self.bind(transform_mode=self._on_transform_mode)
+
+    # ---------------------------------------------------------
+    def _trigger_redraw(self, *_):
+        redraw_scheduler.request(self, full=True)
+
+    def _trigger_plots(self, *_):
+        redraw_scheduler.request(self)
 
     # ---------------------------------------------------------
     def add_plot(self, plot):
@@ -67,27 +235,65 @@ class Graph(Widget):
             return
         self._plots.append(plot)
         plot._graph_ref = self
-        instr = InstructionGroup()
-        instr.add(Color(rgba=plot.color))
-        line = Line(points=[], width=1.2)
-        instr.add(line)
-        self.canvas.add(instr)
-        self._mesh_instr[plot] = (instr, line)
+        if hasattr(plot, "create_drawings"):
+            group = self._own_instr[plot] = plot.create_drawings()
+        else:
+            pi = self._mesh_instr[plot] = _PlotInstr(plot.color, getattr(plot, "line_width", 1.2))
+            group = pi.group
+        self.canvas.add(group)
         self._trigger_redraw()
 
     def remove_plot(self, plot):
         if plot in self._plots:
-            self.canvas.remove(self._mesh_instr[plot][0])
-            del self._mesh_instr[plot]
+            group = self._own_instr.pop(plot, None)
+            if group is None:
+                group = self._mesh_instr.pop(plot).group
+            self.canvas.remove(group)
             self._plots.remove(plot)
             plot._graph_ref = None
             self._trigger_redraw()
 
+    def _plot_changed(self, plot):
+        pi = self._mesh_instr.get(plot)
+        if pi is not None:
+            pi.dirty = True
+            pi.reset_pending()
+        self._trigger_plots()
+
+    def _plot_appended(self, plot, pts):
+        pi = self._mesh_instr.get(plot)
+        if pi is not None and not pi.dirty:
+            pi.pending.extend(pts)
+        self._trigger_plots()
+
+    def _plot_trimmed(self, plot, n):
+        pi = self._mesh_instr.get(plot)
+        if pi is not None and not pi.dirty:
+            pi.trim += n
+        self._trigger_plots()
+
+    def _on_transform_mode(self, *_):
+        for pi in self._mesh_instr.values():
+            pi.k0 = None
+            pi.translate.x = pi.translate.y = 0
+            pi.scale.x = pi.scale.y = 1
+            pi.dirty = True
+        self._trigger_plots()
+
     # ---------------------------------------------------------
     def _redraw(self, *_):
         if not self.get_parent_window():
             return
+        key = (tuple(self.pos), tuple(self.size), self.padding, self.draw_border,
+               self.x_grid, self.y_grid, int(self.x_ticks_major), int(self.y_ticks_major),
+               tuple(self.tick_color), tuple(self.border_color), tuple(self.background_color))
+        if key != self._frame_key:
+            self._frame_key = key
+            self._redraw_frame()
+        self._redraw_plots()
 
+    def _redraw_frame(self):
+        """Hintergrund, Rahmen, Grid – nur bei geänderter Geometrie/Einstellung."""
         x, y = self.pos
         w, h = self.size
         pad = self.padding
@@ -96,6 +302,7 @@ class Graph(Widget):
 
         self._bg.rgba = self.background_color
         self._border_c.rgba = self.border_color
+        self._grid_c.rgba = self.tick_color
         self._rect.pos, self._rect.size = self.pos, self.size
 
         if self.draw_border:
@@ -104,31 +311,114 @@ class Graph(Widget):
             self._border.rectangle = (0, 0, 0, 0)
 
         # Grid (optional)
-        self.canvas.remove_group("grid")
-        if self.x_grid:
-            with self.canvas:
-                Color(*self.tick_color)
-                for i in range(1, self.x_ticks_major):
-                    xx = gx + (gw / self.x_ticks_major) * i
-                    Line(points=[xx, y + pad, xx, y + h - pad], group="grid")
-        if self.y_grid:
-            with self.canvas:
-                Color(*self.tick_color)
-                for i in range(1, self.y_ticks_major):
-                    yy = gy + (gh / self.y_ticks_major) * i
-                    Line(points=[x + pad, yy, x + w - pad, yy], group="grid")
-
-        # Draw plots
+        nx = max(0, int(self.x_ticks_major) - 1) if self.x_grid else 0
+        ny = max(0, int(self.y_ticks_major) - 1) if self.y_grid else 0
+        xs, ys = self._grid_lines
+        self._fit_lines(xs, nx)
+        self._fit_lines(ys, ny)
+        for i, line in enumerate(xs, 1):
+            xx = gx + (gw / self.x_ticks_major) * i
+            line.points = [xx, gy, xx, gy + gh]
+        for i, line in enumerate(ys, 1):
+            yy = gy + (gh / self.y_ticks_major) * i
+            line.points = [gx, yy, gx + gw, yy]
+
+    def _fit_lines(self, lines, n):
+        """Line-Pool auf n Einträge bringen; nur fehlende werden erzeugt."""
+        while len(lines) > n:
+            self._grid.remove(lines.pop())
+        if len(lines) < n:
+            instruction_counter.add(n - len(lines))
+        while len(lines) < n:
+            line = Line(points=[])
+            self._grid.add(line)
+            lines.append(line)
+
+    def _redraw_plots(self, *_):
+        if not self.get_parent_window():
+            return
+        pad = self.padding
+        m = mapping(self.xmin, self.xmax, self.ymin, self.ymax,
+                    self.x + pad, self.y + pad, self.width - 2 * pad, self.height - 2 * pad)
+        settle = False
         for plot in self._plots:
-            pts = []
-            for px, py in plot.points:
-                if self.xmax == self.xmin or self.ymax == self.ymin:
-                    continue
-                sx = gx + ((px - self.xmin) / (self.xmax - self.xmin)) * gw
-                sy = gy + ((py - self.ymin) / (self.ymax - self.ymin)) * gh
-                pts.extend((sx, sy))
-            _, line = self._mesh_instr[plot]
-            line.points = pts
+            if plot in self._own_instr:
+                plot.draw(m)
+                continue
+            pi = self._mesh_instr[plot]
+            if m is None:
+                pi.line.points = []
+                pi.dirty = True
+                continue
+            kx, ox, ky, oy = m
+            if self.transform_mode:
+                # Vertices in px zur Skala k0; Achsen → nur die Matrix
+                k0 = pi.k0
+                if pi.dirty or k0 is None or scale_changed(kx, k0[0]) \
+                        or self._rebase_due(plot, pi):
+                    pi.dirty = True
+                elif scale_changed(ky, k0[1]):
+                    if pi.last_ky is not None and not scale_changed(ky, pi.last_ky):
+                        pi.dirty = True         # y-Skala steht → exakt neu schreiben
+                    else:
+                        settle = True           # Y-Animation läuft: nur Scale.y
+                pi.last_ky = ky
+                if pi.dirty:
+                    pi.x0 = plot.first_x()
+                    k0 = pi.k0 = (kx, ky)
+                    pi.line.points = self._vertices(plot, pi, kx, -pi.x0 * kx, ky, 0.0)
+                elif pi.pending or pi.trim:
+                    self._apply_pending(pi, k0[0], -pi.x0 * k0[0], k0[1], 0.0)
+                pi.translate.x = ox + pi.x0 * kx
+                pi.translate.y = oy
+                pi.scale.x = kx / k0[0]
+                pi.scale.y = ky / k0[1]
+            elif pi.dirty or pi.mapping != m:
+                pi.line.points = self._vertices(plot, pi, kx, ox, ky, oy)
+            elif pi.pending or pi.trim:
+                # Achsen unverändert → nur neue Punkte abbilden
+                self._apply_pending(pi, kx, ox, ky, oy)
+            pi.dirty = False
+            pi.mapping = m
+            pi.reset_pending()
+        if settle:
+            # Folge-Frame prüft, ob die y-Skala steht, und schreibt dann exakt
+            self._trigger_plots()
+
+    @staticmethod
+    def _apply_pending(pi, kx, ox, ky, oy):
+        """
+        Vorne trim Punkte abschneiden, hinten pending anhängen. Python-seitig
+        nur ~ Anzahl neuer Punkte; Line kopiert die Liste einmal (C-Ebene).
+        """
+        pts = pi.line.points
+        drop = pi.trim
+        if drop:
+            drawn = len(pts) // 2
+            if drop >= drawn:
+                # auch noch nicht gezeichnete Punkte können schon wieder raus sein
+                del pts[:]
+                del pi.pending[:drop - drawn]
+            else:
+                del pts[:2 * drop]
+        if pi.pending:
+            pts.extend(pi.tf.affine(pi.pending, kx, ox, ky, oy))
+        pi.line.points = pts
+
+    @staticmethod
+    def _rebase_due(plot, pi):
+        # Offsets relativ zu x0 wachsen beim Anhängen; Vertices sind float32 →
+        # neu verankern, sobald x0 weiter zurückliegt als die Datenbreite
+        data = plot._data
+        if not data or plot._xy is not None:
+            return False
+        return data[0][0] - pi.x0 > data[-1][0] - data[0][0]
+
+    @staticmethod
+    def _vertices(plot, pi, kx, ox, ky, oy):
+        if plot._xy is not None:
+            return pi.tf.affine_xy(*plot._xy, kx, ox, ky, oy)
+        return pi.tf.affine(plot._data, kx, ox, ky, oy)
 
     # Manuelles Triggern (für externe Calls)
     def refresh(self):
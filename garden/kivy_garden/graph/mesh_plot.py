@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+"""
+Kivy Garden Graph – GlowLinePlot 🌱
+© 2025 Dominik Rosenthal (Hackintosh1980)
+Linie + weicher Schatten in EINEM Mesh (triangle_strip) → ein Draw-Call pro
+Plot statt Line + zweiter Schatten-Line.
+• Pro Datenpunkt zwei Vertices (± Normale · halbe Bandbreite); das Querprofil
+  (Kern in Plotfarbe, dunkler, auslaufender Saum) liefert eine kleine
+  Verlaufs-Textur
+• Vertex-/Index-Puffer (array('f') / array('H')) einmal für `capacity`
+  Punkte angelegt und wiederverwendet; wachsen nur, wenn das Fenster mehr
+  Punkte braucht
+• Vertices in Pixeln relativ zu x0 (x) bzw. zur y-Skala des letzten Aufbaus
+  (y): Scrollen der x-Achse setzt nur Translate, eine laufende y-Animation
+  nur Scale.y (Normalen dabei kurz mitgestreckt); neu gerechnet wird erst,
+  wenn die y-Skala einen Frame lang steht, oder bei geänderter x-Skala
+  (Größe, Zeitfenster)
+• append_points()/trim_front() schreiben nur die Vertices der neuen Punkte
+• Mehr als MAX_POINTS Punkte (16-Bit-Indizes): jeder k-te Punkt, gezählt
+  über einen absoluten Index → auch ausgedünnt inkrementell; der rechte Rand
+  hinkt dann bis zu k−1 Samples hinterher
+"""
+
+from array import array
+from math import hypot
+
+from kivy.graphics import (
+    Color, Mesh, InstructionGroup, PushMatrix, PopMatrix, Translate, Scale
+)
+from kivy.properties import NumericProperty
+
+from .graph import MeshLinePlot, instruction_counter
+from .transform import scale_changed as _changed
+
+MAX_POINTS = 32767      # 2 Vertices pro Punkt, Indizes sind unsigned short
+STRIDE = 4              # Floats pro Vertex: x, y, u, v
+PROFILE = 64            # Texel im Querprofil
+SHADOW_ALPHA = 0.25     # Deckkraft des Saums direkt am Kern
+
+_textures = {}
+
+
+def _profile_texture(core, glow):
+    """Querprofil: Kern weiß (per Color eingefärbt), Saum schwarz auslaufend."""
+    key = (round(core, 2), round(glow, 2))
+    tex = _textures.get(key)
+    if tex is None:
+        from kivy.graphics.texture import Texture
+        half = core / 2 + glow
+        edge = core / 2 / half if half > 0 else 1.0
+        buf = bytearray()
+        for i in range(PROFILE):
+            d = abs((i + 0.5) / PROFILE * 2 - 1)    # 0 = Mitte, 1 = Rand
+            if d <= edge:
+                buf += b"\xff\xff\xff\xff"
+            else:
+                a = SHADOW_ALPHA * (1 - (d - edge) / (1 - edge)) ** 2
+                buf += bytes((0, 0, 0, int(255 * a)))
+        tex = Texture.create(size=(1, PROFILE), colorfmt="rgba")
+        tex.blit_buffer(bytes(buf), colorfmt="rgba", bufferfmt="ubyte")
+        tex.wrap = "clamp_to_edge"
+        _textures[key] = tex
+    return tex
+
+
+class GlowLinePlot(MeshLinePlot):
+    """
+    Drop-in für LinePlot (color, points, line_width, append_points,
+    trim_front); zeichnet sich selbst über create_drawings()/draw().
+    """
+    line_width = NumericProperty(3.0)   # Kern in px
+    glow_width = NumericProperty(3.0)   # Saum je Seite in px
+    capacity = NumericProperty(2048)    # vorab reservierte Punkte
+
+    def __init__(self, **kwargs):
+        self._group = None
+        self._dirty = True
+        super().__init__(**kwargs)
+        self._s = 0             # erster Live-Punkt im Puffer
+        self._n = 0             # Live-Punkte im Puffer
+        self._thin = 1          # k: gezeichnet wird jeder Punkt mit abs. Index % k == 0
+        self._abs0 = 0          # absoluter Index von data[0]
+        self._len = 0           # len(data) beim letzten draw()
+        self._x0 = 0.0
+        self._scale = None      # (kx, ky) der geschriebenen Vertices
+        self._last_ky = None    # ky des letzten draw() (Animation erkennen)
+        self._added = 0         # seit draw() angehängte Punkte
+        self._trim = 0          # seit draw() vorne entfernte Punkte
+        self._buffers_ok = True
+        self._alloc(int(self.capacity))
+        self.bind(capacity=self._on_capacity,
+                  line_width=self._on_width, glow_width=self._on_width)
+
+    # ---------------------------------------------------------
+    # Daten
+    # ---------------------------------------------------------
+    def _on_points(self, *_):
+        self._dirty = True
+        super()._on_points()
+
+    def set_xy(self, xs, ys):
+        self._dirty = True
+        super().set_xy(xs, ys)
+
+    def append_points(self, pts):
+        self._added += len(pts)
+        super().append_points(pts)
+
+    def trim_front(self, n):
+        self._trim += max(0, min(int(n), len(self.data)))
+        super().trim_front(n)
+
+    # ---------------------------------------------------------
+    # Puffer
+    # ---------------------------------------------------------
+    def _alloc(self, capacity):
+        """Puffer für 2 × capacity Punkte: Platz zum Anhängen vor dem Kompaktieren."""
+        self._cap = max(16, min(MAX_POINTS, capacity))
+        size = 2 * self._cap
+        # u/v stehen fest: obere Kante v = 1, untere v = 0
+        self._verts = array("f", (0.0, 0.0, 0.5, 1.0, 0.0, 0.0, 0.5, 0.0) * size)
+        self._idx = array("H", range(2 * self._cap))
+        self._s = self._n = 0
+        self._dirty = True
+
+    def _on_capacity(self, *_):
+        if min(MAX_POINTS, int(self.capacity)) != self._cap:
+            self._alloc(int(self.capacity))
+            self._redraw_graph()
+
+    def _on_width(self, *_):
+        self._dirty = True
+        if self._group is not None:
+            self._mesh.texture = _profile_texture(self.line_width, self.glow_width)
+        self._redraw_graph()
+
+    def _redraw_graph(self):
+        if self._graph_ref:
+            self._graph_ref._plot_changed(self)
+
+    # ---------------------------------------------------------
+    # Zeichnen (von Graph._redraw_plots aufgerufen)
+    # ---------------------------------------------------------
+    def create_drawings(self):
+        self._group = InstructionGroup()
+        self._mesh = Mesh(mode="triangle_strip",
+                          texture=_profile_texture(self.line_width, self.glow_width))
+        self._translate = Translate(0, 0)
+        self._yscale = Scale(1, 1, 1)
+        for instr in (Color(rgba=self.color), PushMatrix(), self._translate,
+                      self._yscale, self._mesh, PopMatrix()):
+            self._group.add(instr)
+        instruction_counter.add(6)
+        self._dirty = True
+        return self._group
+
+    def draw(self, m):
+        """m = (kx, ox, ky, oy) aus transform.mapping(); None → nichts zeichnen."""
+        if m is None:
+            self._n = 0
+            self._upload()
+            self._dirty = True
+            return
+        kx, ox, ky, oy = m
+        sc = self._scale
+        settle = False
+        if sc is None or _changed(kx, sc[0]):
+            self._dirty = True
+        elif _changed(ky, sc[1]):
+            if self._last_ky is not None and not _changed(ky, self._last_ky):
+                self._dirty = True          # y-Skala steht → exakt neu aufbauen
+            else:
+                settle = True               # y-Animation läuft: nur Scale.y
+        self._last_ky = ky
+        data = self.data
+        if self._dirty or not self._advance(data):
+            self._rebuild(data, kx, ky)
+        self._added = self._trim = 0
+        self._len = len(data)
+        self._translate.x = ox + self._x0 * kx
+        self._translate.y = oy
+        self._yscale.y = ky / self._scale[1]
+        if settle and self._graph_ref:
+            # Folge-Frame prüft, ob die y-Skala steht, und baut dann exakt auf
+            self._graph_ref._trigger_plots()
+
+    def _rebuild(self, data, kx, ky):
+        n = len(data)
+        if n > self._cap and self._cap < MAX_POINTS:
+            self._alloc(n + n // 2)
+        # ausgedünnt mit 25 % Reserve, damit k nicht bei jedem Batch kippt
+        self._thin = k = -(-(n + n // 4) // self._cap) if n > self._cap else 1
+        self._abs0 = 0
+        self._x0 = data[0][0] if n else 0.0
+        self._scale = (kx, ky)
+        self._s, self._n = 0, -(-n // k)
+        self._write(data, 0, 0, self._n, 0, self._n)
+        self._dirty = False
+        self._upload()
+
+    def _advance(self, data):
+        """Nur trim/append nachziehen; False → Vollaufbau nötig."""
+        if not (self._added or self._trim):
+            return True
+        n, k = len(data), self._thin
+        if self._len - self._trim + self._added != n:
+            return False
+        need = -(-n // self._cap) if n > self._cap else 1
+        if need > k or (k > 1 and need <= k // 2):
+            return False                    # Ausdünnung passt nicht mehr
+        abs0 = self._abs0 + self._trim
+        first_old = -(-self._abs0 // k) * k     # erster gezeichneter abs. Index
+        first = -(-abs0 // k) * k
+        keep = self._n - (first - first_old) // k
+        count = (-(-(abs0 + n) // k) * k - first) // k
+        if keep <= 0 or count < keep:
+            return False
+        self._s += self._n - keep
+        self._abs0 = abs0
+        if self._s + count > 2 * self._cap:
+            # Live-Bereich an den Pufferanfang schieben (amortisiert O(1))
+            w = 2 * STRIDE
+            mv = memoryview(self._verts)
+            mv[:keep * w] = mv[self._s * w:(self._s + keep) * w]
+            self._s = 0
+        j0 = first - abs0
+        # Erster Punkt (Normale einseitig) und Übergang alt → neu
+        if self._trim:
+            self._write(data, j0, 0, 1, self._s, count)
+        lo = max(0, keep - 1)
+        self._write(data, j0, lo, count, self._s + lo, count)
+        self._n = count
+        self._upload()
+        return True
+
+    def _write(self, data, j0, lo, hi, at, count):
+        """
+        Vertices der gezeichneten Punkte lo..hi−1 (Datenindex j0 + d·k) ab
+        Pufferpunkt `at` schreiben (nur x/y). y relativ zur Skala des Aufbaus.
+        """
+        v = self._verts
+        k = self._thin
+        kx, ky = self._scale
+        hw = self.line_width / 2 + self.glow_width
+        x0 = self._x0
+        j = at * 2 * STRIDE
+        for d in range(lo, hi):
+            i = j0 + d * k
+            px, py = data[i]
+            ax, ay = data[i - k] if d > 0 else data[i]
+            bx, by = data[i + k] if d < count - 1 else data[i]
+            dx, dy = (bx - ax) * kx, (by - ay) * ky
+            n = hypot(dx, dy) or 1.0
+            nx, ny = -dy / n * hw, dx / n * hw
+            sx, sy = (px - x0) * kx, py * ky
+            v[j] = sx + nx
+            v[j + 1] = sy + ny
+            v[j + 4] = sx - nx
+            v[j + 5] = sy - ny
+            j += 2 * STRIDE
+
+    def _upload(self):
+        if self._group is None:
+            return
+        w = 2 * STRIDE
+        verts = memoryview(self._verts)[self._s * w:(self._s + self._n) * w]
+        idx = memoryview(self._idx)[:2 * self._n]
+        if self._buffers_ok:
+            try:
+                self._mesh.vertices = verts
+                self._mesh.indices = idx
+                return
+            except (TypeError, ValueError):
+                # ältere Kivy-Versionen nehmen nur Listen
+                self._buffers_ok = False
+        self._mesh.vertices = verts.tolist()
+        self._mesh.indices = idx.tolist()
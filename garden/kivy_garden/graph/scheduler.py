@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+Kivy Garden Graph – Redraw-Koordinator 🌱
+© 2025 Dominik Rosenthal (Hackintosh1980)
+Ein gemeinsamer Frame-Takt für alle Graphen (Dashboard-Kacheln, Enlarged,
+Scatter) statt je zwei Clock-Triggern pro Graph:
+• request(graph, full) merkt den Graphen vor – pos/size/Achsen/Punkte im
+  selben Frame ergeben einen einzigen Redraw (full schließt Plots ein)
+• Pro Frame höchstens ein Redraw je Graph, abgearbeitet bis das Budget
+  (budget, s) verbraucht ist; der Rest bleibt für den nächsten Frame stehen
+• Reihenfolge: sichtbar im vordersten Fenster → Graph in einem
+  Hintergrund-Fenster (z. B. Dashboard unter dem Enlarged-Popup) →
+  versteckt (opacity 0, disabled, Größe 0); innerhalb gleicher Stufe höhere
+  Graph.redraw_priority zuerst
+• Zurückgestellte Graphen altern: nach MAX_DEFER Frames sind sie vorn dran
+• Mindestens ein Graph pro Frame, Clock-Event nur solange etwas ansteht
+"""
+
+import time
+
+from kivy.clock import Clock
+
+FRAME_BUDGET = 0.008    # s Redraw-Zeit pro Frame
+MAX_DEFER = 30          # Frames, nach denen ein zurückgestellter Graph Vorrang bekommt
+
+FOREGROUND, BACKGROUND, HIDDEN = 0, 1, 2
+
+
+def _tier(graph):
+    """Sichtbarkeitsstufe: Widget-Kette nach oben bis zum Fenster prüfen."""
+    if graph.width <= 1 or graph.height <= 1:
+        return HIDDEN
+    win = graph.get_root_window()
+    w = top = graph
+    while w is not None and w is not win:
+        if getattr(w, "opacity", 1) <= 0 or getattr(w, "disabled", False):
+            return HIDDEN
+        top, w = w, w.parent
+    if win is not None and win.children and win.children[0] is not top:
+        return BACKGROUND
+    return FOREGROUND
+
+
+class RedrawScheduler:
+    def __init__(self, budget=FRAME_BUDGET):
+        self.budget = float(budget)
+        self._dirty = {}        # graph → [full, seit Frames zurückgestellt, Reihenfolge]
+        self._order = 0
+        self._event = None
+        self.frames = 0         # Frames mit Redraws
+        self.deferred = 0       # insgesamt zurückgestellte Redraws
+        self.last_ms = 0.0      # Redraw-Zeit des letzten Frames
+
+    def request(self, graph, full=False):
+        entry = self._dirty.get(graph)
+        if entry is None:
+            self._order += 1
+            self._dirty[graph] = [full, 0, self._order]
+        elif full:
+            entry[0] = True
+        if self._event is None:
+            self._event = Clock.schedule_once(self._run, 0)
+
+    def discard(self, graph):
+        self._dirty.pop(graph, None)
+
+    def _key(self, item):
+        graph, (_, age, order) = item
+        tier = FOREGROUND if age >= MAX_DEFER else _tier(graph)
+        return tier, -getattr(graph, "redraw_priority", 0), order
+
+    def _run(self, *_):
+        self._event = None
+        if not self._dirty:
+            return
+        queue = sorted(self._dirty.items(), key=self._key)
+        self._dirty = {}
+        t0 = time.perf_counter()
+        done = 0
+        for graph, entry in queue:
+            if done and time.perf_counter() - t0 >= self.budget:
+                # nächster Frame; was inzwischen neu angefragt wurde, zusammenführen
+                entry[1] += 1
+                new = self._dirty.get(graph)
+                if new is not None:
+                    entry[0] = entry[0] or new[0]
+                self._dirty[graph] = entry
+                self.deferred += 1
+                continue
+            try:
+                if entry[0]:
+                    graph._redraw()
+                else:
+                    graph._redraw_plots()
+            except ReferenceError:
+                pass
+            except Exception as e:
+                # ein fehlerhafter Graph darf die übrigen nicht blockieren
+                print(f"⚠️ Graph-Redraw-Fehler ({type(graph).__name__}): {e}")
+            done += 1
+        self.frames += 1
+        self.last_ms = (time.perf_counter() - t0) * 1000
+        if self._dirty and self._event is None:
+            self._event = Clock.schedule_once(self._run, 0)
+
+
+redraw_scheduler = RedrawScheduler()
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+Kivy Garden Graph – Punkt-Transformation 🌱
+Datenkoordinaten (px, py) → flache Bildschirm-Liste [sx0, sy0, sx1, sy1, …]
+• Skala und Offset werden einmal pro Redraw berechnet, nicht pro Punkt
+• (px, py)-Liste: je eine List-Comprehension für x und y, per
+  Slice-Zuweisung in die flache Liste verschränkt – keine Division, kein
+  Index-Schreiben pro Wert; schneller als np.fromiter über die Tupel
+• transform_xy(): Spalten (xs, ys) mit Buffer-Protokoll (array('d'),
+  memoryview) – mit NumPy ohne Kopie der Eingabe in einen wiederverwendeten
+  Puffer (Ergebnis: memoryview, gültig bis zum nächsten Aufruf; Line.points
+  kopiert beim Setzen), ohne NumPy wie oben per Comprehension
+• Ohne kivy-Import → auch im Benchmark nutzbar (test/bench_graph.py)
+© 2025 Dominik Rosenthal (Hackintosh1980)
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _grow(n):
+    """Pufferkapazität in Punkten: 1.5× Reserve, damit Wachsen selten neu alloziert."""
+    return max(64, n + n // 2)
+
+
+SCALE_TOL = 1e-6        # relative Skalenänderung, ab der neu gerechnet wird
+
+
+def scale_changed(a, b):
+    return abs(a - b) > abs(b) * SCALE_TOL
+
+
+def mapping(xmin, xmax, ymin, ymax, gx, gy, gw, gh):
+    """(kx, ox, ky, oy) mit screen = data · k + o; None bei degenerierter Achse."""
+    if xmax == xmin or ymax == ymin:
+        return None
+    kx = gw / (xmax - xmin)
+    ky = gh / (ymax - ymin)
+    return kx, gx - xmin * kx, ky, gy - ymin * ky
+
+
+class PointTransformer:
+    """Ein Puffer pro Plot; wächst bei Bedarf, wird sonst wiederverwendet."""
+
+    __slots__ = ("use_numpy", "_buf")
+
+    def __init__(self, use_numpy=None):
+        self.use_numpy = (np is not None) if use_numpy is None else bool(use_numpy and np is not None)
+        self._buf = None
+
+    def transform(self, points, xmin, xmax, ymin, ymax, gx, gy, gw, gh):
+        """
+        Liefert eine flache Liste für Line.points. Leeres Ergebnis bei
+        degeneriertem Achsenbereich.
+        """
+        m = mapping(xmin, xmax, ymin, ymax, gx, gy, gw, gh)
+        return self.affine(points, *m) if m else []
+
+    def transform_xy(self, xs, ys, xmin, xmax, ymin, ymax, gx, gy, gw, gh):
+        """
+        Wie transform(), aber mit getrennten x/y-Spalten gleicher Länge
+        (mit NumPy: memoryview auf den Plot-Puffer).
+        """
+        m = mapping(xmin, xmax, ymin, ymax, gx, gy, gw, gh)
+        return self.affine_xy(xs, ys, *m) if m else []
+
+    def affine(self, points, kx, ox, ky, oy):
+        """(px, py)-Liste → flach [px·kx + ox, py·ky + oy, …]."""
+        n = len(points)
+        if not n:
+            return []
+        # Tupel-Liste: Comprehensions schlagen hier auch NumPy (fromiter)
+        out = [0.0] * (2 * n)
+        out[0::2] = [px * kx + ox for px, _ in points]
+        out[1::2] = [py * ky + oy for _, py in points]
+        return out
+
+    def affine_xy(self, xs, ys, kx, ox, ky, oy):
+        n = min(len(xs), len(ys))
+        if not n:
+            return []
+        if self.use_numpy:
+            out = self._out(n)
+            self._np_affine(np.frombuffer(xs, dtype=np.float64, count=n),
+                            np.frombuffer(ys, dtype=np.float64, count=n),
+                            out, kx, ox, ky, oy)
+            return out.data
+        out = [0.0] * (2 * n)
+        out[0::2] = [x * kx + ox for x in xs[:n]]
+        out[1::2] = [y * ky + oy for y in ys[:n]]
+        return out
+
+    @staticmethod
+    def _np_affine(xs, ys, out, kx, ox, ky, oy):
+        np.multiply(xs, kx, out=out[0::2])
+        out[0::2] += ox
+        np.multiply(ys, ky, out=out[1::2])
+        out[1::2] += oy
+
+    def _out(self, n):
+        buf = self._buf
+        if buf is None or len(buf) < 2 * n:
+            buf = self._buf = np.empty(2 * _grow(n))
+        return buf[:2 * n]
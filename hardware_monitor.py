@@ -7,10 +7,11 @@ hardware_monitor.py – Watchdog v3 (stabil)
 © 2025 Dominik Rosenthal (Hackintosh1980)
 """
 
-import os, io, json, time
+import time
 from kivy.clock import Clock
 from kivy.utils import platform
 from dashboard_charts import APP_JSON
+import ble_snapshot
 
 class HardwareMonitor:
     def __init__(self, poll_interval=5.0, stale_seconds=10.0, clear_at_start=True):
@@ -25,6 +26,8 @@ class HardwareMonitor:
         self._running = False
         self._stale_triggered = False  # Marker: JSON wurde schon geleert für aktuellen Abriss
         self._suspend_logged = False
+        self._snapshots = ble_snapshot.get_reader(APP_JSON)
+        self._last_snap_key = None
 
         # Einmaliger Reset beim Start
         if clear_at_start:
@@ -110,18 +113,14 @@ class HardwareMonitor:
         if getattr(self, "suspend_clear", False):
             return
         try:
-            if not os.path.exists(APP_JSON):
+            snap = self._snapshots.get()
+            if snap.stat_key is not None and snap.stat_key == self._last_snap_key:
+                return   # gleiche Generation → nichts Neues
+            self._last_snap_key = snap.stat_key
+            d = snap.first
+            if d is None:
                 return
-            with open(APP_JSON, "r", encoding="utf-8") as f:
-                raw = f.read().strip()
-            if not raw:
-                return
-
-            data = json.loads(raw)
-            if not isinstance(data, list) or not data:
-                return
-            d = data[0]
-            pkt = d.get("packet_counter") or d.get("pkt") or d.get("counter")
+            pkt = d.get("packet_counter")
 
             if pkt is not None:
                 try:
@@ -147,9 +146,7 @@ class HardwareMonitor:
     # -------------------------------------------------------
     def clear_ble_json(self):
         try:
-            os.makedirs(os.path.dirname(APP_JSON), exist_ok=True)
-            with io.open(APP_JSON, "w", encoding="utf-8") as f:
-                f.write("[]")
+            ble_snapshot.write_atomic(APP_JSON, "[]")
             print(f"🧹 APP_JSON geleert: {APP_JSON}")
             self.last_packet_counter = None
         except Exception as e:
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ingest_worker.py – Hintergrund-Ingest für den ChartManager
+• Worker-Thread erledigt Datei-I/O, Parsing, VPD- und Einheiten-Rechnung
+• Ergebnis (IngestBundle) wird per Clock.schedule_once an die UI übergeben;
+  der Main-Thread setzt nur noch Labels und Plot-Punkte
+• Mehrere Anforderungen während eines laufenden Builds werden zusammengefasst
+• TickTimer misst die Main-Thread-Zeit pro Tick (Ø / max, periodisch geloggt)
+© 2025 Dominik Rosenthal (Hackintosh1980)
+"""
+
+import time, threading
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional
+
+from kivy.clock import Clock
+
+
+# -------------------------------------------------------
+# 📦 Ergebnis eines Ingest-Durchlaufs
+# -------------------------------------------------------
+class IngestBundle(NamedTuple):
+    snap: Any                              # ble_snapshot.Snapshot
+    device: Optional[Mapping[str, Any]]    # aktives Gerät oder None
+    fresh: bool                            # neuer Stand → rendern
+    values: List[Dict[str, float]]         # fertige Zeilen (ts + Spalten), je Sample
+    last: Optional[Mapping[str, Any]]      # Rohwerte des letzten Samples (Scatter)
+
+
+# -------------------------------------------------------
+# 🧵 Worker
+# -------------------------------------------------------
+class IngestWorker(threading.Thread):
+    """
+    build() läuft im Worker, deliver(bundle) per Clock im Main-Thread.
+    request() ist billig und darf beliebig oft aufgerufen werden.
+    """
+
+    def __init__(self, build: Callable[[], Optional[IngestBundle]],
+                 deliver: Callable[[IngestBundle], None]):
+        super().__init__(daemon=True, name="IngestWorker")
+        self.build = build
+        self.deliver = deliver
+        self._wake = threading.Event()
+        self._alive = True
+
+    def request(self) -> None:
+        self._wake.set()
+
+    def run(self) -> None:
+        while self._alive:
+            self._wake.wait()
+            self._wake.clear()
+            if not self._alive:
+                break
+            try:
+                bundle = self.build()
+            except Exception as e:
+                print("⚠️ Ingest-Worker-Fehler:", e)
+                continue
+            if bundle is not None:
+                Clock.schedule_once(lambda dt, b=bundle: self.deliver(b))
+
+    def stop(self) -> None:
+        self._alive = False
+        self._wake.set()
+
+
+# -------------------------------------------------------
+# ⏱ Main-Thread-Messung
+# -------------------------------------------------------
+class TickTimer:
+    """Context-Manager; summiert Laufzeiten und loggt alle `every` Ticks."""
+
+    def __init__(self, label: str, enabled: bool = False, every: int = 50):
+        self.label = label
+        self.enabled = enabled
+        self.every = max(1, int(every))
+        self._reset()
+
+    def _reset(self) -> None:
+        self.n = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def __enter__(self):
+        if self.enabled:
+            self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        if self.enabled:
+            dt = time.perf_counter() - self._t0
+            self.n += 1
+            self.total += dt
+            self.max = max(self.max, dt)
+            if self.n >= self.every:
+                print(f"⏱ {self.label}: Ø {self.total / self.n * 1000:.2f} ms, "
+                      f"max {self.max * 1000:.2f} ms über {self.n} Ticks")
+                self._reset()
+        return False
@@ -9,7 +9,7 @@ VIVOSUN Ultimate – Main App (stable + clean watchdog)
 • Main kümmert sich nur um UI-Updates, MAC/RSSI-Sync und Navigation
 """
 
-import os, json, time
+import os, time
 from kivy.app import App
 from kivy.clock import Clock
 from kivy.core.window import Window
@@ -26,7 +26,7 @@ from settings_screen import SettingsScreen
 from vpd_scatter_window_full import VPDScatterWindow
 from enlarged_chart_window import EnlargedChartWindow
 from permission_fix import check_permissions
-import config
+import config, ble_snapshot
 
 
 # -------------------------------------------------------
@@ -150,16 +150,12 @@ class VivosunApp(App):
             # 🔍 MAC-Ermittlung
             # ------------------------------------------------
             mac = getattr(self, "current_mac", None)
-            if not mac and os.path.exists(APP_JSON):
-                try:
-                    with open(APP_JSON, "r") as f:
-                        data = json.load(f)
-                    if isinstance(data, list) and data:
-                        mac = data[0].get("address") or data[0].get("mac")
-                except Exception:
-                    mac = None
+            if not mac:
+                d = ble_snapshot.get_snapshot(APP_JSON).first
+                if d is not None:
+                    mac = d.get("address") or d.get("mac")
 
-            mac = mac or config.load_config().get("device_id") or "--"
+            mac = mac or config.get("device_id") or "--"
 
             # ------------------------------------------------
             # 🔄 Bluetooth-Status
@@ -188,19 +184,17 @@ class VivosunApp(App):
             print(f"⚠️ Header-Update-Fehler: {e}")
         # ------------------------------------------------
         # 🚀 Auto-Start bei Erstlauf (wenn keine config.json existiert)
+        # nur Cache-Abfrage – kein Dateisystem-Zugriff im Sekundentakt
         # ------------------------------------------------
         try:
-            cfg_path = os.path.join(os.getcwd(), "config.json")
-            if mac not in ("--", None) and not os.path.exists(cfg_path):
-                cfg = {"device_id": mac, "unit": "°C", "autostart": True}
-                with open(cfg_path, "w") as f:
-                    json.dump(cfg, f, indent=2)
+            if mac not in ("--", None) and config.is_first_run():
+                with config.transaction() as cfg:
+                    cfg["device_id"] = mac
+                    cfg["autostart"] = True
 
                 self.current_mac = mac
 
                 if hasattr(self, "chart_mgr") and self.chart_mgr:
-                    if hasattr(self.chart_mgr, "load_config"):
-                        self.chart_mgr.load_config(cfg)
                     if hasattr(self.chart_mgr, "user_start"):
                         self.chart_mgr.user_start()
 
@@ -342,6 +336,7 @@ class VivosunApp(App):
                 self.hw.stop()
         except Exception:
             pass
+        config.flush()   # verzögerten Config-Schreibvorgang nicht verlieren
 
 
 if __name__ == "__main__":
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+sample_store.py – spaltenweiser Sample-Speicher (Struct of Arrays)
+• Eine Zeile pro eingelesenem Paket: t + t_in, h_in, vpd_in, t_out, h_out, vpd_out
+• t = monotone Zeit (time.monotonic(), s) – gemeinsame x-Achse aller Kacheln,
+  unabhängig von Poll-Rate und Pausen; wird beim Anhängen nie kleiner
+• Jede Spalte ein array('d') der Länge 2·capacity, Werte doppelt abgelegt
+  (Index p und p + capacity) → Fenster immer zusammenhängend, Views ohne Kopie
+• append() O(1), Speicher konstant
+• index_at(): Binärsuche auf t → sichtbarer Ausschnitt eines Zeitfensters,
+  egal wie viel Historie gehalten wird
+• ColumnView: was Tiles, Enlarged- und Scatter-Fenster lesen – verhält sich wie
+  die frühere Liste aus (x, y)-Tupeln (len, Iteration, buf[-1], Slices)
+• window_range(): Min/Max einer Spalte im Zeitfenster über monotone Deques
+  (WindowMinMax), beim Anhängen mitgeführt → O(1) amortisiert
+• rows(): ausgerichtete Zeilen (mit Wandzeit) für Export und abgeleitete Werte
+© 2025 Dominik Rosenthal (Hackintosh1980)
+"""
+
+import time
+from array import array
+from bisect import bisect_left
+from collections import deque
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Tuple
+
+COLUMNS = ("t_in", "h_in", "vpd_in", "t_out", "h_out", "vpd_out")
+
+# Dashboard-Kachel → Spalte
+TILE_COLUMNS = {
+    "tile_t_in": "t_in", "tile_h_in": "h_in", "tile_vpd_in": "vpd_in",
+    "tile_t_out": "t_out", "tile_h_out": "h_out", "tile_vpd_out": "vpd_out",
+}
+
+NAN = float("nan")
+
+
+def mono_from_wall(ts: float) -> float:
+    """Wandzeit (time.time()) eines Samples → monotone Zeit (für t)."""
+    return time.monotonic() - max(0.0, time.time() - ts)
+
+
+# -------------------------------------------------------
+# 📈 Gleitendes Min/Max
+# -------------------------------------------------------
+class WindowMinMax:
+    """
+    Min/Max über ein nach vorne gleitendes Fenster. Zwei monotone Deques aus
+    (seq, t, wert): vorne steht immer das Extremum, jede Zeile wird höchstens
+    einmal eingefügt und einmal entfernt. NaN wird ignoriert.
+    """
+    __slots__ = ("_min", "_max")
+
+    def __init__(self):
+        self._min = deque()
+        self._max = deque()
+
+    def push(self, seq: int, t: float, v: float) -> None:
+        if v != v:
+            return
+        mn, mx = self._min, self._max
+        while mn and mn[-1][2] >= v:
+            mn.pop()
+        mn.append((seq, t, v))
+        while mx and mx[-1][2] <= v:
+            mx.pop()
+        mx.append((seq, t, v))
+
+    def evict(self, t0: float, seq0: int) -> None:
+        """Alles vor t0 bzw. vor Zeile seq0 (vom Ring überschrieben) verwerfen."""
+        for d in (self._min, self._max):
+            while d and (d[0][1] < t0 or d[0][0] < seq0):
+                d.popleft()
+
+    def result(self) -> Optional[Tuple[float, float]]:
+        return (self._min[0][2], self._max[0][2]) if self._min else None
+
+    def clear(self) -> None:
+        self._min.clear()
+        self._max.clear()
+
+
+# -------------------------------------------------------
+# 🗃️ Store
+# -------------------------------------------------------
+class SampleStore:
+    def __init__(self, capacity: int, columns: Tuple[str, ...] = COLUMNS):
+        self.columns = tuple(columns)
+        self.seq = 0          # Anzahl je angehängter Zeilen (monoton, auch über den Ring hinaus)
+        self._ranges: Dict[str, WindowMinMax] = {c: WindowMinMax() for c in self.columns}
+        self._range_t0 = float("-inf")   # Fensteranfang der letzten Abfrage
+        self._stale = set()              # Spalten, deren Deques neu aufzubauen sind
+        self._alloc(capacity)
+
+    def _alloc(self, capacity: int) -> None:
+        self._cap = max(1, int(capacity))
+        self._t = array("d", bytes(16 * self._cap))
+        self._cols: Dict[str, array] = {c: array("d", bytes(16 * self._cap))
+                                        for c in self.columns}
+        self._start = 0
+        self._len = 0
+
+    # ---------------------------------------------------
+    # ✍️ Schreiben
+    # ---------------------------------------------------
+    def append(self, t: float, values: Mapping[str, float]) -> None:
+        """Eine Zeile anhängen (t monoton, s); fehlende Spalten → NaN."""
+        cap = self._cap
+        if self._len:
+            t = max(t, self._t[self._start + self._len - 1])   # sortiert halten
+        p = self._start + self._len
+        if p >= cap:
+            p -= cap
+        self._t[p] = self._t[p + cap] = t
+        self.seq += 1
+        for name, col in self._cols.items():
+            v = values.get(name, NAN)
+            col[p] = col[p + cap] = v
+            self._ranges[name].push(self.seq, t, v)
+        if self._len < cap:
+            self._len += 1
+        else:
+            self._start = self._start + 1 if self._start + 1 < cap else 0
+
+    def set(self, column: str, i: int, value: float) -> None:
+        p = self._phys(i)
+        col = self._cols[column]
+        col[p] = col[p + self._cap] = value
+        self._stale.add(column)
+
+    def set_column(self, column: str, values) -> None:
+        """
+        Ganze Spalte ersetzen (len(values) == len(store), Buffer mit Doubles
+        oder Sequenz): zwei Slice-Kopien statt set() pro Zeile.
+        """
+        if len(values) != self._len:
+            raise ValueError("set_column: Länge passt nicht zum Store")
+        if not self._len:
+            return
+        try:
+            src = memoryview(values).cast("B").cast("d")
+        except TypeError:
+            src = memoryview(array("d", values))
+        cap, a, b = self._cap, self._start, self._start + self._len
+        col = memoryview(self._cols[column])
+        col[a:b] = src
+        # Spiegel: Teil vor cap nach hinten, Teil ab cap nach vorne
+        m = min(b, cap)
+        col[a + cap:m + cap] = col[a:m]
+        if b > cap:
+            col[0:b - cap] = col[cap:b]
+        self._stale.add(column)
+
+    def clear(self) -> None:
+        self._start = 0
+        self._len = 0
+        self.seq = 0
+        for r in self._ranges.values():
+            r.clear()
+
+    def resize(self, capacity: int) -> None:
+        """Neue Kapazität; die jüngsten Zeilen bleiben erhalten."""
+        capacity = max(1, int(capacity))
+        if capacity == self._cap:
+            return
+        keep = list(zip(self.times(), *(self.column(c) for c in self.columns)))[-capacity:]
+        seq = self.seq
+        self._alloc(capacity)
+        for row in keep:
+            self.append(row[0], dict(zip(self.columns, row[1:])))
+        self.seq = seq
+        self._stale.update(self.columns)
+
+    # ---------------------------------------------------
+    # 👀 Lesen
+    # ---------------------------------------------------
+    @property
+    def capacity(self) -> int:
+        return self._cap
+
+    def times(self) -> memoryview:
+        return memoryview(self._t)[self._start:self._start + self._len]
+
+    def index_at(self, t0: float) -> int:
+        """Index der ersten Zeile mit t ≥ t0 (O(log n))."""
+        return bisect_left(self.times(), t0)
+
+    def column(self, name: str) -> memoryview:
+        return memoryview(self._cols[name])[self._start:self._start + self._len]
+
+    def window_range(self, name: str, t0: float) -> Optional[Tuple[float, float]]:
+        """
+        (min, max) der Spalte für t ≥ t0, None ohne Werte. O(1) amortisiert,
+        solange t0 nur wächst; ein früheres t0 (größeres Fenster) oder
+        set()/resize() bauen die Deques einmal aus dem Fenster neu auf.
+        """
+        if t0 < self._range_t0:
+            self._stale.update(self.columns)
+        self._range_t0 = t0
+        r = self._ranges[name]
+        if name in self._stale:
+            self._stale.discard(name)
+            r.clear()
+            i0 = self.index_at(t0)
+            seq = self.seq - self._len + 1
+            for i, (t, v) in enumerate(zip(self.times()[i0:], self.column(name)[i0:])):
+                r.push(seq + i0 + i, t, v)
+        r.evict(t0, self.seq - self._len + 1)
+        return r.result()
+
+    def view(self, column: str) -> "ColumnView":
+        return ColumnView(self, column)
+
+    def rows(self) -> Iterator[Tuple[float, ...]]:
+        """(Wandzeit, t_in, h_in, …) in Reihenfolge – z. B. für CSV-Export."""
+        off = time.time() - time.monotonic()
+        return zip((t + off for t in self.times()), *(self.column(c) for c in self.columns))
+
+    def _phys(self, i: int) -> int:
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError("SampleStore-Index außerhalb")
+        p = self._start + i
+        return p - self._cap if p >= self._cap else p
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __repr__(self) -> str:
+        return f"SampleStore({self._len}/{self._cap}, seq={self.seq})"
+
+
+# -------------------------------------------------------
+# 🔎 Sicht auf eine Spalte als (x, y)-Reihe
+# -------------------------------------------------------
+class ColumnView:
+    __slots__ = ("store", "name")
+
+    def __init__(self, store: SampleStore, name: str):
+        self.store = store
+        self.name = name
+
+    def xs(self) -> memoryview:
+        return self.store.times()
+
+    def ys(self) -> memoryview:
+        return self.store.column(self.name)
+
+    def points(self, t0: Optional[float] = None) -> List[Tuple[float, float]]:
+        """
+        Punktliste für Plots (einmal bauen, mehrfach zuweisen); mit t0 nur der
+        sichtbare Ausschnitt ab t0 (Binärsuche statt Filtern).
+        """
+        i = self.store.index_at(t0) if t0 is not None else 0
+        return list(zip(self.xs()[i:], self.ys()[i:]))
+
+    def last(self) -> Optional[Tuple[float, float]]:
+        return self[-1] if len(self.store) else None
+
+    def range(self, t0: float) -> Optional[Tuple[float, float]]:
+        """(min, max) im Zeitfenster ab t0 – siehe SampleStore.window_range()."""
+        return self.store.window_range(self.name, t0)
+
+    def set_y(self, i: int, y: float) -> None:
+        self.store.set(self.name, i, y)
+
+    def map_y(self, fn: Callable[[float], float]) -> None:
+        """Alle Werte der Spalte umrechnen (z. B. °C ↔ °F), ein Bulk-Write."""
+        self.store.set_column(self.name, array("d", map(fn, self.ys())))
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def __bool__(self) -> bool:
+        return len(self.store) > 0
+
+    def __iter__(self) -> Iterator[Tuple[float, float]]:
+        return zip(self.xs(), self.ys())
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return list(zip(self.xs()[i], self.ys()[i]))
+        return self.xs()[i], self.ys()[i]
+
+    def __repr__(self) -> str:
+        return f"ColumnView({self.name}, {len(self.store)})"
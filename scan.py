@@ -4,6 +4,11 @@
 ble_gui_writer_mac.py – macOS GUI BLE Scanner → ble_scan.json (Dashboard-Format)
 - CoreBluetooth (pyobjc), kein Bleak nötig
 - schreibt alle 1.5s nach ~/vivosun-setup/blebridge_desktop/ble_scan.json
+- zusätzlich ble_stream.ndjson: append-only, 1 Zeile pro dekodiertem Advertisement
+- optional ble_scan.bin: fixes Binärlayout mit Generation (ble_binary.py)
+- ble_scan.gen: Generation, steigt nur bei neuen Daten → Reader sparen sich das Parsen
+- Push jedes Samples über Unix-Socket ble_push.sock (ble_push.py), Datei bleibt Fallback
+- zusätzlich Shared-Memory-Ring (ble_shm.py) für Dashboards auf demselben Host
 - ThermoBeacon/VSCTLE Decoder (0x0019, Q4.4, signed), ext_present, packet_counter
 - alive/status mit Timeout; stale => Werte -99
 - Minimal-GUI: Start/Stop + Statuszeile
@@ -11,7 +16,7 @@ ble_gui_writer_mac.py – macOS GUI BLE Scanner → ble_scan.json (Dashboard-For
 © 2025 Dominik Rosenthal (Hackintosh1980)
 """
 
-import os, sys, time, json, threading
+import os, sys, time, threading
 from datetime import datetime, timezone
 from collections import defaultdict
 
@@ -28,11 +33,23 @@ from kivy.utils import get_color_from_hex
 from Foundation import NSObject, NSRunLoop, NSDate
 import CoreBluetooth as CB
 
+from ble_stream import SampleStreamWriter, STREAM_NAME
+from ble_push import SamplePublisher, SOCK_NAME
+import ble_shm
+import ble_binary
+from ble_snapshot import GEN_NAME, write_generation, write_json_atomic
+
 # ---------------- CONFIG ----------------
 # Ausgabe immer relativ zum Projektordner
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 OUT_DIR  = os.path.join(BASE_DIR, "blebridge_desktop")
 OUT_FILE = os.path.join(OUT_DIR, "ble_scan.json")
+STREAM_FILE = os.path.join(OUT_DIR, STREAM_NAME)   # NDJSON, 1 Zeile pro Advertisement
+BIN_FILE = os.path.join(OUT_DIR, ble_binary.BIN_NAME)  # Binär-Snapshot (mmap im Dashboard)
+GEN_FILE = os.path.join(OUT_DIR, GEN_NAME)          # Generation-Sidecar
+WRITE_BINARY = True
+PUSH_SOCK = os.path.join(OUT_DIR, SOCK_NAME)        # Loopback-Push ans Dashboard
+WRITE_SHM = True                                    # Shared-Memory-Ring (gleicher Host)
 
 WRITE_INTERVAL = 1.5           # Sekunden
 TIMEOUT_MS     = 15000         # 15 s → stale
@@ -114,11 +131,16 @@ class Store:
     Hält letzten Stand je Gerät (by identifier) und alive/timeout-Status.
     Auf macOS liefert CoreBluetooth keinen klassischen MAC, daher nehmen wir p.identifier().
     """
-    def __init__(self):
+    def __init__(self, stream: SampleStreamWriter = None, publisher: SamplePublisher = None):
         self.lock = threading.Lock()
         self.last = {}                 # id → dict (dashboard-format)
         self.last_pkt_time = {}        # id → epoch ms
         self.last_seen_alive = {}      # id → bool
+        self.stream = stream           # optional: append-only Samplestream
+        self.publisher = publisher     # optional: Unix-Socket-Push
+        self.ring = None               # optional: ble_shm.SampleRing (nur CB-Thread schreibt)
+        # Generation: Startwert in ms → auch nach Neustart monoton steigend
+        self.generation = int(time.time() * 1000)
 
     def update_from_adv(self, identifier: str, name: str, rssi: int, msd: bytes):
         decoded = decode_thb_like(msd)
@@ -143,11 +165,29 @@ class Store:
         if decoded:
             entry.update(decoded)
 
+        now = time.time()
         with self.lock:
+            prev = self.last.get(identifier)
+            if prev is None or prev.get("packet_counter") != entry["packet_counter"] \
+                    or not prev.get("alive", True):
+                self.generation += 1
             self.last[identifier] = entry
-            self.last_pkt_time[identifier] = int(time.time() * 1000)
+            self.last_pkt_time[identifier] = int(now * 1000)
             self.last_seen_alive[identifier] = True
 
+        if decoded:
+            sample = {**entry, "ts": round(now, 3)}
+            ring = self.ring
+            if ring is not None:
+                try:
+                    ring.write(sample)
+                except (ValueError, TypeError):
+                    pass   # Ring wurde gerade geschlossen
+            if self.publisher is not None:
+                self.publisher.publish(sample)
+            if self.stream is not None:
+                self.stream.append(sample)
+
     def apply_timeouts(self):
         now_ms = int(time.time() * 1000)
         changed = False
@@ -159,6 +199,7 @@ class Store:
                 if alive != prev_alive:
                     self.last_seen_alive[dev_id] = alive
                     changed = True
+                    self.generation += 1
                 if not alive:
                     entry["alive"] = False
                     entry["status"] = "stale"
@@ -176,6 +217,10 @@ class Store:
         with self.lock:
             return list(self.last.values())
 
+    def snapshot_with_generation(self):
+        with self.lock:
+            return self.generation, [dict(e) for e in self.last.values()]
+
 # ================= CoreBluetooth Delegate =================
 
 class CentralDelegate(NSObject):
@@ -209,6 +254,7 @@ class WriterThread(threading.Thread):
         self.interval = max(0.5, float(interval))
         self.running = threading.Event()
         self.running.set()
+        self.written_generation = None
         os.makedirs(OUT_DIR, exist_ok=True)
 
     def run(self):
@@ -217,11 +263,15 @@ class WriterThread(threading.Thread):
                 # Zeitüberschreitungen anwenden
                 self.store.apply_timeouts()
                 # Snapshot schreiben
-                data = self.store.snapshot()
-                tmp = OUT_FILE + ".tmp"
-                with open(tmp, "w", encoding="utf-8") as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
-                os.replace(tmp, OUT_FILE)
+                generation, data = self.store.snapshot_with_generation()
+                write_json_atomic(OUT_FILE, data, indent=2)
+                # Binär-Snapshot NACH der JSON → mtime(bin) >= mtime(json)
+                if WRITE_BINARY:
+                    ble_binary.write_snapshot(BIN_FILE, data, generation)
+                # Generation zuletzt: Reader sehen sie erst, wenn die Daten liegen
+                if generation != self.written_generation:
+                    write_generation(GEN_FILE, generation)
+                    self.written_generation = generation
             except Exception as e:
                 print("write err:", e, file=sys.stderr)
             time.sleep(self.interval)
@@ -234,7 +284,8 @@ class WriterThread(threading.Thread):
 class BLEGUI(BoxLayout):
     def __init__(self, **kw):
         super().__init__(orientation="vertical", **kw)
-        self.store = Store()
+        self.publisher = SamplePublisher(PUSH_SOCK)
+        self.store = Store(stream=SampleStreamWriter(STREAM_FILE), publisher=self.publisher)
         self.delegate = None
         self.central = None
         self.scanning = False
@@ -277,7 +328,13 @@ class BLEGUI(BoxLayout):
         t = threading.Thread(target=self._scan_thread, daemon=True)
         t.start()
 
-        # Writer starten
+        # Push-Socket, Shared-Memory-Ring + Writer starten
+        self.publisher.start()
+        if WRITE_SHM and ble_shm.available() and self.store.ring is None:
+            try:
+                self.store.ring = ble_shm.SampleRing.create()
+            except Exception as e:
+                print("⚠️ Shared-Memory-Ring nicht verfügbar:", e, file=sys.stderr)
         self.writer = WriterThread(self.store, WRITE_INTERVAL)
         self.writer.start()
         self.log("Scan & Writer laufen…")
@@ -292,6 +349,10 @@ class BLEGUI(BoxLayout):
         if self.writer:
             self.writer.stop()
             self.writer = None
+        self.publisher.stop()
+        ring, self.store.ring = self.store.ring, None
+        if ring is not None:
+            ring.close()
         self.log("Gestoppt.")
 
     def _scan_thread(self):
@@ -30,6 +30,11 @@ else:
     print("⚠️ Font Awesome fehlt:", FA_PATH)
 
 
+# Chart-Zeitfenster: Anzeige → Sekunden
+SPAN_CHOICES = {"10 min": 600, "1 h": 3600, "24 h": 86400}
+SPAN_LABELS = {v: k for k, v in SPAN_CHOICES.items()}
+
+
 class SettingsScreen(Screen):
     fahrenheit_mode = BooleanProperty(False)
 
@@ -92,6 +97,16 @@ class SettingsScreen(Screen):
         stale_box.add_widget(self.stale_value_lbl)
         root.add_widget(stale_box)
 
+        # 🕒 Sichtbares Zeitfenster der Charts
+        root.add_widget(field_label("Chart-Zeitfenster:"))
+        span_val = int(cfg.get("chart_span", 600))
+        self.span_spinner = Spinner(
+            text=SPAN_LABELS.get(span_val, "10 min"), values=list(SPAN_CHOICES),
+            size_hint_y=None, height="38dp",
+            background_color=(0.1, 0.2, 0.15, 1), color=(0.9, 1, 0.9, 1)
+        )
+        root.add_widget(self.span_spinner)
+
         # Einheit °C / °F
         root.add_widget(field_label("Temperatureinheit:"))
         self.unit_btn = Button(
@@ -167,20 +182,16 @@ class SettingsScreen(Screen):
     # ---------------------------------------------------
     def save_and_exit(self):
         try:
-            cfg = config.load_config()
-            cfg["mode"] = self.mode_spinner.text
-            cfg["refresh_interval"] = round(float(self.poll_slider.value), 2)
-            cfg["stale_timeout"] = round(float(self.stale_slider.value), 1)
-            cfg["unit"] = "°F" if self.fahrenheit_mode else "°C"
-            cfg["leaf_offset"] = round(float(self.leaf_slider.value), 1)
-            cfg["theme"] = self.theme_spinner.text
-            config.save_config(cfg)
-
-            # Reload sofort aktivieren
-            from kivy.app import App
-            app = App.get_running_app()
-            if hasattr(app, "chart_mgr"):
-                app.chart_mgr.reload_config()
+            # Eine Transaktion → ein Diff-Event (ChartManager, Enlarged & Scatter
+            # übernehmen nur, was sich geändert hat) + ein atomarer Schreibvorgang
+            with config.transaction() as cfg:
+                cfg["mode"] = self.mode_spinner.text
+                cfg["refresh_interval"] = round(float(self.poll_slider.value), 2)
+                cfg["stale_timeout"] = round(float(self.stale_slider.value), 1)
+                cfg["unit"] = "°F" if self.fahrenheit_mode else "°C"
+                cfg["leaf_offset"] = round(float(self.leaf_slider.value), 1)
+                cfg["chart_span"] = SPAN_CHOICES.get(self.span_spinner.text, 600)
+                cfg["theme"] = self.theme_spinner.text
 
             # zurück ins Dashboard
             if self.manager and "dashboard" in self.manager.screen_names:
@@ -198,12 +209,11 @@ class SettingsScreen(Screen):
         print("↩️ Standardwerte wiederhergestellt:", cfg)
         self.status_label.text = "[color=#ffaa00]↩️ Standardwerte wiederhergestellt[/color]"
 
-        # 💥 Charts neu laden, damit Änderungen sichtbar sind
+        # 💥 Charts leeren (Config-Werte kamen bereits per Event an)
         try:
             from kivy.app import App
             app = App.get_running_app()
             if hasattr(app, "chart_mgr"):
-                app.chart_mgr.reload_config()
                 app.chart_mgr.reset_data()
                 print("♻️ ChartManager reset nach Default Restore.")
         except Exception as e:
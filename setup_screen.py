@@ -17,7 +17,7 @@ from kivy.utils import platform
 from kivy.core.text import LabelBase
 from kivy.graphics import Color, Rectangle
 from kivy.metrics import dp
-import json, os, config
+import os, config
 
 
 # -------------------------------------------------------
@@ -56,12 +56,10 @@ except ModuleNotFoundError:
 
 
 # -------------------------------------------------------------
-# JSON-Pfad
+# JSON-Pfad (gleicher Pfad + Snapshot-Reader wie ChartManager)
 # -------------------------------------------------------------
-if platform == "android":
-    APP_JSON = "/data/user/0/org.hackintosh1980.dashboard/files/ble_scan.json"
-else:
-    APP_JSON = os.path.join(BASE_DIR, "blebridge_desktop", "ble_scan.json")
+from dashboard_charts import APP_JSON
+import ble_snapshot
 
 
 # =============================================================
@@ -212,9 +210,7 @@ class SetupScreen(Screen):
             else:
                 print("💻 Desktop-Modus aktiv.")
                 if not os.path.exists(APP_JSON):
-                    os.makedirs(os.path.dirname(APP_JSON), exist_ok=True)
-                    with open(APP_JSON, "w") as f:
-                        f.write("[]")
+                    ble_snapshot.write_atomic(APP_JSON, "[]")
                 self.status.text = "[color=#00ffaa]💾 Desktop-Modus aktiv[/color]"
                 Clock.schedule_once(self.load_device_list, 1.5)
 
@@ -244,14 +240,11 @@ class SetupScreen(Screen):
 
                 # 2️⃣ JSON löschen / neu erstellen
                 try:
-                    if os.path.exists(APP_JSON):
-                        with open(APP_JSON, "w") as f:
-                            f.write("[]")
+                    existed = os.path.exists(APP_JSON)
+                    ble_snapshot.write_atomic(APP_JSON, "[]")
+                    if existed:
                         print(f"🧹 {APP_JSON} geleert.")
                     else:
-                        os.makedirs(os.path.dirname(APP_JSON), exist_ok=True)
-                        with open(APP_JSON, "w") as f:
-                            f.write("[]")
                         print(f"🆕 Neue Scan-Datei erstellt: {APP_JSON}")
                 except Exception as e:
                     print("⚠️ JSON-Reset-Fehler:", e)
@@ -296,24 +289,21 @@ class SetupScreen(Screen):
             # -------------------------------------------------
             # Normaler Ladevorgang
             # -------------------------------------------------
-            if not os.path.exists(APP_JSON):
+            snap = ble_snapshot.get_snapshot(APP_JSON)
+            if not snap.exists:
                 self.status.text = "[color=#ffaa00]Noch keine Bridge-Daten…[/color]"
                 return
-
-            with open(APP_JSON, "r") as f:
-                raw = f.read().strip()
-            if not raw:
+            if not snap.has_content:
                 self.status.text = "[color=#ffaa00]Warte auf Scan-Daten…[/color]"
                 return
 
-            data = json.loads(raw)
-            if not isinstance(data, list) or not data:
+            data = snap.devices
+            if not data:
                 self.status.text = "[color=#ffaa00]Suche läuft…[/color]"
                 return
 
-            # Duplikate + alte Devices filtern
-            devices = {d.get("address", ""): d.get("name", "Unbekannt")
-                       for d in data if d.get("address")}
+            # Duplikate sind in der MAC-Tabelle bereits zusammengefasst
+            devices = {mac: d.get("name", "Unbekannt") for mac, d in snap.by_mac.items()}
             self.status.text = f"[color=#00ffaa]{len(devices)} Gerät(e) gefunden[/color]"
 
             # Alte Widgets leeren & neue Buttons erzeugen
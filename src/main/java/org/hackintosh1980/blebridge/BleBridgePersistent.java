@@ -27,6 +27,8 @@ public class BleBridgePersistent {
     private static BluetoothLeScanner scanner;
     private static ScanCallback callback;
     private static File outFile;
+    private static File streamFile;
+    private static File genFile;
 
     private static final Object lock = new Object();
     private static final Map<String, JSONObject> lastSeen = new HashMap<>();
@@ -39,6 +41,12 @@ public class BleBridgePersistent {
     private static final long CHANGE_WRITE_MS = 50L;
     private static final long TIMEOUT_MS = 15000L;     // 15 s ohne Paket → stale
     private static final long CHECK_INTERVAL_MS = 2000L;
+    private static final String STREAM_NAME = "ble_stream.ndjson";
+    private static final long STREAM_MAX_BYTES = 1024L * 1024L;   // Rotation → .1
+    private static final String GEN_NAME = "ble_scan.gen";
+    // Generation: steigt nur bei neuen Daten; Startwert = Zeit → über Neustarts monoton
+    private static long generation = System.currentTimeMillis();
+    private static long writtenGeneration = -1L;
     private static long lastWrite = 0L;
 
     private static volatile String activeMac = null;
@@ -65,6 +73,8 @@ public class BleBridgePersistent {
             }
 
             outFile = new File(ctx.getFilesDir(), outFileName);
+            streamFile = new File(ctx.getFilesDir(), STREAM_NAME);
+            genFile = new File(ctx.getFilesDir(), GEN_NAME);
             Log.i(TAG, "Start → file=" + outFile.getAbsolutePath());
 
             ScanSettings settings = new ScanSettings.Builder()
@@ -114,8 +124,15 @@ public class BleBridgePersistent {
                         if (j == null) return;
 
                         synchronized (lock) {
+                            JSONObject prev = lastSeen.get(mac);
+                            if (prev == null
+                                    || prev.optInt("packet_counter", -1) != j.optInt("packet_counter", -2)
+                                    || !prev.optBoolean("alive", true)) {
+                                generation++;
+                            }
                             lastSeen.put(mac, j);
                             lastPktTime.put(mac, System.currentTimeMillis());
+                            appendStream(j);
                             long now = System.currentTimeMillis();
                             if (now - lastWrite > CHANGE_WRITE_MS) {
                                 writeSnapshot();
@@ -203,7 +220,10 @@ public class BleBridgePersistent {
                             }
                         }
 
-                        if (changed) writeSnapshot();
+                        if (changed) {
+                            generation++;
+                            writeSnapshot();
+                        }
                     }
 
                     Thread.sleep(CHECK_INTERVAL_MS);
@@ -241,11 +261,41 @@ public class BleBridgePersistent {
                 fos.flush();
             }
             tmp.renameTo(outFile);
+            // Generation zuletzt: Reader sehen sie erst, wenn die Daten liegen
+            if (generation != writtenGeneration && genFile != null) {
+                File gtmp = new File(genFile.getAbsolutePath() + ".tmp");
+                try (FileOutputStream fos = new FileOutputStream(gtmp, false)) {
+                    fos.write((generation + "\n").getBytes());
+                }
+                gtmp.renameTo(genFile);
+                writtenGeneration = generation;
+            }
         } catch (Throwable e) {
             Log.e(TAG, "writeSnapshot", e);
         }
     }
 
+    // -----------------------------------------------------------
+    // NDJSON-Stream: 1 Zeile pro Advertisement, Rotation nach Größe
+    // -----------------------------------------------------------
+    private static void appendStream(JSONObject j) {
+        try {
+            if (streamFile == null) return;
+            JSONObject line = new JSONObject(j.toString());
+            line.put("ts", System.currentTimeMillis() / 1000.0);
+            try (FileOutputStream fos = new FileOutputStream(streamFile, true)) {
+                fos.write((line.toString() + "\n").getBytes());
+            }
+            if (streamFile.length() >= STREAM_MAX_BYTES) {
+                File rotated = new File(streamFile.getAbsolutePath() + ".1");
+                if (rotated.exists()) rotated.delete();
+                streamFile.renameTo(rotated);
+            }
+        } catch (Throwable e) {
+            Log.e(TAG, "appendStream", e);
+        }
+    }
+
     // -----------------------------------------------------------
     // Decoder (ThermoBeacon-like)
     // -----------------------------------------------------------
@@ -76,18 +76,27 @@ public class BleDecoder implements Runnable {
                 outArr = trimmed;
             }
 
-            // -------- Schreib-Fix mit 12 Einrückungen --------
+            // -------- Atomar: tmp + fsync + rename (kein Löschen vorher) --------
             try {
-                if (outFile.exists()) outFile.delete();   // alte JSON löschen
                 String safeJson = outArr.toString();
                 if (!safeJson.startsWith("[")) safeJson = "[]";
-                FileOutputStream fos = new FileOutputStream(outFile, false);
-                fos.write(safeJson.getBytes());
-                fos.close();
+                File tmp = new File(outFile.getAbsolutePath() + ".tmp");
+                FileOutputStream fos = new FileOutputStream(tmp, false);
+                try {
+                    fos.write(safeJson.getBytes());
+                    fos.flush();
+                    fos.getFD().sync();
+                } finally {
+                    fos.close();
+                }
+                if (!tmp.renameTo(outFile)) {
+                    Log.e(TAG, "writeSafe: rename fehlgeschlagen");
+                    tmp.delete();
+                }
             } catch (Exception ex) {
                 Log.e(TAG, "writeSafe", ex);
             }
-            // -------------------------------------------------
+            // ---------------------------------------------------------------------
 
             Log.i(TAG, "Decoded " + outArr.length() + " → " + outFile.getName());
         } catch (Exception e) {
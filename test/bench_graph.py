@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bench_graph.py – Punkt-Transformation in Graph._redraw: alt vs. vektorisiert
+• alt    : bisherige Schleife (Division pro Punkt, list.extend)
+• liste  : PointTransformer ohne NumPy (Skala/Offset vorab, List-Comprehensions)
+• spalten: transform_xy() auf array('d')-Spalten (wie MeshLinePlot.set_xy),
+  ohne und mit NumPy (frombuffer + In-place, Puffer wiederverwendet)
+• je 1k / 10k / 100k Punkte, bester von N Läufen
+• gemessen inkl. der Listen-Kopie, die Line.points beim Setzen macht
+
+Aufruf:  python test/bench_graph.py [--sizes 1000,10000,100000] [--repeat 5]
+© 2025 Dominik Rosenthal (Hackintosh1980)
+"""
+
+import os, sys, time, random, argparse, importlib.util
+from array import array
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# transform.py direkt laden – das Paket-__init__ zieht kivy nach
+_spec = importlib.util.spec_from_file_location(
+    "graph_transform", os.path.join(ROOT, "garden", "kivy_garden", "graph", "transform.py"))
+transform = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(transform)
+
+AXES = (0.0, 1.0, 15.0, 30.0)           # xmin, xmax, ymin, ymax
+RECT = (10.0, 10.0, 780.0, 380.0)       # gx, gy, gw, gh
+
+
+def old_redraw(points, xmin, xmax, ymin, ymax, gx, gy, gw, gh):
+    pts = []
+    for px, py in points:
+        if xmax == xmin or ymax == ymin:
+            continue
+        sx = gx + ((px - xmin) / (xmax - xmin)) * gw
+        sy = gy + ((py - ymin) / (ymax - ymin)) * gh
+        pts.extend((sx, sy))
+    return pts
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    ap.add_argument("--sizes", default="1000,10000,100000")
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+    if transform.np is None:
+        print("⚠️ numpy nicht installiert – ohne sp+np")
+
+    rnd = random.Random(1)
+    for n in (int(x) for x in args.sizes.split(",")):
+        pts = [(i / n, rnd.uniform(15.0, 30.0)) for i in range(n)]
+        ref = old_redraw(pts, *AXES, *RECT)
+        cases = [("alt", lambda: old_redraw(pts, *AXES, *RECT))]
+        tf = transform.PointTransformer()
+        out = list(tf.transform(pts, *AXES, *RECT))
+        err = max(abs(a - b) for a, b in zip(out, ref))
+        assert len(out) == len(ref) and err < 1e-6, err
+        cases.append(("liste", lambda: list(tf.transform(pts, *AXES, *RECT))))
+        xs, ys = array("d", (p[0] for p in pts)), array("d", (p[1] for p in pts))
+        for name, use_np in (("spalten", False), ("sp+np", True)):
+            if use_np and transform.np is None:
+                continue
+            tfc = transform.PointTransformer(use_numpy=use_np)
+            out = list(tfc.transform_xy(xs, ys, *AXES, *RECT))
+            assert max(abs(a - b) for a, b in zip(out, ref)) < 1e-6, name
+            cases.append((name, lambda tfc=tfc: list(tfc.transform_xy(xs, ys, *AXES, *RECT))))
+
+        base = None
+        for name, fn in cases:
+            dt = best_of(fn, args.repeat)
+            base = base or dt
+            print(f"{n:7d} Punkte  {name:7s} {dt * 1000:8.2f} ms  ×{base / dt:5.1f}")
+
+
+if __name__ == "__main__":
+    main()
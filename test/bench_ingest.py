@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bench_ingest.py – JSON-Datei-Handoff vs. Shared-Memory-Ring (ble_shm.py)
+• Producer-Prozess erzeugt 10 / 100 / 1000 Advertisements pro Sekunde
+• JSON: Snapshot alle 1.5 s (wie scan.py WriterThread), Reader 50 ms, change-gated
+• SHM:  jedes Sample in den Ring, Reader drain() alle 50 ms
+• Ausgabe: zugestellte Samples, Latenz (Mittel/p95), CPU Consumer pro Tick,
+  CPU Producer pro Advertisement
+
+Aufruf:  python test/bench_ingest.py [--seconds 5] [--rates 10,100,1000]
+© 2025 Dominik Rosenthal (Hackintosh1980)
+"""
+
+import os, sys, json, time, argparse, tempfile, statistics
+import multiprocessing as mp
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import ble_shm, ble_snapshot
+
+ADDR = "AA:BB:CC:DD:EE:01"
+TICK = 0.05
+WRITE_INTERVAL = 1.5
+
+
+def _sample(i: int) -> dict:
+    return {
+        "timestamp": "", "name": "ThermoBeacon", "address": ADDR, "rssi": -60,
+        "type": "sensor", "temperature_int": 24.0 + (i % 16) / 16.0,
+        "humidity_int": 55.0, "temperature_ext": 21.5, "humidity_ext": 60.0,
+        "packet_counter": i & 0xFFFF, "ext_present": True, "alive": True,
+        "status": "active", "ts": time.time(),
+    }
+
+
+# -------------------------------------------------------
+# 📤 Producer
+# -------------------------------------------------------
+def _pace(start: float, i: int, rate: int) -> None:
+    delay = start + i / rate - time.perf_counter()
+    if delay > 0:
+        time.sleep(delay)
+
+
+def produce_json(path: str, rate: int, seconds: float, cpu) -> None:
+    t0 = time.process_time()
+    start = time.perf_counter()
+    next_write = start
+    for i in range(1, int(rate * seconds) + 1):
+        _pace(start, i, rate)
+        entry = _sample(i)
+        if time.perf_counter() >= next_write:
+            tmp = path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump([entry], f, ensure_ascii=False, indent=2)
+            os.replace(tmp, path)
+            next_write += WRITE_INTERVAL
+    cpu.value = time.process_time() - t0
+
+
+def produce_shm(name: str, rate: int, seconds: float, cpu) -> None:
+    # Gleicher Resource-Tracker wie der Elternprozess → nicht abmelden
+    ring = ble_shm.SampleRing(ble_shm.shared_memory.SharedMemory(name=name), owner=False)
+    t0 = time.process_time()
+    start = time.perf_counter()
+    for i in range(1, int(rate * seconds) + 1):
+        _pace(start, i, rate)
+        ring.write(_sample(i))
+    cpu.value = time.process_time() - t0
+    ring.close()
+
+
+# -------------------------------------------------------
+# 📥 Consumer
+# -------------------------------------------------------
+def consume(poll, proc) -> dict:
+    seen, latencies, tick_cpu = set(), [], []
+    while proc.is_alive() or not tick_cpu:
+        c0 = time.process_time()
+        samples = poll()
+        tick_cpu.append(time.process_time() - c0)
+        now = time.time()
+        for s in samples:
+            pkt = s.get("packet_counter")
+            if pkt not in seen:
+                seen.add(pkt)
+                latencies.append(now - float(s.get("ts") or now))
+        time.sleep(TICK)
+    tick_cpu.append(0.0)
+    c0 = time.process_time()
+    for s in poll():
+        if s.get("packet_counter") not in seen:
+            seen.add(s.get("packet_counter"))
+            latencies.append(time.time() - float(s.get("ts") or 0))
+    tick_cpu[-1] = time.process_time() - c0
+    return {"delivered": len(seen), "latencies": latencies, "tick_cpu": tick_cpu}
+
+
+def run(mode: str, rate: int, seconds: float, workdir: str) -> dict:
+    cpu = mp.Value("d", 0.0)
+    ring = None
+    if mode == "json":
+        path = os.path.join(workdir, "ble_scan.json")
+        reader = ble_snapshot.SnapshotReader(path)
+        last_key = [None]
+
+        def poll():
+            snap = reader.get()
+            if snap.stat_key == last_key[0]:
+                return []
+            last_key[0] = snap.stat_key
+            return list(snap.devices)
+        proc = mp.Process(target=produce_json, args=(path, rate, seconds, cpu))
+    else:
+        name = f"vivosun_bench_{os.getpid()}"
+        ring = ble_shm.SampleRing.create(name)
+        poll = ring.drain
+        proc = mp.Process(target=produce_shm, args=(name, rate, seconds, cpu))
+
+    proc.start()
+    res = consume(poll, proc)
+    proc.join()
+    if ring is not None:
+        res["lost"] = ring.lost
+        ring.close()
+    res["sent"] = int(rate * seconds)
+    res["producer_cpu"] = cpu.value
+    return res
+
+
+def _fmt(mode: str, rate: int, r: dict) -> str:
+    lat = sorted(r["latencies"]) or [0.0]
+    p95 = lat[min(len(lat) - 1, int(len(lat) * 0.95))]
+    return (f"{mode:5s} {rate:5d}/s  zugestellt {r['delivered']:6d}/{r['sent']:<6d} "
+            f"Latenz Ø {statistics.mean(lat) * 1000:7.1f} ms  p95 {p95 * 1000:7.1f} ms  "
+            f"Consumer {statistics.mean(r['tick_cpu']) * 1e6:7.1f} µs/Tick  "
+            f"Producer {r['producer_cpu'] / max(1, r['sent']) * 1e6:6.1f} µs/Adv"
+            + (f"  verloren {r['lost']}" if "lost" in r else ""))
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    ap.add_argument("--seconds", type=float, default=5.0)
+    ap.add_argument("--rates", default="10,100,1000")
+    args = ap.parse_args()
+    if not ble_shm.available():
+        print("⚠️ multiprocessing.shared_memory nicht verfügbar")
+        return
+    with tempfile.TemporaryDirectory() as workdir:
+        for rate in (int(x) for x in args.rates.split(",")):
+            for mode in ("json", "shm"):
+                print(_fmt(mode, rate, run(mode, rate, args.seconds, workdir)))
+                for f in os.listdir(workdir):
+                    os.remove(os.path.join(workdir, f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bench_vpd.py – VPD: utils.calc_vpd (skalar, Config + Rundung) vs. vpd.py
+• utils.calc_vpd   : bisheriger Weg pro Sample (Config-Lookup, Tabelle, round)
+• formel           : math.exp direkt (alte Implementierung, ohne Config)
+• vpd.vpd          : Tabelle, skalar, ohne Config
+• calc_vpd_array   : NumPy-Batch über die ganze Reihe
+• zusätzlich: max. Abweichung Tabelle ↔ exakte Formel über −40…85 °C
+
+Aufruf:  python test/bench_vpd.py [--points 10000] [--repeat 5]
+© 2025 Dominik Rosenthal (Hackintosh1980)
+"""
+
+import os, sys, math, time, random, argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import vpd
+
+
+def formula(temp_c: float, rh: float, leaf_offset: float = 0.0) -> float:
+    t_leaf = temp_c + leaf_offset
+    if rh <= 0 or rh > 100:
+        return 0.0
+    es = 0.6108 * math.exp((17.27 * t_leaf) / (t_leaf + 237.3))
+    return round(es - es * (rh / 100.0), 2)
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    ap.add_argument("--points", type=int, default=10000)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    rnd = random.Random(1)
+    temps = [rnd.uniform(10.0, 35.0) for _ in range(args.points)]
+    rhs = [rnd.uniform(30.0, 90.0) for _ in range(args.points)]
+    pairs = list(zip(temps, rhs))
+
+    cases = [("formel", lambda: [formula(t, h) for t, h in pairs]),
+             ("vpd.vpd", lambda: [vpd.vpd(t, h) for t, h in pairs])]
+    try:
+        import utils      # braucht kivy (config.py)
+        cases.insert(0, ("utils.calc_vpd", lambda: [utils.calc_vpd(t, h) for t, h in pairs]))
+    except ImportError as e:
+        print(f"⚠️ utils.calc_vpd übersprungen ({e})")
+    if vpd.available():
+        import numpy as np
+        t_arr, h_arr = np.array(temps), np.array(rhs)
+        cases.append(("calc_vpd_array", lambda: vpd.calc_vpd_array(t_arr, h_arr)))
+        cases.append(("  inkl. Konvert.", lambda: vpd.calc_vpd_array(temps, rhs)))
+    else:
+        print("⚠️ numpy nicht installiert – calc_vpd_array übersprungen")
+
+    vpd.default_table()   # Tabellenaufbau nicht mitmessen
+    base = None
+    for name, fn in cases:
+        dt = best_of(fn, args.repeat)
+        base = base or dt
+        print(f"{name:16s} {dt * 1000:8.2f} ms  {dt / args.points * 1e9:8.1f} ns/Punkt  "
+              f"×{base / dt:6.1f}")
+
+    worst = max(abs(vpd.default_table().es(t) - vpd.svp_exact(t))
+                for t in (vpd.T_MIN + i * 0.001 for i in range(125001)))
+    print(f"max |es_tab − es| (Schritt {vpd.DEFAULT_STEP} K): {worst:.2e} kPa")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+test_push_fallback.py – live_transport "auto": Ring bevorzugt, Socket als Fallback
+• Kein Ring → Samples kommen über den Push-Socket
+• Ring taucht auf und liefert → Ring-Samples, Push-Verbindung wird getrennt
+• Ring verstummt (idle) → wieder Push-Socket
+
+Aufruf:  python test/test_push_fallback.py
+© 2025 Dominik Rosenthal (Hackintosh1980)
+"""
+
+import os, sys, time, tempfile
+import multiprocessing as mp
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import ble_shm, ble_push
+
+ADDR = "AA:BB:CC:DD:EE:01"
+
+
+def _sample(pkt: int) -> dict:
+    return {"address": ADDR, "rssi": -60, "temperature_int": 24.0,
+            "humidity_int": 55.0, "packet_counter": pkt}
+
+
+def _ring_producer(name, ready, write, stop):
+    """Scanner-Ersatz in eigenem Prozess (wie im Betrieb: Ring gehört dem Scanner)."""
+    ring = ble_shm.SampleRing.create(name)
+    ready.set()
+    write.wait()
+    ring.write(_sample(2))
+    stop.wait()
+    ring.close()
+
+
+def _poll_until(sub, pred, timeout=2.0):
+    """Pollt wie _poll_push (50 ms), bis pred(samples) zutrifft."""
+    end = time.monotonic() + timeout
+    got = []
+    while time.monotonic() < end:
+        got += sub.poll()
+        if pred(got):
+            return got
+        time.sleep(0.05)
+    return got
+
+
+def main():
+    if not (ble_shm.available() and ble_push.available()):
+        print("⏭️ Shared Memory oder Unix-Sockets nicht verfügbar – übersprungen")
+        return
+    tmp = tempfile.mkdtemp()
+    pub = ble_push.SamplePublisher(os.path.join(tmp, "push.sock"))
+    pub.start()
+    name = f"vivosun_test_{os.getpid()}"
+    ready, write, stop = mp.Event(), mp.Event(), mp.Event()
+    producer = mp.Process(target=_ring_producer, args=(name, ready, write, stop), daemon=True)
+    sub = ble_shm.FallbackSubscriber(
+        ble_shm.RingSubscriber(name, recheck=0.1, idle=0.5),
+        ble_push.PushSubscriber(pub.path))
+    try:
+        # 1) kein Ring → Push
+        sub.poll()                                   # verbindet den Socket
+        time.sleep(0.1)
+        pub.publish(_sample(1))
+        got = _poll_until(sub, lambda s: s)
+        assert [s["packet_counter"] for s in got] == [1], got
+        assert sub.fallback.connected and not sub.primary.connected
+        print("✅ ohne Ring: Push-Fallback liefert")
+
+        # 2) Ring taucht auf → Ring, Push getrennt
+        producer.start()
+        ready.wait(5.0)
+        _poll_until(sub, lambda s: sub.primary.ring is not None)
+        write.set()
+        got = _poll_until(sub, lambda s: any(x["packet_counter"] == 2 for x in s))
+        assert any(s["packet_counter"] == 2 for s in got), got
+        assert sub.primary.connected and not sub.fallback.connected
+        pub.publish(_sample(3))
+        time.sleep(0.1)
+        assert sub.poll() == [], "Push darf bei aktivem Ring nicht mitlaufen"
+        print("✅ Ring aktiv: Ring liefert, Push getrennt")
+
+        # 3) Ring verstummt → zurück auf Push
+        time.sleep(0.6)
+        got = _poll_until(sub, lambda s: sub.fallback.connected, timeout=5.0)
+        assert sub.fallback.connected and not sub.primary.connected
+        time.sleep(0.1)
+        pub.publish(_sample(4))
+        got = _poll_until(sub, lambda s: any(x["packet_counter"] == 4 for x in s))
+        assert any(s["packet_counter"] == 4 for s in got), got
+        print("✅ Ring stale: Push-Fallback übernimmt wieder")
+    finally:
+        sub.close()
+        pub.stop()
+        stop.set()
+        if producer.is_alive():
+            producer.join(5.0)
+
+
+if __name__ == "__main__":
+    main()
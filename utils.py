@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-import math
 import config
+import vpd
 
 # -------------------------------------------------------
 # 🌿 VPD-Berechnung mit Leaf-Offset
@@ -10,24 +10,16 @@ def calc_vpd(temp_c: float, rh: float) -> float:
     """
     Berechnet den VPD (kPa) mit Leaf-Offset aus config.json.
     Positive Werte = Blatt wärmer, negative Werte = Blatt kühler.
+    es kommt aus der Lookup-Tabelle in vpd.py; für Reihen ohne Config-Zugriff
+    vpd.calc_vpd_array() verwenden.
     """
     try:
-        cfg = config.load_config() or {}
-        leaf_offset = float(cfg.get("leaf_offset", 0.0))
+        leaf_offset = float(config.get("leaf_offset", 0.0))
     except Exception:
         leaf_offset = 0.0
 
     # Blatt-Temperatur mit Offset (z. B. -2.0 = Blatt 2°C kühler)
-    t_leaf = temp_c + leaf_offset
-
-    if rh <= 0 or rh > 100:
-        return 0.0
-
-    es = 0.6108 * math.exp((17.27 * t_leaf) / (t_leaf + 237.3))
-    ea = es * (rh / 100.0)
-    vpd = es - ea
-
-    return round(vpd, 2)
+    return round(vpd.vpd(temp_c, rh, leaf_offset), 2)
 
 
 # -------------------------------------------------------
@@ -55,8 +47,7 @@ def convert_unit(value):
     Beispiel: Dashboard & Charts zeigen Werte direkt in der eingestellten Einheit.
     """
     try:
-        cfg = config.load_config()
-        unit = cfg.get("unit", "°C")
+        unit = config.get("unit", "°C")
         if "F" in unit.upper():
             return convert_temperature(value, "F")
     except Exception:
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+vpd.py – VPD-Engine: Sättigungsdampfdruck per Lookup-Tabelle
+• Magnus/Tetens-Formel (wie bisher utils.calc_vpd), vorberechnet über
+  T_MIN…T_MAX (−40…85 °C) mit wählbarer Schrittweite, linear interpoliert
+• Außerhalb des Bereichs: exakte Formel (kein Clamping)
+• vpd(): skalar, ohne Config-Zugriff und ohne Rundung
+• calc_vpd_array(): NumPy-Batch für Verlauf, Scatter und Export (optional)
+
+Fehlerschranke der linearen Interpolation (|es_tab − es| ≤ h²/8 · max|es''|,
+max|es''| ≈ 0.076 kPa/K² bei 85 °C), gemessen über den ganzen Bereich:
+    Schritt 0.05 K → ≤ 2.4e-5 kPa
+    Schritt 0.1  K → ≤ 9.5e-5 kPa   (Standard, rel. ≤ 1.3e-5)
+    Schritt 0.25 K → ≤ 5.9e-4 kPa
+    Schritt 0.5  K → ≤ 2.4e-3 kPa
+    Schritt 1.0  K → ≤ 9.4e-3 kPa
+VPD = es · (1 − RH/100) → der VPD-Fehler ist nie größer als der es-Fehler.
+Beim Standard liegt er damit weit unter der Anzeige-Rundung (0.01 kPa).
+© 2025 Dominik Rosenthal (Hackintosh1980)
+"""
+
+import math
+from array import array
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError:          # z. B. Android-Build ohne numpy
+    np = None
+
+T_MIN = -40.0
+T_MAX = 85.0
+DEFAULT_STEP = 0.1
+
+_A, _B, _C = 0.6108, 17.27, 237.3
+
+
+def available() -> bool:
+    """True, wenn die NumPy-Batch-API nutzbar ist."""
+    return np is not None
+
+
+def svp_exact(t_c: float) -> float:
+    """Sättigungsdampfdruck (kPa) nach Magnus/Tetens – Referenz."""
+    return _A * math.exp((_B * t_c) / (t_c + _C))
+
+
+# -------------------------------------------------------
+# 📋 Lookup-Tabelle
+# -------------------------------------------------------
+class SVPTable:
+    """Vorberechnete es-Werte auf einem festen Raster, linear interpoliert."""
+
+    def __init__(self, step: float = DEFAULT_STEP,
+                 t_min: float = T_MIN, t_max: float = T_MAX):
+        if step <= 0 or t_max <= t_min:
+            raise ValueError("ungültiger Tabellenbereich")
+        self.step = float(step)
+        self.t_min = float(t_min)
+        self.n = int(math.ceil((t_max - t_min) / self.step))
+        self.t_max = self.t_min + self.n * self.step
+        self._inv = 1.0 / self.step
+        self.table = array("d", (svp_exact(self.t_min + i * self.step)
+                                 for i in range(self.n + 1)))
+        self._grid = None   # NumPy-Raster, erst bei Bedarf
+
+    def es(self, t_c: float) -> float:
+        x = (t_c - self.t_min) * self._inv
+        if not 0.0 <= x <= self.n:      # außerhalb (oder NaN)
+            return svp_exact(t_c)
+        i = int(x)
+        if i == self.n:
+            return self.table[i]
+        lo = self.table[i]
+        return lo + (self.table[i + 1] - lo) * (x - i)
+
+    def es_array(self, t_c):
+        """es für ein NumPy-Array (np.interp, außerhalb exakte Formel)."""
+        if self._grid is None:
+            self._grid = (np.linspace(self.t_min, self.t_max, self.n + 1),
+                          np.frombuffer(self.table, dtype=np.float64))
+        grid, values = self._grid
+        es = np.interp(t_c, grid, values)
+        out = (t_c < self.t_min) | (t_c > self.t_max)
+        if out.any():
+            t = t_c[out]
+            es[out] = _A * np.exp((_B * t) / (t + _C))
+        return es
+
+
+_default: Optional[SVPTable] = None
+
+
+def default_table() -> SVPTable:
+    global _default
+    if _default is None:
+        _default = SVPTable()
+    return _default
+
+
+# -------------------------------------------------------
+# 🌿 VPD
+# -------------------------------------------------------
+def vpd(temp_c: float, rh: float, leaf_offset: float = 0.0) -> float:
+    """VPD (kPa) über die Tabelle; RH außerhalb (0, 100] → 0.0."""
+    if rh <= 0 or rh > 100:
+        return 0.0
+    es = default_table().es(temp_c + leaf_offset)
+    return es - es * (rh / 100.0)
+
+
+def calc_vpd_array(temps, rhs, leaf_offset: float = 0.0, table: Optional[SVPTable] = None):
+    """
+    VPD (kPa) für ganze Reihen, ohne Config-Zugriff und ohne Rundung.
+    temps/rhs: Sequenzen oder Arrays gleicher Länge (°C, %); RH außerhalb
+    (0, 100] oder NaN → 0.0, wie beim skalaren calc_vpd.
+    """
+    if np is None:
+        raise RuntimeError("calc_vpd_array benötigt numpy")
+    t = np.asarray(temps, dtype=np.float64) + float(leaf_offset)
+    rh = np.asarray(rhs, dtype=np.float64)
+    es = (table or default_table()).es_array(t)
+    vpd = es * (1.0 - rh / 100.0)
+    valid = (rh > 0) & (rh <= 100)
+    return np.where(valid, vpd, 0.0)
@@ -5,7 +5,7 @@ vpd_scatter_window_live.py – Live-Version 🌿 v3.9
 Einheitlich mit Dashboard (°C/°F) + Sensor-Erkennung.
 © 2025 Dominik Rosenthal (Hackintosh1980)
 """
-import os, json
+import os
 from kivy.app import App
 from kivy.clock import Clock
 from kivy.uix.floatlayout import FloatLayout
@@ -18,7 +18,7 @@ from kivy.graphics import Color, Ellipse, Rectangle
 from kivy.core.text import LabelBase
 from kivy.metrics import dp
 from utils import calc_vpd, convert_temperature
-import config
+import config, ble_snapshot
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 FA_PATH = os.path.join(BASE_DIR, "assets", "fonts", "fa-solid-900.ttf")
@@ -32,6 +32,8 @@ class VPDScatterWindow(FloatLayout):
         super().__init__(**kwargs)
         self.paused = False
         self.ext_present = True  # dynamisch
+        self._unit = "°F" if config.get("unit", "°C") == "°F" else "°C"
+        config.subscribe(self._on_unit_changed, ["unit"])
         self._build_ui()
         self._bind_json_poll()
 
@@ -78,6 +80,7 @@ class VPDScatterWindow(FloatLayout):
             background_color=(0, 0, 0, 0), draw_border=False,
             size_hint=(0.7, 0.75), pos_hint={"x": 0.05, "y": 0.15},
         )
+        self._apply_unit_axis()
         self.add_widget(self.graph)
 
         with self.graph.canvas:
@@ -137,20 +140,28 @@ class VPDScatterWindow(FloatLayout):
     # Einheiten aus config.json
     # ---------------------------------------------------
     def _get_unit_symbol(self):
-        try:
-            cfg = config.load_config()
-            return "°F" if cfg.get("unit", "°C") == "°F" else "°C"
-        except Exception:
-            return "°C"
+        return self._unit
+
+    def _on_unit_changed(self, changes):
+        """Config-Event: Achsenbeschriftung + Temperaturbereich umstellen."""
+        self._unit = "°F" if changes["unit"][1] == "°F" else "°C"
+        self._apply_unit_axis()
+        self._update_from_json(0)
+
+    def _apply_unit_axis(self):
+        self.graph.xlabel = f"Temp ({self._unit})"
+        if self._unit == "°F":
+            self.graph.xmin, self.graph.xmax = 32, 95
+        else:
+            self.graph.xmin, self.graph.xmax = 0, 35
 
     # ---------------------------------------------------
     # JSON Update
     # ---------------------------------------------------
     def _bind_json_poll(self):
-        if os.name == "posix" and not os.getenv("ANDROID_PRIVATE"):
-            self.json_path = "/home/domi/vivosun-setup/blebridge_desktop/ble_scan.json"
-        else:
-            self.json_path = os.path.join(os.getenv("ANDROID_PRIVATE", "."), "ble_scan.json")
+        from dashboard_charts import APP_JSON
+        self.json_path = APP_JSON
+        self._snapshots = ble_snapshot.get_reader(APP_JSON)
         Clock.schedule_interval(self._update_from_json, 1.0)
 
     # ---------------------------------------------------
@@ -212,17 +223,9 @@ class VPDScatterWindow(FloatLayout):
                 return  # ✅ fertig – keine JSON mehr nötig
 
             # 🌿 2️⃣ Fallback: JSON direkt lesen (wenn kein ChartManager aktiv)
-            if not os.path.exists(self.json_path):
-                return self.set_led(False)
-            with open(self.json_path, "r") as f:
-                content = f.read().strip()
-            if not content:
-                return self.set_led(False)
-
-            data = json.loads(content)
-            if not data or not isinstance(data, list):
+            d = self._snapshots.get().first
+            if d is None:
                 return self.set_led(False)
-            d = data[0]
 
             # --- Sensorwerte ---
             t_int, h_int = float(d.get("temperature_int", 0.0)), float(d.get("humidity_int", 0.0))